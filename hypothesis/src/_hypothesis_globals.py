@@ -26,3 +26,9 @@ hole."""
 
 if os.environ.get("HYPOTHESIS_EXTEND_INITIALIZATION"):
     in_initialization += 1
+
+shared_database = None
+"""If not None, the ``(address, authkey)`` of the database served by the
+pytest-xdist controller process, which our pytest plugin sets in each worker.
+The default database then connects to it, rather than opening the database
+directory in every worker."""
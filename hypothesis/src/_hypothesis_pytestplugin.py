@@ -51,6 +51,7 @@ _ALL_OPTIONS = [
 ]
 STATS_KEY = "_hypothesis_stats"
 FAILING_EXAMPLES_KEY = "_hypothesis_failing_examples"
+SHARED_DATABASE_KEY = "_hypothesis_shared_database"
 
 
 class StoringReporter:
@@ -154,6 +155,11 @@ else:
 
     def pytest_configure(config):
         config.addinivalue_line("markers", "hypothesis: Tests which use hypothesis.")
+        workerinput = getattr(config, "workerinput", {})
+        if SHARED_DATABASE_KEY in workerinput:
+            # We're a pytest-xdist worker; see pytest_configure_node.
+            address, authkey = workerinput[SHARED_DATABASE_KEY]
+            _hypothesis_globals.shared_database = (address, bytes.fromhex(authkey))
         if not _any_hypothesis_option(config):
             return
         from hypothesis import Phase, Verbosity, core, settings
@@ -188,6 +194,36 @@ else:
                 pass
             core.global_force_seed = seed
 
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(node):
+        # A pytest-xdist hook, called in the controller process as it starts
+        # each worker.  We serve the default database from the controller, so
+        # that the workers share one view of it and one write path, rather than
+        # racing on the same files.  This only happens if Hypothesis has
+        # already been imported here, e.g. by a conftest.py, so that we never
+        # import it in a controller which wouldn't otherwise need it.
+        if "hypothesis" not in sys.modules:
+            return
+        # We serve on a local socket, so workers on other machines (e.g. with
+        # `--tx ssh=...` or `--tx socket=...`) couldn't connect to it.  They
+        # open the database themselves instead.
+        spec = getattr(getattr(node, "gateway", None), "spec", None)
+        if not getattr(spec, "popen", False) or getattr(spec, "via", None):
+            return
+        server = getattr(node.config, "_hypothesis_database_server", None)
+        if server is None:
+            from hypothesis.database import _DatabaseServer, _db_for_path
+            from hypothesis.utils.conventions import not_set
+
+            server = _DatabaseServer(_db_for_path(not_set))
+            node.config._hypothesis_database_server = server
+        node.workerinput[SHARED_DATABASE_KEY] = (server.address, server.authkey.hex())
+
+    def pytest_unconfigure(config):
+        server = getattr(config, "_hypothesis_database_server", None)
+        if server is not None:
+            server.close()
+
     @pytest.hookimpl(hookwrapper=True)
     def pytest_runtest_call(item):
         __tracebackhide__ = True
@@ -401,11 +437,12 @@ else:
                 if examples:
                     failing_examples.append(json.loads(examples))
 
-        from hypothesis.internal.observability import _WROTE_TO
+        from hypothesis.internal.observability import _WROTE_TO, _file_writer
 
         if _WROTE_TO:  # pragma: no cover
             # Observability output is only produced by tests which run pytest
             # in a subprocess, where we don't measure coverage.
+            _file_writer.flush()
             terminalreporter.section("Hypothesis")
             for fname in sorted(_WROTE_TO):
                 terminalreporter.write_line(f"observations written to {fname}")
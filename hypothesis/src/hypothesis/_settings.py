@@ -57,6 +57,8 @@ all_settings: list[str] = [
     "deadline",
     "print_blob",
     "backend",
+    "workers",
+    "shrink_time_budget",
 ]
 
 
@@ -521,6 +523,41 @@ def _validate_deadline(
     raise invalid_deadline_error
 
 
+def _validate_workers(workers: int) -> int:
+    check_type(int, workers, name="workers")
+    if workers < 1:
+        raise InvalidArgument(f"workers={workers!r} must be at least one.")
+    return workers
+
+
+def _validate_shrink_time_budget(
+    budget: int | float | datetime.timedelta | None,
+) -> datetime.timedelta | None:
+    if budget is None:
+        return budget
+    if isinstance(budget, (int, float)) and not isinstance(budget, bool):
+        try:
+            budget = datetime.timedelta(seconds=budget)
+        except OverflowError:
+            raise InvalidArgument(
+                f"shrink_time_budget={budget!r} is invalid, because it is too large "
+                "to represent as a timedelta. Use shrink_time_budget=None to use "
+                "the default limit."
+            ) from None
+    if not isinstance(budget, datetime.timedelta):
+        raise InvalidArgument(
+            f"shrink_time_budget={budget!r} (type {type(budget).__name__}) must be "
+            "a timedelta object, an integer or float number of seconds, or None "
+            "to use the default limit."
+        )
+    if budget <= datetime.timedelta(0):
+        raise InvalidArgument(
+            f"shrink_time_budget={budget!r} is invalid, because it must be "
+            "positive. Remove Phase.shrink from phases to disable shrinking."
+        )
+    return budget
+
+
 def _validate_backend(backend: str) -> str:
     if backend not in AVAILABLE_PROVIDERS:
         if backend == "crosshair":  # pragma: no cover
@@ -573,7 +610,8 @@ class settings(metaclass=settingsMeta):
     |~settings.max_examples|, |~settings.derandomize|, |~settings.database|,
     |~settings.verbosity|, |~settings.phases|, |~settings.stateful_step_count|,
     |~settings.report_multiple_bugs|, |~settings.suppress_health_check|,
-    |~settings.deadline|, |~settings.print_blob|, and |~settings.backend|.
+    |~settings.deadline|, |~settings.print_blob|, |~settings.backend|,
+    |~settings.workers|, and |~settings.shrink_time_budget|.
 
     A settings object can be applied as a decorator to a test function, in which
     case that test function will use those settings. A test may only have one
@@ -630,6 +668,8 @@ class settings(metaclass=settingsMeta):
             deadline=duration(milliseconds=200),
             print_blob=False,
             backend="hypothesis",
+            workers=1,
+            shrink_time_budget=None,
         )
 
         ci = settings.register_profile(
@@ -676,6 +716,8 @@ class settings(metaclass=settingsMeta):
         deadline: int | float | datetime.timedelta | None = not_set,  # type: ignore
         print_blob: bool = not_set,  # type: ignore
         backend: str = not_set,  # type: ignore
+        workers: int = not_set,  # type: ignore
+        shrink_time_budget: int | float | datetime.timedelta | None = not_set,  # type: ignore
     ) -> None:
         self._in_definition = True
 
@@ -748,6 +790,16 @@ class settings(metaclass=settingsMeta):
             if backend is not_set  # type: ignore
             else _validate_backend(backend)
         )
+        self._workers = (
+            self._fallback.workers  # type: ignore
+            if workers is not_set  # type: ignore
+            else _validate_workers(workers)
+        )
+        self._shrink_time_budget = (
+            self._fallback.shrink_time_budget  # type: ignore
+            if shrink_time_budget is not_set  # type: ignore
+            else _validate_shrink_time_budget(shrink_time_budget)
+        )
 
         self._in_definition = False
 
@@ -1046,6 +1098,54 @@ class settings(metaclass=settingsMeta):
         """
         return self._backend
 
+    @property
+    def workers(self):
+        """
+        .. warning::
+
+            EXPERIMENTAL AND UNSTABLE - this setting may change or be removed
+            without a deprecation period.
+
+        The number of processes to run generated |test cases| in. If greater
+        than one, Hypothesis forks this many worker processes to execute test
+        cases during the |Phase.generate| phase, while the original process
+        decides which test cases to try and keeps track of the results.
+
+        During the |Phase.shrink| phase, workers speculatively run the test
+        cases that the shrinker is about to try, in batches. This gives the
+        same result as shrinking in a single process, but can take much less
+        time for slow tests.
+
+        Failing test cases found by a worker are re-run (and then shrunk) in the
+        original process, so side effects of your test function which persist
+        between test cases - such as appending to a global list - will not be
+        visible for test cases run in workers.
+
+        Worker processes require the ``fork`` start method, and are not used if
+        other threads are running, if observability is enabled, or with an
+        alternative |~settings.backend|. In those cases, Hypothesis silently
+        runs every test case in the original process.
+
+        The default is ``1``, which runs every test case in the original process.
+        """
+        return self._workers
+
+    @property
+    def shrink_time_budget(self):
+        """
+        The maximum total time to spend shrinking the |failing test cases| found
+        by a test, in seconds. You can pass an integer, float, or timedelta.
+
+        Within this budget, Hypothesis stops running a shrink pass once it has
+        used more than its share of the budget while succeeding less often than
+        the other passes. This lets slow tests finish shrinking sooner, with
+        slightly less minimal failing test cases.
+
+        The default is ``None``, which means that Hypothesis runs every shrink
+        pass to completion and stops shrinking after |MAX_SHRINKING_SECONDS|.
+        """
+        return self._shrink_time_budget
+
     def __call__(self, test: T) -> T:
         """Make the settings object (self) an attribute of the test.
 
@@ -1218,6 +1318,8 @@ default = settings(
     deadline=duration(milliseconds=200),
     print_blob=False,
     backend="hypothesis",
+    workers=1,
+    shrink_time_budget=None,
 )
 settings.register_profile("default", default)
 settings.load_profile("default")
@@ -35,6 +35,7 @@ from random import Random
 from threading import Lock
 from types import EllipsisType
 from typing import (
+    TYPE_CHECKING,
     Any,
     BinaryIO,
     TypeVar,
@@ -107,6 +108,7 @@ from hypothesis.internal.healthcheck import fail_health_check
 from hypothesis.internal.observability import (
     InfoObservation,
     InfoObservationType,
+    ObservationSummary,
     deliver_observation,
     make_testcase,
     observability_enabled,
@@ -149,6 +151,9 @@ from hypothesis.utils.threading import ThreadLocal
 from hypothesis.vendor.pretty import RepresentationPrinter
 from hypothesis.version import __version__
 
+if TYPE_CHECKING:
+    import asyncio
+
 TestFunc = TypeVar("TestFunc", bound=Callable)
 
 
@@ -937,6 +942,13 @@ class StateForActualGivenExecution:
         self.thread_overlap = {} if thread_overlap is None else thread_overlap
 
         self.test_runner = get_executor(stuff.selfy)
+        # Without a custom executor, we run coroutine functions ourselves, on an
+        # event loop which is created for the first test case and then reused
+        # until close().
+        self._native_async = (
+            inspect.iscoroutinefunction(test) and self.test_runner is default_executor
+        )
+        self._event_loop: asyncio.AbstractEventLoop | None = None
         self.print_given_args = getattr(
             wrapped_test, "_hypothesis_internal_print_given_args", True
         )
@@ -959,9 +971,82 @@ class StateForActualGivenExecution:
         self._start_timestamp = time.time()
         self._string_repr = ""
         self._timing_features: dict[str, float] = {}
+        # In the aggregated observability mode (see OBSERVABILITY_SAMPLE), the
+        # summary of this run, and whether the current test case is one of the
+        # sample we observe in full.
+        self._observation_summary: ObservationSummary | None = None
+        self._observe_test_case = True
 
         self._runner: ConjectureRunner | None = None
 
+    def _run_coroutine(
+        self,
+        coro: Coroutine,
+        *,
+        deadline: datetime.timedelta | None = None,
+        untimed: Callable[[], float] = lambda: 0.0,
+    ) -> Any:
+        """Run ``coro`` to completion on this test function's event loop.
+
+        If ``deadline`` is given, the coroutine is cancelled once it has run
+        for that long by the loop's clock, and we raise DeadlineExceeded.
+        ``untimed`` returns the number of seconds since we started which
+        don't count towards the deadline, such as time spent drawing data.
+        """
+        import asyncio
+
+        if self._event_loop is None:
+            self._event_loop = asyncio.new_event_loop()
+        loop = self._event_loop
+        task = loop.create_task(coro)
+        if deadline is None:
+            return loop.run_until_complete(task)
+
+        start = loop.time()
+        timed_out = False
+        handle: asyncio.TimerHandle
+
+        def check_deadline() -> None:
+            nonlocal handle, timed_out
+            # Like the synchronous deadline check, we don't count untimed
+            # seconds, so push the deadline back by that much and check again.
+            deadline_at = start + deadline.total_seconds() + untimed()
+            if loop.time() < deadline_at:
+                handle = loop.call_at(deadline_at, check_deadline)
+            else:
+                timed_out = True
+                task.cancel()
+
+        handle = loop.call_at(start + deadline.total_seconds(), check_deadline)
+        try:
+            return loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            if not timed_out:
+                raise
+            raise DeadlineExceeded(
+                datetime.timedelta(seconds=loop.time() - start - untimed()),
+                self.settings.deadline,
+            ) from None
+        finally:
+            handle.cancel()
+
+    def close(self) -> None:
+        """Close the event loop used for async tests, if we created one."""
+        if (loop := self._event_loop) is None:
+            return
+        self._event_loop = None
+        import asyncio
+
+        try:
+            # As in asyncio.run(), cancel anything left running by the test.
+            if tasks := asyncio.all_tasks(loop):
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
     @property
     def test_identifier(self) -> str:
         return getattr(
@@ -971,8 +1056,17 @@ class StateForActualGivenExecution:
     def _should_trace(self):
         # NOTE: we explicitly support monkeypatching this. Keep the namespace
         # access intact.
+        _trace_corpus = self._runner is not None and self._runner.collecting_coverage
+        return self._should_explain_traces() or _trace_corpus
+
+    def _should_explain_traces(self):
+        # Whether the traces we take should be recorded for the explain phase.
+        # Traces taken only to guide generation (see COVERAGE_GUIDED) are not,
+        # as they would change what it reports.
         _trace_obs = (
-            observability_enabled() and observability.OBSERVABILITY_COLLECT_COVERAGE
+            observability_enabled()
+            and observability.OBSERVABILITY_COLLECT_COVERAGE
+            and self._observe_test_case
         )
         _trace_failure = (
             self.failed_normally
@@ -1010,7 +1104,10 @@ class StateForActualGivenExecution:
             @proxies(self.test)
             def test(*args, **kwargs):
                 with unwrap_markers_from_group(), ensure_free_stackframes():
-                    return self.test(*args, **kwargs)
+                    result = self.test(*args, **kwargs)
+                    if self._native_async:
+                        result = self._run_coroutine(result)
+                    return result
 
         else:
 
@@ -1019,10 +1116,32 @@ class StateForActualGivenExecution:
                 arg_drawtime = math.fsum(data.draw_times.values())
                 arg_stateful = math.fsum(data._stateful_run_times.values())
                 arg_gctime = gc_cumulative_time()
+                current_deadline = self.settings.deadline
+                # we disable the deadline check under concurrent threads, since
+                # cpython may switch away from a thread for arbitrarily long.
+                if self.thread_overlap.get(threading.get_ident(), False):
+                    current_deadline = None
+                elif current_deadline is not None and not is_final:
+                    current_deadline = (current_deadline // 4) * 5
+
+                def untimed() -> float:
+                    return (
+                        math.fsum(data.draw_times.values())
+                        - arg_drawtime
+                        + math.fsum(data._stateful_run_times.values())
+                        - arg_stateful
+                        + gc_cumulative_time()
+                        - arg_gctime
+                    )
+
                 with unwrap_markers_from_group(), ensure_free_stackframes():
                     start = time.perf_counter()
                     try:
                         result = self.test(*args, **kwargs)
+                        if self._native_async:
+                            result = self._run_coroutine(
+                                result, deadline=current_deadline, untimed=untimed
+                            )
                     finally:
                         finish = time.perf_counter()
                         in_drawtime = math.fsum(data.draw_times.values()) - arg_drawtime
@@ -1039,17 +1158,12 @@ class StateForActualGivenExecution:
                         }
 
                 if (
-                    (current_deadline := self.settings.deadline) is not None
-                    # we disable the deadline check under concurrent threads, since
-                    # cpython may switch away from a thread for arbitrarily long.
-                    and not self.thread_overlap.get(threading.get_ident(), False)
+                    current_deadline is not None
+                    and runtime >= current_deadline.total_seconds()
                 ):
-                    if not is_final:
-                        current_deadline = (current_deadline // 4) * 5
-                    if runtime >= current_deadline.total_seconds():
-                        raise DeadlineExceeded(
-                            datetime.timedelta(seconds=runtime), self.settings.deadline
-                        )
+                    raise DeadlineExceeded(
+                        datetime.timedelta(seconds=runtime), self.settings.deadline
+                    )
                 return result
 
         def run(data: ConjectureData) -> None:
@@ -1096,7 +1210,7 @@ class StateForActualGivenExecution:
                     )
                 report(printer.getvalue())
 
-            if observability_enabled():
+            if observability_enabled() and self._observe_test_case:
                 printer = RepresentationPrinter(context=context)
                 printer.repr_call(
                     test.__name__,
@@ -1130,7 +1244,7 @@ class StateForActualGivenExecution:
                 if data._stateful_repr_parts is not None:
                     self._string_repr = "\n".join(data._stateful_repr_parts)
 
-                if observability_enabled():
+                if observability_enabled() and self._observe_test_case:
                     printer = RepresentationPrinter(context=context)
                     for name, value in data._observability_args.items():
                         if name.startswith("generate:Draw "):
@@ -1217,14 +1331,23 @@ class StateForActualGivenExecution:
         """
         trace: Trace = frozenset()
         backend_cannot_proceed = False
+        if self._observation_summary is not None:
+            self._observe_test_case = self._observation_summary.should_sample()
+            data._observe_arguments = self._observe_test_case
+        explain_trace = self._should_explain_traces()
         try:
             with Tracer(should_trace=self._should_trace()) as tracer:
                 try:
                     result = self.execute_once(data)
-                    if data.status == Status.VALID and tracer.branches:
+                    if (
+                        explain_trace
+                        and data.status == Status.VALID
+                        and tracer.branches
+                    ):
                         self.explain_traces[None].add(tracer.branches)
                 finally:
                     trace = tracer.branches
+                    data.branches = trace
             if result is not None:
                 fail_health_check(
                     self.settings,
@@ -1313,7 +1436,7 @@ class StateForActualGivenExecution:
                 self.failed_normally = True
 
                 interesting_origin = InterestingOrigin.from_exception(e)
-                if trace:
+                if explain_trace and trace:
                     self.explain_traces[interesting_origin].add(trace)
                 if interesting_origin.exc_type == DeadlineExceeded:
                     self.failed_due_to_deadline = True
@@ -1336,7 +1459,14 @@ class StateForActualGivenExecution:
             except BackendCannotProceed:
                 data.events = {}
 
-            if observability_enabled() and not backend_cannot_proceed:
+            if (
+                observability_enabled()
+                and not backend_cannot_proceed
+                and not self._observe_test_case
+            ):
+                assert self._observation_summary is not None
+                self._observation_summary.record(data, timing=self._timing_features)
+            elif observability_enabled() and not backend_cannot_proceed:
                 if runner := getattr(self, "_runner", None):
                     phase = runner._current_phase
                 else:  # pragma: no cover  # in case of messing with internals
@@ -1378,13 +1508,22 @@ class StateForActualGivenExecution:
                     phase=phase,
                     backend_metadata=data.provider.observe_test_case(),
                 )
-                deliver_observation(tc)
+                if self._observation_summary is not None:
+                    self._observation_summary.record(
+                        data, timing=self._timing_features, observation=tc
+                    )
+                else:
+                    deliver_observation(tc)
 
+            # info messages are cheap and rare, so we deliver them even for test
+            # cases outside the sample.
+            if observability_enabled() and not backend_cannot_proceed:
                 for msg in data.provider.observe_information_messages(
                     lifetime="test_case"
                 ):
                     self._deliver_information_message(**msg)
             self._timing_features = {}
+            self._observe_test_case = True
 
     def _deliver_information_message(
         self, *, type: InfoObservationType, title: str, content: str | dict
@@ -1421,16 +1560,38 @@ class StateForActualGivenExecution:
             thread_overlap=self.thread_overlap,
         )
         self._runner = runner
+        if observability_enabled() and observability.OBSERVABILITY_SAMPLE is not None:
+            self._observation_summary = ObservationSummary(
+                observability.OBSERVABILITY_SAMPLE
+            )
         # Use the Conjecture engine to run the test function many times
         # on different inputs.
         runner.run()
         note_statistics(runner.statistics)
+        if (summary := self._observation_summary) is not None:
+            # Any failing examples we replay below are observed in full.
+            self._observation_summary = None
+            for tc in summary.sample:
+                deliver_observation(tc)
+            self._deliver_information_message(
+                type="info",
+                title="Hypothesis Test Case Summary",
+                content=summary.to_json(),
+            )
         if observability_enabled():
             self._deliver_information_message(
                 type="info",
                 title="Hypothesis Statistics",
                 content=describe_statistics(runner.statistics),
             )
+            if shrink_passes := runner.statistics.get("shrink-phase", {}).get(
+                "shrink-passes"
+            ):
+                self._deliver_information_message(
+                    type="info",
+                    title="Hypothesis Shrink Pass Statistics",
+                    content=dict(shrink_passes),
+                )
             for msg in (
                 p if isinstance(p := runner.provider, PrimitiveProvider) else p(None)
             ).observe_information_messages(lifetime="test_function"):
@@ -2051,6 +2212,7 @@ def given(
                 has_existing_threads = len(thread_overlap) > 0
                 thread_overlap[threadid] = has_existing_threads
 
+            state = None
             try:
                 test = wrapped_test.hypothesis.inner_test
                 if getattr(test, "is_hypothesis_test", False):
@@ -2073,22 +2235,6 @@ def given(
                     new_signature.parameters,
                 )
 
-                if (
-                    inspect.iscoroutinefunction(test)
-                    and get_executor(stuff.selfy) is default_executor
-                ):
-                    # See https://github.com/HypothesisWorks/hypothesis/issues/3054
-                    # If our custom executor doesn't handle coroutines, or we return an
-                    # awaitable from a non-async-def function, we just rely on the
-                    # return_value health check.  This catches most user errors though.
-                    raise InvalidArgument(
-                        "Hypothesis doesn't know how to run async test functions like "
-                        f"{test.__name__}.  You'll need to write a custom executor, "
-                        "or use a library like pytest-asyncio or pytest-trio which can "
-                        "handle the translation for you.\n    See https://hypothesis."
-                        "readthedocs.io/en/latest/details.html#custom-function-execution"
-                    )
-
                 runner = stuff.selfy
                 if isinstance(stuff.selfy, TestCase) and test.__name__ in dir(TestCase):
                     fail_health_check(
@@ -2290,6 +2436,8 @@ def given(
                 if not (ran_explicit_examples or state.ever_executed):
                     raise SKIP_BECAUSE_NO_TEST_CASES
             finally:
+                if state is not None:
+                    state.close()
                 with thread_overlap_lock:
                     del thread_overlap[threadid]
 
@@ -2364,6 +2512,8 @@ def given(
                         settings.database.save(
                             database_key, choices_to_bytes(data.choices)
                         )
+                        # there is no end of run to flush at, so do it now
+                        settings.database.flush()
                         minimal_failures[data.interesting_origin] = data.nodes
                     status = Status.INTERESTING
                     raise
@@ -2384,6 +2534,9 @@ def given(
                         )
                         deliver_observation(tc)
                         state._timing_features = {}
+                    # nothing closes `state` once the fuzzer is done with it, so
+                    # don't leave an event loop open between inputs.
+                    state.close()
 
                 assert isinstance(data.provider, BytestringProvider)
                 return bytes(data.provider.drawn)
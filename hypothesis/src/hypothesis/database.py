@@ -12,6 +12,7 @@ import abc
 import errno
 import json
 import os
+import sqlite3
 import struct
 import sys
 import tempfile
@@ -24,7 +25,7 @@ from hashlib import sha384
 from os import PathLike, getenv
 from pathlib import Path, PurePath
 from queue import Queue
-from threading import Thread
+from threading import Lock, Thread
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -37,6 +38,7 @@ from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 from zipfile import BadZipFile, ZipFile
 
+import _hypothesis_globals
 from hypothesis.configuration import StorageDirectory, storage_directory
 from hypothesis.errors import HypothesisException, HypothesisWarning
 from hypothesis.internal.conjecture.choice import ChoiceT
@@ -50,6 +52,7 @@ __all__ = [
     "InMemoryExampleDatabase",
     "MultiplexedDatabase",
     "ReadOnlyDatabase",
+    "SQLiteExampleDatabase",
 ]
 
 if TYPE_CHECKING:
@@ -93,6 +96,11 @@ def _db_for_path(
                 "https://hypothesis.readthedocs.io/en/latest/settings.html#settings-profiles"
             )
 
+        if _hypothesis_globals.shared_database is not None:
+            # We're a pytest-xdist worker, and the controller process is
+            # serving the default database to us.
+            return _shared_database(*_hypothesis_globals.shared_database)
+
         storage_dir = storage_directory("examples", intent_to_write=False)
         if not _usable_dir(storage_dir.path):  # pragma: no cover
             warnings.warn(
@@ -217,6 +225,10 @@ class ExampleDatabase(metaclass=_EDMeta):
     Optional methods:
 
     * |ExampleDatabase.move|
+    * |ExampleDatabase.fetch_many|
+    * |ExampleDatabase.save_many|
+    * |ExampleDatabase.delete_many|
+    * |ExampleDatabase.flush|
 
     Change listening methods:
 
@@ -268,6 +280,44 @@ class ExampleDatabase(metaclass=_EDMeta):
         self.delete(src, value)
         self.save(dest, value)
 
+    def fetch_many(self, keys: Iterable[bytes]) -> dict[bytes, list[bytes]]:
+        """
+        Return a dictionary mapping each of ``keys`` to a list of its values.
+
+        Equivalent to calling |ExampleDatabase.fetch| for each key, but may have
+        a more efficient implementation, e.g. a single network round trip.
+        """
+        return {key: list(self.fetch(key)) for key in keys}
+
+    def save_many(self, items: Iterable[SaveDataT]) -> None:
+        """
+        Save each ``(key, value)`` pair in ``items``.
+
+        Equivalent to calling |ExampleDatabase.save| for each pair, but may have
+        a more efficient implementation.
+        """
+        for key, value in items:
+            self.save(key, value)
+
+    def delete_many(self, items: Iterable[SaveDataT]) -> None:
+        """
+        Remove each ``(key, value)`` pair in ``items``.
+
+        Equivalent to calling |ExampleDatabase.delete| for each pair, but may
+        have a more efficient implementation.
+        """
+        for key, value in items:
+            self.delete(key, value)
+
+    def flush(self) -> None:
+        """
+        Write out any changes which this database has buffered.
+
+        Databases which batch their writes should override this to send any
+        outstanding writes to the backing store.  Hypothesis calls this at the
+        end of each test.  The default implementation does nothing.
+        """
+
     def add_listener(self, f: ListenerT, /) -> None:
         """
         Add a change listener. ``f`` will be called whenever a value is saved,
@@ -492,12 +542,14 @@ class DirectoryBasedExampleDatabase(ExampleDatabase):
             pass
 
     def save(self, key: bytes, value: bytes) -> None:
-        key_path = self._key_path(key)
-        if key_path.name != self._metakeys_hash:
+        if self._key_path(key).name != self._metakeys_hash:
             # add this key to our meta entry of all keys - taking care to avoid
             # infinite recursion.
             self.save(self._metakeys_name, key)
+        self._save_value(key, value)
 
+    def _save_value(self, key: bytes, value: bytes) -> None:
+        key_path = self._key_path(key)
         # Note: we attempt to create the dir in question now. We
         # already checked for permissions, but there can still be other issues,
         # e.g. the disk is full, or permissions might have been changed.
@@ -529,6 +581,16 @@ class DirectoryBasedExampleDatabase(ExampleDatabase):
         except OSError:  # pragma: no cover
             pass
 
+    def save_many(self, items: Iterable[SaveDataT]) -> None:
+        items = list(items)
+        # record each distinct key in our metakeys entry once, rather than once
+        # per value.
+        keys = {key for key, _ in items if key != self._metakeys_name}
+        for key in keys:
+            self.save(self._metakeys_name, key)
+        for key, value in items:
+            self._save_value(key, value)
+
     def move(self, src: bytes, dest: bytes, value: bytes) -> None:
         if src == dest:
             self.save(src, value)
@@ -552,9 +614,24 @@ class DirectoryBasedExampleDatabase(ExampleDatabase):
             self._value_path(key, value).unlink()
         except OSError:
             return
-
+        self._remove_if_empty(key)
+
+    def delete_many(self, items: Iterable[SaveDataT]) -> None:
+        # unlink all the values first, so that we only try removing each key
+        # directory once.
+        keys = set()
+        for key, value in items:
+            try:
+                self._value_path(key, value).unlink()
+            except OSError:
+                continue
+            keys.add(key)
+        for key in keys:
+            self._remove_if_empty(key)
+
+    def _remove_if_empty(self, key: bytes) -> None:
         # try deleting the key dir, which will only succeed if the dir is empty
-        # (i.e. ``value`` was the last value in this key).
+        # (i.e. we deleted the last value in this key).
         try:
             self._key_path(key).rmdir()
         except OSError:
@@ -731,12 +808,21 @@ class ReadOnlyDatabase(ExampleDatabase):
     def fetch(self, key: bytes) -> Iterable[bytes]:
         yield from self._wrapped.fetch(key)
 
+    def fetch_many(self, keys: Iterable[bytes]) -> dict[bytes, list[bytes]]:
+        return self._wrapped.fetch_many(keys)
+
     def save(self, key: bytes, value: bytes) -> None:
         pass
 
+    def save_many(self, items: Iterable[SaveDataT]) -> None:
+        pass
+
     def delete(self, key: bytes, value: bytes) -> None:
         pass
 
+    def delete_many(self, items: Iterable[SaveDataT]) -> None:
+        pass
+
     def _start_listening(self) -> None:
         # we're read only, so there are no changes to broadcast.
         pass
@@ -804,6 +890,32 @@ class MultiplexedDatabase(ExampleDatabase):
         for db in self._wrapped:
             db.move(src, dest, value)
 
+    def fetch_many(self, keys: Iterable[bytes]) -> dict[bytes, list[bytes]]:
+        keys = list(keys)
+        result: dict[bytes, list[bytes]] = {key: [] for key in keys}
+        seen: dict[bytes, set[bytes]] = {key: set() for key in keys}
+        for db in self._wrapped:
+            for key, values in db.fetch_many(keys).items():
+                for value in values:
+                    if value not in seen[key]:
+                        result[key].append(value)
+                        seen[key].add(value)
+        return result
+
+    def save_many(self, items: Iterable[SaveDataT]) -> None:
+        items = list(items)
+        for db in self._wrapped:
+            db.save_many(items)
+
+    def delete_many(self, items: Iterable[SaveDataT]) -> None:
+        items = list(items)
+        for db in self._wrapped:
+            db.delete_many(items)
+
+    def flush(self) -> None:
+        for db in self._wrapped:
+            db.flush()
+
     def _start_listening(self) -> None:
         for db in self._wrapped:
             db.add_listener(self._broadcast_change)
@@ -1173,7 +1285,7 @@ class BackgroundWriteDatabase(ExampleDatabase):
     def __init__(self, db: ExampleDatabase) -> None:
         super().__init__()
         self._db = db
-        self._queue: Queue[tuple[str, tuple[bytes, ...]]] = Queue()
+        self._queue: Queue[tuple[str, tuple[Any, ...]]] = Queue()
         self._thread: Thread | None = None
 
     def _ensure_thread(self):
@@ -1218,6 +1330,22 @@ class BackgroundWriteDatabase(ExampleDatabase):
         self._ensure_thread()
         self._queue.put(("move", (src, dest, value)))
 
+    def fetch_many(self, keys: Iterable[bytes]) -> dict[bytes, list[bytes]]:
+        self._join()
+        return self._db.fetch_many(keys)
+
+    def save_many(self, items: Iterable[SaveDataT]) -> None:
+        self._ensure_thread()
+        self._queue.put(("save_many", (list(items),)))
+
+    def delete_many(self, items: Iterable[SaveDataT]) -> None:
+        self._ensure_thread()
+        self._queue.put(("delete_many", (list(items),)))
+
+    def flush(self) -> None:
+        self._ensure_thread()
+        self._queue.put(("flush", ()))
+
     def _start_listening(self) -> None:
         self._db.add_listener(self._broadcast_change)
 
@@ -1225,6 +1353,370 @@ class BackgroundWriteDatabase(ExampleDatabase):
         self._db.remove_listener(self._broadcast_change)
 
 
+class SQLiteExampleDatabase(ExampleDatabase):
+    """Use a single SQLite file to store Hypothesis examples.
+
+    Compared to |DirectoryBasedExampleDatabase|, which uses one file per
+    example, this keeps the whole database in one file and can fetch all the
+    values for a key with a single query.  The file is opened in
+    `WAL mode <https://www.sqlite.org/wal.html>`__, so that it can safely be
+    shared by several processes, for example under :pypi:`pytest-xdist`.
+
+    Writes are buffered in memory and committed together in a single
+    transaction, either when ``batch_size`` writes are pending, when
+    |ExampleDatabase.fetch| or |ExampleDatabase.flush| is called, or when the
+    database is garbage collected or the process exits.  Other processes using
+    the same file will therefore not see our writes immediately, and writes may
+    be lost if the process is killed - which is fine for a cache you never need
+    to invalidate.
+
+    Change listening only reports changes made through this instance, not those
+    made by other processes sharing the same file.
+
+    To move an existing |DirectoryBasedExampleDatabase| over, see
+    :meth:`~hypothesis.database.SQLiteExampleDatabase.migrate_directory`.
+    """
+
+    def __init__(self, path: StrPathT, *, batch_size: int = 100) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self._lock = Lock()
+        self._conn: sqlite3.Connection | None = None
+        # the state each (key, value) pair will have in the database once we
+        # commit, where True means present and False means absent.  Since only
+        # the final state matters, we can apply these in any order.
+        self._pending: dict[tuple[bytes, bytes], bool] = {}
+
+    def __repr__(self) -> str:
+        return f"SQLiteExampleDatabase({self.path!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SQLiteExampleDatabase) and self.path == other.path
+
+    def __hash__(self) -> int:
+        return hash((SQLiteExampleDatabase, self.path))
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        # We manage transactions ourselves (isolation_level=None), and guard the
+        # connection with self._lock so that it can be used from e.g. the thread
+        # of a BackgroundWriteDatabase.
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS examples "
+            "(key BLOB NOT NULL, value BLOB NOT NULL, PRIMARY KEY (key, value)) "
+            "WITHOUT ROWID"
+        )
+        self._conn = conn
+        # flush any outstanding writes when we are garbage collected or at exit.
+        # The finalizer must not hold a reference to self.
+        weakref.finalize(self, self._close, conn, self._pending, os.getpid())
+        return conn
+
+    @staticmethod
+    def _commit(
+        conn: sqlite3.Connection, pending: dict[tuple[bytes, bytes], bool]
+    ) -> None:
+        if not pending:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO examples (key, value) VALUES (?, ?)",
+                [kv for kv, present in pending.items() if present],
+            )
+            conn.executemany(
+                "DELETE FROM examples WHERE key = ? AND value = ?",
+                [kv for kv, present in pending.items() if not present],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            # some errors, such as a full disk, roll back the transaction for us
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        pending.clear()
+
+    def _commit_pending(self) -> None:
+        # must be called while holding self._lock
+        try:
+            self._commit(self._connection(), self._pending)
+        except sqlite3.OperationalError:
+            # e.g. another process held the database locked for too long, or
+            # the disk is full. As with the other databases, this shouldn't
+            # fail the test; our writes stay pending and we retry them at the
+            # next commit.
+            pass
+
+    @staticmethod
+    def _close(
+        conn: sqlite3.Connection,
+        pending: dict[tuple[bytes, bytes], bool],
+        pid: int,
+    ) -> None:  # pragma: no cover # only runs at gc or interpreter exit
+        # a forked child must not write through its parent's connection.
+        if os.getpid() != pid:
+            return
+        try:
+            SQLiteExampleDatabase._commit(conn, pending)
+        except sqlite3.Error:
+            pass
+        conn.close()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._commit_pending()
+
+    def _contains(self, key: bytes, value: bytes) -> bool:
+        # must be called while holding self._lock
+        try:
+            return self._pending[(key, value)]
+        except KeyError:
+            pass
+        try:
+            cursor = self._connection().execute(
+                "SELECT 1 FROM examples WHERE key = ? AND value = ?", (key, value)
+            )
+            return cursor.fetchone() is not None
+        except sqlite3.OperationalError:
+            return False
+
+    def _set(self, key: bytes, value: bytes, *, present: bool) -> bool:
+        # record that (key, value) should be present or absent, and return
+        # whether this changed the state of the database.
+        with self._lock:
+            if self._contains(key, value) == present:
+                return False
+            self._pending[(key, value)] = present
+            if len(self._pending) >= self.batch_size:
+                self._commit_pending()
+        return True
+
+    def fetch(self, key: bytes) -> Iterable[bytes]:
+        self.flush()
+        with self._lock:
+            try:
+                rows = (
+                    self._connection()
+                    .execute("SELECT value FROM examples WHERE key = ?", (key,))
+                    .fetchall()
+                )
+            except sqlite3.OperationalError:
+                return
+        for (value,) in rows:
+            yield value
+
+    def fetch_many(self, keys: Iterable[bytes]) -> dict[bytes, list[bytes]]:
+        result: dict[bytes, list[bytes]] = {bytes(key): [] for key in keys}
+        if not result:
+            return result
+        self.flush()
+        placeholders = ", ".join("?" * len(result))
+        with self._lock:
+            try:
+                rows = (
+                    self._connection()
+                    .execute(
+                        f"SELECT key, value FROM examples WHERE key IN ({placeholders})",
+                        list(result),
+                    )
+                    .fetchall()
+                )
+            except sqlite3.OperationalError:
+                return result
+        for key, value in rows:
+            result[key].append(value)
+        return result
+
+    def save(self, key: bytes, value: bytes) -> None:
+        key = bytes(key)
+        value = bytes(value)
+        if self._set(key, value, present=True):
+            self._broadcast_change(("save", (key, value)))
+
+    def delete(self, key: bytes, value: bytes) -> None:
+        key = bytes(key)
+        value = bytes(value)
+        if self._set(key, value, present=False):
+            self._broadcast_change(("delete", (key, value)))
+
+    def migrate_directory(self, path: StrPathT) -> int:
+        """
+        Copy every example from the |DirectoryBasedExampleDatabase| at ``path``
+        into this database, and return the number of examples copied.
+
+        The directory is left untouched, so you can delete it once you have
+        switched your |settings.database| over.  Only keys which are recorded
+        in the directory database's index of keys can be recovered, which
+        excludes directories written by very old versions of Hypothesis.
+        """
+        source = DirectoryBasedExampleDatabase(path)
+        copied = 0
+        for key in source.fetch(source._metakeys_name):
+            for value in source.fetch(key):
+                self.save(key, value)
+                copied += 1
+        self.flush()
+        return copied
+
+    def _start_listening(self) -> None:
+        # as for InMemoryExampleDatabase, we broadcast changes made through this
+        # instance from .save and .delete.
+        pass
+
+    def _stop_listening(self) -> None:
+        pass
+
+
+class _DatabaseServer:
+    """Serves a database to other processes over a local socket.
+
+    Our pytest plugin starts one of these in the pytest-xdist controller
+    process, and each worker process uses it through a ``_RemoteDatabase``
+    instead of opening the database itself.  This gives every worker the same
+    view of the database, through a single write path, rather than having them
+    race on the same files.
+    """
+
+    # The methods a _RemoteDatabase may call. fetch is special-cased, to
+    # materialize its results.
+    _METHODS = frozenset(
+        {
+            "fetch",
+            "save",
+            "delete",
+            "move",
+            "fetch_many",
+            "save_many",
+            "delete_many",
+            "flush",
+        }
+    )
+
+    def __init__(self, db: ExampleDatabase) -> None:
+        from multiprocessing.connection import Listener
+
+        self.db = db
+        self.authkey = os.urandom(32)
+        self._lock = Lock()
+        self._closed = False
+        self._listener = Listener(authkey=self.authkey)
+        self.address = self._listener.address
+        Thread(target=self._accept, daemon=True).start()
+
+    def __repr__(self) -> str:
+        return f"_DatabaseServer({self.db!r}, address={self.address!r})"
+
+    def close(self) -> None:
+        self._closed = True
+        self._listener.close()
+
+    def _accept(self) -> None:
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except Exception:
+                # the listener was closed, or a client failed to authenticate.
+                continue
+            Thread(target=self._serve, args=(connection,), daemon=True).start()
+
+    def _serve(self, connection: Any) -> None:
+        with connection:
+            while True:
+                try:
+                    method, args = connection.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    if method not in self._METHODS:
+                        raise ValueError(f"unknown database method {method!r}")
+                    with self._lock:
+                        result = getattr(self.db, method)(*args)
+                        if method == "fetch":
+                            result = list(result)
+                except Exception as err:
+                    connection.send(("error", f"{type(err).__name__}: {err}"))
+                else:
+                    connection.send(("ok", result))
+
+
+class _RemoteDatabase(ExampleDatabase):
+    """A database served by a ``_DatabaseServer`` in another process."""
+
+    def __init__(self, address: Any, authkey: bytes) -> None:
+        super().__init__()
+        self.address = address
+        self._authkey = authkey
+        self._lock = Lock()
+        self._connection: Any = None
+        self._pid: int | None = None
+
+    def __repr__(self) -> str:
+        return f"_RemoteDatabase(address={self.address!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _RemoteDatabase) and self.address == other.address
+
+    def _call(self, method: str, *args: Any) -> Any:
+        from multiprocessing.connection import Client
+
+        with self._lock:
+            # a forked child must not share its parent's connection.
+            if self._connection is None or self._pid != os.getpid():
+                self._connection = Client(self.address, authkey=self._authkey)
+                self._pid = os.getpid()
+            self._connection.send((method, args))
+            status, result = self._connection.recv()
+        if status == "error":
+            raise HypothesisException(
+                f"Error in shared database at {self.address!r}: {result}"
+            )
+        return result
+
+    def fetch(self, key: bytes) -> Iterable[bytes]:
+        return iter(self._call("fetch", key))
+
+    def save(self, key: bytes, value: bytes) -> None:
+        self._call("save", key, value)
+
+    def delete(self, key: bytes, value: bytes) -> None:
+        self._call("delete", key, value)
+
+    def move(self, src: bytes, dest: bytes, value: bytes) -> None:
+        self._call("move", src, dest, value)
+
+    def fetch_many(self, keys: Iterable[bytes]) -> dict[bytes, list[bytes]]:
+        return self._call("fetch_many", list(keys))
+
+    def save_many(self, items: Iterable[SaveDataT]) -> None:
+        self._call("save_many", list(items))
+
+    def delete_many(self, items: Iterable[SaveDataT]) -> None:
+        self._call("delete_many", list(items))
+
+    def flush(self) -> None:
+        self._call("flush")
+
+    def _start_listening(self) -> None:
+        # changes by other processes are not sent to us.
+        pass
+
+    def _stop_listening(self) -> None:
+        pass
+
+
+@lru_cache
+def _shared_database(address: Any, authkey: bytes) -> _RemoteDatabase:
+    return _RemoteDatabase(address, authkey)
+
+
 def _pack_uleb128(value: int) -> bytes:
     """
     Serialize an integer into variable-length bytes. For each byte, the first 7
@@ -51,7 +51,12 @@ from hypothesis.internal.coverage import check_function
 from hypothesis.internal.reflection import proxies
 from hypothesis.internal.validation import check_type
 from hypothesis.strategies._internal.lazy import unwrap_strategies
-from hypothesis.strategies._internal.numbers import Real
+from hypothesis.strategies._internal.misc import BooleansStrategy
+from hypothesis.strategies._internal.numbers import (
+    FloatStrategy,
+    IntegersStrategy,
+    Real,
+)
 from hypothesis.strategies._internal.strategies import (
     Ex,
     MappedStrategy,
@@ -266,6 +271,7 @@ class ArrayStrategy(st.SearchStrategy):
         self.element_strategy = element_strategy
         self.unique = unique
         self._check_elements = dtype.kind not in ("O", "V")
+        self._primitive_elements = self._find_primitive_elements()
 
     def __repr__(self):
         return (
@@ -273,6 +279,71 @@ class ArrayStrategy(st.SearchStrategy):
             f"dtype={self.dtype!r}, fill={self.fill!r}, unique={self.unique!r})"
         )
 
+    def _find_primitive_elements(self):
+        # If our elements are a plain booleans(), integers(), or floats()
+        # strategy which always fits in our dtype - as from_dtype() returns for
+        # boolean, integer, and 64-bit float dtypes, once arrays() removes the
+        # redundant cast - return the name and constraints of the primitive draw
+        # underlying each element. We can then fill dense arrays without drawing
+        # each element through the strategy machinery. The choice sequence is
+        # the same as drawing element-by-element, so saved examples replay
+        # identically either way.
+        inner = unwrap_strategies(self.element_strategy)
+        if self.dtype.kind == "b" and isinstance(inner, BooleansStrategy):
+            return ("boolean", {})
+        if (
+            self.dtype.kind in ("i", "u")
+            and isinstance(inner, IntegersStrategy)
+            and inner.start is not None
+            and inner.end is not None
+            and np.iinfo(self.dtype).min <= inner.start
+            and inner.end <= np.iinfo(self.dtype).max
+        ):
+            return (
+                "integer",
+                {
+                    "min_value": inner.start,
+                    "max_value": inner.end,
+                    "weights": inner.weights,
+                },
+            )
+        if (
+            self.dtype.kind == "f"
+            and self.dtype.itemsize >= 8
+            and isinstance(inner, FloatStrategy)
+        ):
+            return (
+                "float",
+                {
+                    "min_value": inner.min_value,
+                    "max_value": inner.max_value,
+                    "allow_nan": inner.allow_nan,
+                    "smallest_nonzero_magnitude": inner.smallest_nonzero_magnitude,
+                },
+            )
+        return None
+
+    def _draw_primitive_elements(self, data):
+        choice_type, constraints = self._primitive_elements
+        draw_many = getattr(data, f"draw_{choice_type}s")
+        # Give each element a span, as drawing it from the element strategy
+        # would, so that span-based shrink passes work the same either way.
+        values = draw_many(
+            self.array_size,
+            **constraints,
+            label=unwrap_strategies(self.element_strategy).label,
+        )
+        result = np.array(values, dtype=self.dtype)
+        # Check that every element survived the conversion to our dtype in
+        # one vectorised comparison, rather than once per element.
+        expected = np.array(values, dtype=object)
+        changed = (result.astype(object) != expected) & (expected == expected)
+        if changed.any():  # pragma: no cover  # we only batch elements which fit
+            # set_element raises the same error as the element-wise path
+            i = int(np.argmax(changed))
+            self.set_element(values[i], result, i)
+        return result
+
     def set_element(self, val, result, idx, *, fill=False):
         # `val` is either an arbitrary object (for dtype="O"), or otherwise an
         # instance of a numpy dtype. This means we can *usually* expect e.g.
@@ -359,6 +430,8 @@ class ArrayStrategy(st.SearchStrategy):
                 )
                 for i, v in enumerate(data.draw(elems)):
                     self.set_element(v, result, i)
+            elif self._primitive_elements is not None:
+                result = self._draw_primitive_elements(data)
             else:
                 for i in range(len(result)):
                     self.set_element(data.draw(self.element_strategy), result, i)
@@ -8,25 +8,49 @@
 # v. 2.0. If a copy of the MPL was not distributed with this file, You can
 # obtain one at https://mozilla.org/MPL/2.0/.
 
+import atexit
 import base64
 import json
+import weakref
 from collections.abc import Iterable
 from contextlib import contextmanager
 from datetime import timedelta
-from typing import Any
+from typing import Any, Literal
 
 from redis import Redis
 
 from hypothesis.database import ExampleDatabase
+from hypothesis.errors import InvalidArgument
 from hypothesis.internal.validation import check_type
 
 
+# Databases with buffered writes which have not been sent yet, by id, so that
+# we can send them before the process exits.
+_unflushed: "weakref.WeakValueDictionary[int, RedisExampleDatabase]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+@atexit.register
+def _flush_all() -> None:
+    for db in list(_unflushed.values()):
+        db.flush()
+
+
 class RedisExampleDatabase(ExampleDatabase):
     """Store Hypothesis examples as sets in the given :class:`~redis.Redis` datastore.
 
     This is particularly useful for shared databases, as per the recipe
     for a :class:`~hypothesis.database.MultiplexedDatabase`.
 
+    To save on network round trips, writes are buffered and sent in a single
+    pipeline once ``batch_size`` writes are pending, or when
+    :meth:`~hypothesis.database.ExampleDatabase.fetch` or
+    :meth:`~hypothesis.database.ExampleDatabase.flush` is called.  Hypothesis
+    flushes the database at the end of each test, and any writes still pending
+    are sent when the process exits.  Pass ``batch_size=1`` to send each write
+    immediately.
+
     .. note::
 
         If a test has not been run for ``expire_after``, those examples will be allowed
@@ -40,17 +64,24 @@ class RedisExampleDatabase(ExampleDatabase):
         expire_after: timedelta = timedelta(days=8),
         key_prefix: bytes = b"hypothesis-example:",
         listener_channel: str = "hypothesis-changes",
+        batch_size: int = 100,
     ):
         super().__init__()
         check_type(Redis, redis, "redis")
         check_type(timedelta, expire_after, "expire_after")
         check_type(bytes, key_prefix, "key_prefix")
         check_type(str, listener_channel, "listener_channel")
+        check_type(int, batch_size, "batch_size")
+        if batch_size < 1:
+            raise InvalidArgument(f"batch_size={batch_size!r} must be at least 1")
         self.redis = redis
         self._expire_after = expire_after
         self._prefix = key_prefix
         self.listener_channel = listener_channel
+        self.batch_size = batch_size
         self._pubsub: Any = None
+        # writes which we have not yet sent, in order.
+        self._pending: list[tuple[Literal["save", "delete"], bytes, bytes]] = []
 
     def __repr__(self) -> str:
         return (
@@ -66,32 +97,19 @@ class RedisExampleDatabase(ExampleDatabase):
         )
 
     @contextmanager
-    def _pipeline(
-        self,
-        *reset_expire_keys,
-        execute_and_publish=True,
-        event_type=None,
-        to_publish=None,
-    ):
+    def _pipeline(self, *reset_expire_keys):
         # Context manager to batch updates and expiry reset, reducing TCP roundtrips
         pipe = self.redis.pipeline()
         yield pipe
         for key in reset_expire_keys:
             pipe.expire(self._prefix + key, self._expire_after)
-        if execute_and_publish:
-            changed = pipe.execute()
-            # pipe.execute returns the rows modified for each operation, which includes
-            # the operations performed during the yield, followed by the n operations
-            # from pipe.exire. Look at just the operations from during the yield.
-            changed = changed[: -len(reset_expire_keys)]
-            if any(count > 0 for count in changed):
-                assert to_publish is not None
-                assert event_type is not None
-                self._publish((event_type, to_publish))
-
-    def _publish(self, event):
-        event = (event[0], tuple(self._encode(v) for v in event[1]))
-        self.redis.publish(self.listener_channel, json.dumps(event))
+
+    def _publish_many(self, events):
+        pipe = self.redis.pipeline()
+        for event_type, data in events:
+            event = (event_type, tuple(self._encode(v) for v in data))
+            pipe.publish(self.listener_channel, json.dumps(event))
+        pipe.execute()
 
     def _encode(self, value: bytes) -> str:
         return base64.b64encode(value).decode("ascii")
@@ -99,35 +117,78 @@ class RedisExampleDatabase(ExampleDatabase):
     def _decode(self, value: str) -> bytes:
         return base64.b64decode(value)
 
+    def _write(
+        self,
+        event_type: Literal["save", "delete"],
+        items: Iterable[tuple[bytes, bytes]],
+    ) -> None:
+        self._pending.extend((event_type, key, value) for key, value in items)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        elif self._pending:
+            _unflushed[id(self)] = self
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+        _unflushed.pop(id(self), None)
+        keys = dict.fromkeys(key for _, key, _ in pending)
+        with self._pipeline(*keys) as pipe:
+            for event_type, key, value in pending:
+                if event_type == "save":
+                    pipe.sadd(self._prefix + key, value)
+                else:
+                    pipe.srem(self._prefix + key, value)
+        # pipe.execute returns the rows modified for each operation, followed by
+        # the results of the expiry resets. Only publish the writes which
+        # actually changed something.
+        changed = pipe.execute()[: len(pending)]
+        events = [
+            (event_type, (key, value))
+            for (event_type, key, value), count in zip(pending, changed, strict=True)
+            if count > 0
+        ]
+        if events:
+            self._publish_many(events)
+
     def fetch(self, key: bytes) -> Iterable[bytes]:
-        with self._pipeline(key, execute_and_publish=False) as pipe:
+        self.flush()
+        with self._pipeline(key) as pipe:
             pipe.smembers(self._prefix + key)
         yield from pipe.execute()[0]
 
+    def fetch_many(self, keys: Iterable[bytes]) -> dict[bytes, list[bytes]]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        self.flush()
+        with self._pipeline(*keys) as pipe:
+            for key in keys:
+                pipe.smembers(self._prefix + key)
+        # as in flush, the results of the expiry resets follow our reads.
+        results = pipe.execute()[: len(keys)]
+        return {key: list(values) for key, values in zip(keys, results, strict=True)}
+
     def save(self, key: bytes, value: bytes) -> None:
-        with self._pipeline(key, event_type="save", to_publish=(key, value)) as pipe:
-            pipe.sadd(self._prefix + key, value)
+        self._write("save", [(key, value)])
+
+    def save_many(self, items: Iterable[tuple[bytes, bytes]]) -> None:
+        self._write("save", items)
 
     def delete(self, key: bytes, value: bytes) -> None:
-        with self._pipeline(key, event_type="delete", to_publish=(key, value)) as pipe:
-            pipe.srem(self._prefix + key, value)
+        self._write("delete", [(key, value)])
+
+    def delete_many(self, items: Iterable[tuple[bytes, bytes]]) -> None:
+        self._write("delete", items)
 
     def move(self, src: bytes, dest: bytes, value: bytes) -> None:
         if src == dest:
             self.save(dest, value)
             return
-
-        with self._pipeline(src, dest, execute_and_publish=False) as pipe:
-            pipe.srem(self._prefix + src, value)
-            pipe.sadd(self._prefix + dest, value)
-
-        changed = pipe.execute()
-        if changed[0] > 0:
-            # did the value set of the first key change?
-            self._publish(("delete", (src, value)))
-        if changed[1] > 0:
-            # did the value set of the second key change?
-            self._publish(("save", (dest, value)))
+        self._pending.append(("delete", src, value))
+        self._write("save", [(dest, value)])
 
     def _handle_message(self, message: dict) -> None:
         # other message types include "subscribe" and "unsubscribe". these are
@@ -11,10 +11,13 @@
 import codecs
 import gzip
 import json
+import mmap
 import os
+import struct
 import sys
 import tempfile
 import unicodedata
+from array import array
 from collections.abc import Collection, Iterable
 from functools import cache
 from pathlib import Path
@@ -24,6 +27,7 @@ from hypothesis.configuration import storage_directory
 from hypothesis.control import _current_build_context
 from hypothesis.errors import InvalidArgument
 from hypothesis.internal.intervalsets import IntervalSet, IntervalsT
+from hypothesis.internal.persistent_cache import PersistentCache
 
 # See https://en.wikipedia.org/wiki/Unicode_character_property#General_Category
 CategoryName: TypeAlias = Literal[
@@ -69,38 +73,91 @@ Categories: TypeAlias = Iterable[CategoryName]
 CategoriesTuple: TypeAlias = tuple[CategoryName, ...]
 
 
-def charmap_file(fname: str = "charmap") -> Path:
-    return storage_directory(
-        "unicode_data", unicodedata.unidata_version, f"{fname}.json.gz"
-    ).path
+def charmap_file(fname: str = "charmap.bin") -> Path:
+    return storage_directory("unicode_data", unicodedata.unidata_version, fname).path
 
 
+# The charmap is cached as a binary table, which we memory-map rather than
+# parse.  The file starts with this magic (including the byte order, since we
+# store native integers), followed by two uint32s: the number of categories
+# and the offset of the interval data.  Then for each category there is its
+# two-letter name, the index of its first interval, and its number of intervals.
+# The interval data is a packed array of uint32 (start, end) pairs, sorted by
+# category and then by start.
+_CHARMAP_MAGIC = b"HCM" + (b"<" if sys.byteorder == "little" else b">")
+_CHARMAP_ENTRY = struct.Struct("=2sII")
+_CHARMAP_HEADER = struct.Struct("=4sII")
+
+_charmap_table: dict[CategoryName, memoryview] | None = None
 _charmap: dict[CategoryName, IntervalsT] | None = None
 
 
-def charmap() -> dict[CategoryName, IntervalsT]:
-    """Return a dict that maps a Unicode category, to a tuple of 2-tuples
-    covering the codepoint intervals for characters in that category.
-
-    >>> charmap()['Co']
-    ((57344, 63743), (983040, 1048573), (1048576, 1114109))
+def _read_charmap_table(path: Path) -> dict[CategoryName, memoryview]:
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, n_categories, data_offset = _CHARMAP_HEADER.unpack_from(buf)
+    if magic != _CHARMAP_MAGIC:
+        raise ValueError(f"bad charmap magic {magic!r}")
+    data = memoryview(buf)[data_offset:].cast("I")
+    table = {}
+    n_intervals = 0
+    for i in range(n_categories):
+        name, start, count = _CHARMAP_ENTRY.unpack_from(
+            buf, _CHARMAP_HEADER.size + i * _CHARMAP_ENTRY.size
+        )
+        table[name.decode("ascii")] = data[2 * start : 2 * (start + count)]
+        n_intervals += count
+    if 2 * n_intervals != len(data):
+        raise ValueError("truncated charmap file")
+    return table
+
+
+def _write_charmap_table(path: Path, charmap: dict[str, list]) -> None:
+    names = sorted(charmap)
+    data_offset = _CHARMAP_HEADER.size + len(names) * _CHARMAP_ENTRY.size
+    data_offset += -data_offset % 4
+    header = bytearray(data_offset)
+    _CHARMAP_HEADER.pack_into(header, 0, _CHARMAP_MAGIC, len(names), data_offset)
+    data = array("I")
+    for i, name in enumerate(names):
+        _CHARMAP_ENTRY.pack_into(
+            header,
+            _CHARMAP_HEADER.size + i * _CHARMAP_ENTRY.size,
+            name.encode("ascii"),
+            len(data) // 2,
+            len(charmap[name]),
+        )
+        for u, v in charmap[name]:
+            data.extend((u, v))
+    # Write the Unicode table atomically
+    storage_dir = storage_directory("tmp")
+    storage_dir.create_if_missing()
+    fd, tmpfile = tempfile.mkstemp(dir=storage_dir.path)
+    with os.fdopen(fd, "wb") as f:
+        f.write(header)
+        f.write(data.tobytes())
+    os.renames(tmpfile, path)
+
+
+def charmap_table() -> dict[CategoryName, memoryview]:
+    """Return a dict that maps a Unicode category to a flat memoryview of
+    uint32, holding the start and end of each codepoint interval for characters
+    in that category.  Where possible, these are views of a memory-mapped file.
     """
-    global _charmap
+    global _charmap_table
     # Best-effort caching in the face of missing files and/or unwritable
     # filesystems is fairly simple: check if loaded, else try loading,
     # else calculate and try writing the cache.
-    if _charmap is None:
+    if _charmap_table is None:
         f = charmap_file()
         try:
-            with gzip.GzipFile(f, "rb") as d:
-                tmp_charmap = dict(json.load(d))
-
+            table = _read_charmap_table(f)
         except Exception:
             # This loop is reduced to using only local variables for performance;
             # indexing and updating containers is a ~3x slowdown.  This doesn't fix
             # https://github.com/HypothesisWorks/hypothesis/issues/2108 but it helps.
             category = unicodedata.category  # Local variable -> ~20% speedup!
-            tmp_charmap = {}
+            tmp_charmap: dict[str, list] = {}
             last_cat = category(chr(0))
             last_start = 0
             for i in range(1, sys.maxunicode + 1):
@@ -111,23 +168,31 @@ def charmap() -> dict[CategoryName, IntervalsT]:
             tmp_charmap.setdefault(last_cat, []).append((last_start, sys.maxunicode))
 
             try:
-                # Write the Unicode table atomically
-                storage_dir = storage_directory("tmp")
-                storage_dir.create_if_missing()
-                fd, tmpfile = tempfile.mkstemp(dir=storage_dir.path)
-                os.close(fd)
-                # Explicitly set the mtime to get reproducible output
-                with gzip.GzipFile(tmpfile, "wb", mtime=1) as fp:
-                    result = json.dumps(sorted(tmp_charmap.items()))
-                    fp.write(result.encode())
-
-                os.renames(tmpfile, f)
+                _write_charmap_table(f, tmp_charmap)
+                table = _read_charmap_table(f)
             except Exception:
-                pass
+                table = {
+                    k: memoryview(array("I", [x for pair in pairs for x in pair]))
+                    for k, pairs in tmp_charmap.items()
+                }
+        _charmap_table = table  # type: ignore
+
+    assert _charmap_table is not None
+    return _charmap_table
 
-        # convert between lists and tuples
+
+def charmap() -> dict[CategoryName, IntervalsT]:
+    """Return a dict that maps a Unicode category, to a tuple of 2-tuples
+    covering the codepoint intervals for characters in that category.
+
+    >>> charmap()['Co']
+    ((57344, 63743), (983040, 1048573), (1048576, 1114109))
+    """
+    global _charmap
+    if _charmap is None:
         _charmap = {
-            k: tuple(tuple(pair) for pair in pairs) for k, pairs in tmp_charmap.items()
+            k: tuple(zip(v[::2], v[1::2], strict=True))
+            for k, v in charmap_table().items()
         }
         # each value is a tuple of 2-tuples (that is, tuples of length 2)
         # and both elements of that tuple are integers.
@@ -149,7 +214,7 @@ def intervals_from_codec(
     and the subset which encode successfully but do not decode back to the
     same character."""
     assert codec_name == codecs.lookup(codec_name).name
-    fname = charmap_file(f"codec-v2-{codec_name}")
+    fname = charmap_file(f"codec-v2-{codec_name}.json.gz")
     try:
         with gzip.GzipFile(fname) as gzf:
             encodable_intervals, non_roundtrip_intervals = json.load(gzf)
@@ -205,8 +270,8 @@ def categories() -> Categories:
     """
     global _categories
     if _categories is None:
-        cm = charmap()
-        categories = sorted(cm.keys(), key=lambda c: len(cm[c]))
+        table = charmap_table()
+        categories = sorted(table.keys(), key=lambda c: len(table[c]))
         categories.remove("Cc")  # Other, Control
         categories.remove("Cs")  # Other, Surrogate
         categories.append("Cc")
@@ -285,20 +350,35 @@ def _query_for_key(key: Categories) -> IntervalsT:
         return ()
     assert key
     if set(key) == set(categories()):
-        result = IntervalSet([(0, sys.maxunicode)])
+        result: IntervalsT = ((0, sys.maxunicode),)
     else:
-        result = IntervalSet(_query_for_key(key[:-1])).union(
-            IntervalSet(charmap()[key[-1]])
+        # Each codepoint is in exactly one category, so the intervals of
+        # different categories are disjoint.  We can therefore take the union
+        # in one pass, by sorting them and joining up those which are adjacent.
+        table = charmap_table()
+        pairs = sorted(
+            pair
+            for c in key
+            for pair in zip(table[c][::2], table[c][1::2], strict=True)
         )
-    assert isinstance(result, IntervalSet)
+        merged: list[tuple[int, int]] = []
+        for u, v in pairs:
+            if merged and u == merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], v)
+            else:
+                merged.append((u, v))
+        result = tuple(merged)
     if context is None or not context.data.provider.avoid_realization:
-        category_index_cache[cache_key] = result.intervals
-    return result.intervals
+        category_index_cache[cache_key] = result
+    return result
 
 
 limited_category_index_cache: dict[
     tuple[CategoriesTuple, int, int, IntervalsT, IntervalsT], IntervalSet
 ] = {}
+# query() results are also persisted across processes, keyed by the repr of
+# the query key.  They depend on the unicode database as well as our version.
+persistent_query_cache = PersistentCache(f"charmap-query-{unicodedata.unidata_version}")
 
 
 def query(
@@ -343,11 +423,16 @@ def query(
         exclude_intervals.intervals,
     )
     context = _current_build_context.value
-    if context is None or not context.data.provider.avoid_realization:
+    use_cache = context is None or not context.data.provider.avoid_realization
+    if use_cache:
         try:
             return limited_category_index_cache[qkey]
         except KeyError:
             pass
+        if (intervals := persistent_query_cache.get(repr(qkey))) is not None:
+            cached: IntervalSet = IntervalSet(intervals)
+            limited_category_index_cache[qkey] = cached
+            return cached
 
     result = []
     for u, v in _query_for_key(catkey):
@@ -355,7 +440,8 @@ def query(
             result.append((max(u, min_codepoint), min(v, max_codepoint)))
 
     result = (IntervalSet(result) | character_intervals) - exclude_intervals
-    if context is None or not context.data.provider.avoid_realization:
+    if use_cache:
         limited_category_index_cache[qkey] = result
+        persistent_query_cache[repr(qkey)] = result.intervals
 
     return result
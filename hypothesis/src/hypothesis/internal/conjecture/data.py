@@ -14,7 +14,7 @@ import time
 import types
 import weakref
 from collections import defaultdict
-from collections.abc import Hashable, Iterable, Iterator, Sequence
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from enum import IntEnum
 from functools import cached_property
@@ -80,6 +80,7 @@ from hypothesis.utils.deprecation import note_deprecation
 from hypothesis.utils.threading import ThreadLocal
 
 if TYPE_CHECKING:
+    from hypothesis.internal.scrutineer import Trace
     from hypothesis.strategies import SearchStrategy
     from hypothesis.strategies._internal.core import DataObject
     from hypothesis.strategies._internal.random import RandomState
@@ -737,6 +738,10 @@ class ConjectureData:
         self.tags: set[StructuralCoverageTag] = set()
         self.labels_for_structure_stack: list[set[int]] = []
 
+        # Branches of the test function covered by this test case. Only
+        # populated when the test function is traced.
+        self.branches: Trace = frozenset()
+
         # Normally unpopulated but we need this in the niche case
         # that self.as_result() is Overrun but we still want the
         # examples for reporting purposes.
@@ -751,6 +756,9 @@ class ConjectureData:
         self.arg_spans: set[int] = set()
         self.span_comments: dict[int | None, str] = {}
         self._observability_args: dict[str, Any] = {}
+        # False if this test case is only observed in aggregate, in which case
+        # we don't need its arguments. See OBSERVABILITY_SAMPLE.
+        self._observe_arguments: bool = True
         self._observability_predicates: defaultdict[str, PredicateCounts] = defaultdict(
             PredicateCounts
         )
@@ -925,6 +933,98 @@ class ConjectureData:
 
         return value
 
+    def _draw_many(
+        self,
+        choice_type: ChoiceTypeT,
+        constraints: ChoiceConstraintsT,
+        n: int,
+        *,
+        observe: bool,
+        label: int | None,
+    ) -> list[ChoiceT]:
+        values: list[ChoiceT] = []
+        # the overloads of _draw pair each choice type with its constraints,
+        # which we can't express for a choice_type that isn't a literal.
+        _draw = cast(Callable[..., ChoiceT], self._draw)
+
+        def draw_one() -> ChoiceT:
+            if label is not None:
+                self.start_span(label)
+            value = _draw(choice_type, constraints, observe=observe, forced=None)
+            if label is not None:
+                self.stop_span()
+            return value
+
+        # Choices replayed from the prefix can be misaligned or templates, so we
+        # draw those one at a time, exactly as in _draw.
+        while (
+            observe
+            and len(values) < n
+            and self.prefix is not None
+            and self.index < len(self.prefix)
+        ):
+            values.append(draw_one())
+        count = n - len(values)
+        if count == 0:
+            return values
+        if self._inverting or (
+            observe
+            and (
+                self.length >= self.max_length
+                or (
+                    self.max_choices is not None
+                    and len(self.nodes) + count > self.max_choices
+                )
+            )
+        ):
+            # We'll raise or overrun partway through this batch, so leave it to
+            # _draw to do that at the right choice.
+            for _ in range(count):
+                values.append(draw_one())
+            return values
+
+        drawn = getattr(self.provider, f"draw_{choice_type}s")(count, **constraints)
+        assert len(drawn) == count
+        if choice_type == "float":
+            # see the comment about nans in _draw
+            drawn = [
+                int_to_float(float_to_int(v)) if math.isnan(v) else v for v in drawn
+            ]
+        values.extend(drawn)
+        if not observe:
+            return values
+
+        record = getattr(self.observer, f"draw_{choice_type}")
+        nodes: list[ChoiceNode] = []
+        try:
+            for value in drawn:
+                if label is not None:
+                    self.start_span(label)
+                record(value, constraints=constraints, was_forced=False)
+                size = 0 if self.provider.avoid_realization else choices_size([value])
+                if self.length + size > self.max_length:
+                    debug_report(
+                        f"overrun because {self.length=} + {size=} > {self.max_length=}"
+                    )
+                    self.mark_overrun()
+                nodes.append(
+                    ChoiceNode(
+                        type=choice_type,
+                        value=value,
+                        constraints=constraints,
+                        was_forced=False,
+                        index=len(self.nodes) + len(nodes),
+                    )
+                )
+                self.__span_record.record_choice()
+                self.length += size
+                if label is not None:
+                    self.stop_span()
+        finally:
+            # appending to a tuple is linear, so we do it once per batch
+            self.nodes += tuple(nodes)
+        return values
+
     def draw_integer(
         self,
         min_value: int | None = None,
@@ -935,6 +1035,51 @@ class ConjectureData:
         forced: int | None = None,
         observe: bool = True,
     ) -> int:
+        if forced is not None and min_value is not None:
+            assert min_value <= forced
+        if forced is not None and max_value is not None:
+            assert forced <= max_value
+
+        constraints = self._integer_constraints(
+            min_value, max_value, weights=weights, shrink_towards=shrink_towards
+        )
+        return self._draw("integer", constraints, observe=observe, forced=forced)
+
+    def draw_integers(
+        self,
+        n: int,
+        min_value: int | None = None,
+        max_value: int | None = None,
+        *,
+        weights: dict[int, float] | None = None,
+        shrink_towards: int = 0,
+        observe: bool = True,
+        label: int | None = None,
+    ) -> list[int]:
+        """Draw ``n`` integers, as if by calling ``draw_integer`` ``n`` times
+        with the same arguments.
+
+        Each integer is still recorded as its own choice, but the provider can
+        draw the whole batch at once, and the per-choice bookkeeping is cheaper.
+        If ``label`` is given, each choice gets its own span with that label,
+        as if each had been drawn by a strategy with that label.
+        """
+        constraints = self._integer_constraints(
+            min_value, max_value, weights=weights, shrink_towards=shrink_towards
+        )
+        return cast(
+            list[int],
+            self._draw_many("integer", constraints, n, observe=observe, label=label),
+        )
+
+    def _integer_constraints(
+        self,
+        min_value: int | None,
+        max_value: int | None,
+        *,
+        weights: dict[int, float] | None,
+        shrink_towards: int,
+    ) -> IntegerConstraints:
         # Validate arguments
         if weights is not None:
             assert min_value is not None
@@ -948,12 +1093,7 @@ class ConjectureData:
             # we'll want to drop this restriction eventually.
             assert all(w != 0 for w in weights.values())
 
-        if forced is not None and min_value is not None:
-            assert min_value <= forced
-        if forced is not None and max_value is not None:
-            assert forced <= max_value
-
-        constraints: IntegerConstraints = self._pooled_constraints(
+        return self._pooled_constraints(
             "integer",
             {
                 "min_value": min_value,
@@ -962,7 +1102,6 @@ class ConjectureData:
                 "shrink_towards": shrink_towards,
             },
         )
-        return self._draw("integer", constraints, observe=observe, forced=forced)
 
     def draw_float(
         self,
@@ -977,6 +1116,52 @@ class ConjectureData:
         forced: float | None = None,
         observe: bool = True,
     ) -> float:
+        if forced is not None:
+            assert allow_nan or not math.isnan(forced)
+            assert math.isnan(forced) or (
+                sign_aware_lte(min_value, forced) and sign_aware_lte(forced, max_value)
+            )
+
+        constraints = self._float_constraints(
+            min_value,
+            max_value,
+            allow_nan=allow_nan,
+            smallest_nonzero_magnitude=smallest_nonzero_magnitude,
+        )
+        return self._draw("float", constraints, observe=observe, forced=forced)
+
+    def draw_floats(
+        self,
+        n: int,
+        min_value: float = -math.inf,
+        max_value: float = math.inf,
+        *,
+        allow_nan: bool = True,
+        smallest_nonzero_magnitude: float = SMALLEST_SUBNORMAL,
+        observe: bool = True,
+        label: int | None = None,
+    ) -> list[float]:
+        """Draw ``n`` floats, as if by calling ``draw_float`` ``n`` times with
+        the same arguments. See ``draw_integers``."""
+        constraints = self._float_constraints(
+            min_value,
+            max_value,
+            allow_nan=allow_nan,
+            smallest_nonzero_magnitude=smallest_nonzero_magnitude,
+        )
+        return cast(
+            list[float],
+            self._draw_many("float", constraints, n, observe=observe, label=label),
+        )
+
+    def _float_constraints(
+        self,
+        min_value: float,
+        max_value: float,
+        *,
+        allow_nan: bool,
+        smallest_nonzero_magnitude: float,
+    ) -> FloatConstraints:
         assert smallest_nonzero_magnitude > 0
         assert not math.isnan(min_value)
         assert not math.isnan(max_value)
@@ -991,13 +1176,7 @@ class ConjectureData:
                 "writeup - and good luck!"
             )
 
-        if forced is not None:
-            assert allow_nan or not math.isnan(forced)
-            assert math.isnan(forced) or (
-                sign_aware_lte(min_value, forced) and sign_aware_lte(forced, max_value)
-            )
-
-        constraints: FloatConstraints = self._pooled_constraints(
+        return self._pooled_constraints(
             "float",
             {
                 "min_value": min_value,
@@ -1006,7 +1185,6 @@ class ConjectureData:
                 "smallest_nonzero_magnitude": smallest_nonzero_magnitude,
             },
         )
-        return self._draw("float", constraints, observe=observe, forced=forced)
 
     def draw_string(
         self,
@@ -1061,6 +1239,22 @@ class ConjectureData:
         constraints: BooleanConstraints = self._pooled_constraints("boolean", {"p": p})
         return self._draw("boolean", constraints, observe=observe, forced=forced)
 
+    def draw_booleans(
+        self,
+        n: int,
+        p: float = 0.5,
+        *,
+        observe: bool = True,
+        label: int | None = None,
+    ) -> list[bool]:
+        """Draw ``n`` booleans, as if by calling ``draw_boolean`` ``n`` times
+        with the same arguments. See ``draw_integers``."""
+        constraints: BooleanConstraints = self._pooled_constraints("boolean", {"p": p})
+        return cast(
+            list[bool],
+            self._draw_many("boolean", constraints, n, observe=observe, label=label),
+        )
+
     @overload
     def _pooled_constraints(
         self, choice_type: Literal["integer"], constraints: IntegerConstraints
@@ -1329,7 +1523,7 @@ class ConjectureData:
                     f"while generating {key.removeprefix('generate:')!r} from {strategy!r}",
                 )
                 raise
-            if observability_enabled():
+            if observability_enabled() and self._observe_arguments:
                 avoid = self.provider.avoid_realization
                 self._observability_args[key] = to_jsonable(v, avoid_realization=avoid)
             self.__span_record.record_value_for_span(span_index, v)
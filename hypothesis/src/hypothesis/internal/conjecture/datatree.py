@@ -9,7 +9,8 @@
 # obtain one at https://mozilla.org/MPL/2.0/.
 
 import math
-from collections.abc import Generator, Set
+from array import array
+from collections.abc import Generator, Hashable, Iterator, Sequence, Set
 from dataclasses import dataclass, field
 from random import Random
 from typing import TYPE_CHECKING, Final, TypeAlias, cast
@@ -30,6 +31,7 @@ from hypothesis.internal.conjecture.choice import (
     FloatConstraints,
     IntegerConstraints,
     StringConstraints,
+    choice_constraints_key,
     choice_from_index,
 )
 from hypothesis.internal.conjecture.data import ConjectureData, DataObserver, Status
@@ -70,6 +72,86 @@ class Killed:
         p.text("Killed")
 
 
+@dataclass(slots=True, frozen=True)
+class Summarized:
+    """Represents a transition to part of the tree which has been discarded to
+    save memory, see DataTree.evict.
+
+    We keep whether the discarded part was exhausted (in the is_exhausted of
+    the node with this transition), but nothing else, so we can't simulate
+    test cases through it or record new ones into it."""
+
+    def _repr_pretty_(self, p: "RepresentationPrinter", cycle: bool) -> None:
+        assert cycle is False
+        p.text("Summarized")
+
+
+SUMMARIZED: Final[Summarized] = Summarized()
+
+
+class SignatureTable:
+    """Interns the (choice_type, constraints) pair of each choice stored in a
+    DataTree.
+
+    A TreeNode stores the index of each choice's pair in this table, in a
+    compact array, rather than two references per choice. This also means that
+    equal constraints are stored once per tree, rather than once per node."""
+
+    __slots__ = ("_ids", "choice_types", "constraints")
+
+    def __init__(self) -> None:
+        self.choice_types: list[ChoiceTypeT] = []
+        self.constraints: list[ChoiceConstraintsT] = []
+        self._ids: dict[tuple[Hashable, ...], int] = {}
+
+    def intern(self, choice_type: ChoiceTypeT, constraints: ChoiceConstraintsT) -> int:
+        key = (choice_type, *choice_constraints_key(choice_type, constraints))
+        if choice_type == "integer":
+            # choice_constraints_key only includes the weighted values, and
+            # we want to distinguish different weights for the same values.
+            weights = cast(IntegerConstraints, constraints)["weights"]
+            if weights is not None:
+                key += (tuple(weights.items()),)
+        try:
+            return self._ids[key]
+        except KeyError:
+            pass
+        i = len(self.choice_types)
+        self._ids[key] = i
+        self.choice_types.append(choice_type)
+        self.constraints.append(constraints)
+        return i
+
+
+class _SignatureColumn(Sequence):
+    # A read-only view of the choice types or constraints of a TreeNode.
+    __slots__ = ("_column", "_ids")
+
+    def __init__(self, column: list, ids: "array[int]") -> None:
+        self._column = column
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._column[j] for j in self._ids[i]]
+        return self._column[self._ids[i]]
+
+    def __iter__(self) -> Iterator:
+        return map(self._column.__getitem__, self._ids)
+
+    def __eq__(self, other: object) -> bool:
+        return list(self) == other
+
+    # unhashable, like the lists we compare equal to.
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 def _node_pretty(
     choice_type: ChoiceTypeT,
     value: ChoiceT,
@@ -390,11 +472,21 @@ class TreeNode:
                   └───┘      └───┘
     """
 
-    # The constraints, value, and choice_types of the nodes stored here. These always
-    # have the same length. The values at index i belong to node i.
-    constraints: list[ChoiceConstraintsT] = field(default_factory=list)
+    # The table which the choice types and constraints of the nodes stored here
+    # are interned in. This is shared by every TreeNode in a DataTree.
+    signatures: SignatureTable = field(
+        default_factory=SignatureTable, repr=False, compare=False
+    )
+
+    # The values of the nodes stored here, and the indices of their choice types
+    # and constraints in the signature table. These always have the same length.
+    # The values at index i belong to node i.
+    #
+    # Long runs of choices are common, so we store the signature indices in a
+    # typed array, at four bytes per choice. See also the choice_types and
+    # constraints properties.
     values: list[ChoiceT] = field(default_factory=list)
-    choice_types: list[ChoiceTypeT] = field(default_factory=list)
+    signature_ids: "array[int]" = field(default_factory=lambda: array("I"))
 
     # The indices of nodes which had forced values.
     #
@@ -411,7 +503,8 @@ class TreeNode:
     # - Conclusion (ConjectureData.conclude_test was called here)
     # - Killed (this branch is valid and may even have children, but should not
     #   be explored when generating novel prefixes)
-    transition: Branch | Conclusion | Killed | None = None
+    # - Summarized (we used to know, but discarded it to save memory)
+    transition: Branch | Conclusion | Killed | Summarized | None = None
 
     # A tree node is exhausted if every possible sequence of draws below it has
     # been explored. We only update this when performing operations that could
@@ -420,6 +513,27 @@ class TreeNode:
     # See also TreeNode.check_exhausted.
     is_exhausted: bool = field(default=False, init=False)
 
+    @property
+    def choice_types(self) -> Sequence[ChoiceTypeT]:
+        return _SignatureColumn(self.signatures.choice_types, self.signature_ids)
+
+    @property
+    def constraints(self) -> Sequence[ChoiceConstraintsT]:
+        return _SignatureColumn(self.signatures.constraints, self.signature_ids)
+
+    def signature(self, i: int) -> tuple[ChoiceTypeT, ChoiceConstraintsT]:
+        """
+        Returns the choice type and constraints of node i.
+        """
+        j = self.signature_ids[i]
+        return (self.signatures.choice_types[j], self.signatures.constraints[j])
+
+    def append(
+        self, choice_type: ChoiceTypeT, constraints: ChoiceConstraintsT, value: ChoiceT
+    ) -> None:
+        self.signature_ids.append(self.signatures.intern(choice_type, constraints))
+        self.values.append(value)
+
     @property
     def forced(self) -> Set[int]:
         if not self.__forced:
@@ -443,9 +557,10 @@ class TreeNode:
         Raises FlakyStrategyDefinition if node i was forced.
         """
 
+        choice_type, constraints = self.signature(i)
         if i in self.forced:
             raise FlakyStrategyDefinition.with_detail(
-                f"The {self.choice_types[i]} value was forced to "
+                f"The {choice_type} value was forced to "
                 f"{self.values[i]!r} in the first run, but the second run "
                 f"drew {new_value!r}.\n"
             )
@@ -455,24 +570,23 @@ class TreeNode:
         key = self.values[i]
 
         child = TreeNode(
-            choice_types=self.choice_types[i + 1 :],
-            constraints=self.constraints[i + 1 :],
+            signatures=self.signatures,
             values=self.values[i + 1 :],
+            signature_ids=self.signature_ids[i + 1 :],
             transition=self.transition,
         )
         self.transition = Branch(
-            constraints=self.constraints[i],
-            choice_type=self.choice_types[i],
+            constraints=constraints,
+            choice_type=choice_type,
             children={key: child},
         )
         if self.__forced is not None:
             child.__forced = {j - i - 1 for j in self.__forced if j > i}
             self.__forced = {j for j in self.__forced if j < i}
         child.check_exhausted()
-        del self.choice_types[i:]
+        del self.signature_ids[i:]
         del self.values[i:]
-        del self.constraints[i:]
-        assert len(self.values) == len(self.constraints) == len(self.choice_types) == i
+        assert len(self.values) == len(self.signature_ids) == i
 
     def check_exhausted(self) -> bool:
         """
@@ -509,6 +623,9 @@ class TreeNode:
             # but immediately split them into a transition to avoid falsifying
             # this check. this is a bit of a hack.)
             and len(self.forced) == len(self.values)
+            # we no longer know what is below a summarized node, so if it was
+            # not exhausted when we summarized it, it never will be.
+            and not isinstance(self.transition, Summarized)
         ):
             if isinstance(self.transition, (Conclusion, Killed)):
                 self.is_exhausted = True
@@ -687,9 +804,15 @@ class DataTree:
       See TreeNode for more information.
     """
 
-    def __init__(self) -> None:
-        self.root: TreeNode = TreeNode()
+    def __init__(self, *, max_nodes: int | None = None) -> None:
+        self.signatures = SignatureTable()
+        self.root: TreeNode = TreeNode(signatures=self.signatures)
         self._children_cache: dict[ChoiceT, ChildrenCacheValueT] = {}
+        # An approximate count of the nodes in this tree, where each value stored
+        # in a TreeNode counts as a node, as does each TreeNode itself. When this
+        # goes over max_nodes, we evict parts of the tree to free memory.
+        self.node_count: int = 1
+        self.max_nodes = max_nodes
 
     @property
     def is_exhausted(self) -> bool:
@@ -699,6 +822,37 @@ class DataTree:
         """
         return self.root.is_exhausted
 
+    def exhausted_prefixes(self) -> list[tuple[ChoiceT, ...]]:
+        """
+        Returns the shortest choice sequence prefixes which lead to an exhausted
+        node, i.e. such that every choice sequence starting with that prefix has
+        already been explored.
+
+        No returned prefix is a prefix of another, and the empty prefix (which
+        would mean the whole tree is exhausted) is never returned.
+        """
+        prefixes = []
+        stack: list[tuple[TreeNode, tuple[ChoiceT, ...]]] = [(self.root, ())]
+        while stack:
+            node, prefix = stack.pop()
+            if node.is_exhausted:
+                if prefix:
+                    prefixes.append(prefix)
+                continue
+            prefix += tuple(
+                int_to_float(cast(int, value)) if choice_type == "float" else value
+                for choice_type, value in zip(
+                    node.choice_types, node.values, strict=True
+                )
+            )
+            if isinstance(node.transition, Branch):
+                branch = node.transition
+                for value, child in branch.children.items():
+                    if branch.choice_type == "float":
+                        value = int_to_float(cast(int, value))
+                    stack.append((child, (*prefix, value)))
+        return prefixes
+
     def generate_novel_prefix(self, random: Random) -> tuple[ChoiceT, ...]:
         """Generate a short random string that (after rewriting) is not
         a prefix of any choice sequence previously added to the tree.
@@ -766,7 +920,9 @@ class DataTree:
                     return tuple(prefix)
 
             assert not isinstance(current_node.transition, (Conclusion, Killed))
-            if current_node.transition is None:
+            if current_node.transition is None or isinstance(
+                current_node.transition, Summarized
+            ):
                 return tuple(prefix)
             branch = current_node.transition
             assert isinstance(branch, Branch)
@@ -856,7 +1012,7 @@ class DataTree:
                 if isinstance(node.transition, Conclusion):
                     t = node.transition
                     data.conclude_test(t.status, t.interesting_origin)
-                elif node.transition is None:
+                elif node.transition is None or isinstance(node.transition, Summarized):
                     raise PreviouslyUnseenBehaviour
                 elif isinstance(node.transition, Branch):
                     v = draw(node.transition.choice_type, node.transition.constraints)
@@ -874,6 +1030,81 @@ class DataTree:
     def new_observer(self):
         return TreeRecordingObserver(self)
 
+    def evict(self) -> None:
+        """
+        Summarize parts of the tree until it has at most half of max_nodes
+        nodes.
+
+        We first discard the contents of exhausted subtrees, which
+        generate_novel_prefix never visits again, and then, if that is not
+        enough, the largest remaining subtrees. Test cases which pass through a
+        summarized node can no longer be simulated, and novel prefixes which
+        reach one stop there, so this trades some duplicated work for memory.
+        """
+        assert self.max_nodes is not None
+        # preorder traversal, recording each node's parent.
+        order: list[tuple[TreeNode, TreeNode | None]] = []
+        stack: list[tuple[TreeNode, TreeNode | None]] = [(self.root, None)]
+        while stack:
+            node, parent = stack.pop()
+            order.append((node, parent))
+            if isinstance(node.transition, Branch):
+                children = node.transition.children.values()
+                stack.extend((child, node) for child in children)
+            elif isinstance(node.transition, Killed):
+                stack.append((node.transition.next_node, node))
+
+        parents: dict[int, TreeNode | None] = {}
+        sizes: dict[int, int] = {}
+        for node, parent in reversed(order):
+            parents[id(node)] = parent
+            size = sizes.get(id(node), 0) + len(node.values) + 1
+            sizes[id(node)] = size
+            if parent is not None:
+                sizes[id(parent)] = sizes.get(id(parent), 0) + size
+
+        def freed(node: TreeNode) -> int:
+            return sizes[id(node)] - len(node.values) - 1
+
+        summarized: set[int] = set()
+
+        def ancestors(node: TreeNode) -> Generator[TreeNode, None, None]:
+            parent = parents[id(node)]
+            while parent is not None:
+                yield parent
+                parent = parents[id(parent)]
+
+        candidates = [
+            node
+            for node, parent in order
+            if parent is not None
+            and not isinstance(node.transition, (Summarized, Conclusion))
+            and freed(node) > 0
+        ]
+        # exhausted subtrees first, which we lose nothing by discarding, and
+        # then the largest.
+        candidates.sort(key=lambda node: (not node.is_exhausted, -freed(node)))
+        total = sizes[id(self.root)]
+        target = self.max_nodes // 2
+        for node in candidates:
+            if total <= target:
+                break
+            if any(id(parent) in summarized for parent in ancestors(node)):
+                continue
+            n = freed(node)
+            if n <= 0:
+                continue
+            total -= n
+            for parent in ancestors(node):
+                sizes[id(parent)] -= n
+            sizes[id(node)] -= n
+            node.transition = SUMMARIZED
+            summarized.add(id(node))
+        self.node_count = total
+        # the children cache is keyed by the ids of nodes, which may now be
+        # reused for new nodes.
+        self._children_cache.clear()
+
     def _draw(
         self,
         choice_type: ChoiceTypeT,
@@ -989,6 +1220,7 @@ class TreeRecordingObserver(DataObserver):
         # errors, with
         # `from hypothesis.vendor import pretty; print(pretty.pretty(self._root))`
         self._root = tree.root
+        self._tree = tree
         self._current_node: TreeNode = tree.root
         self._index_in_current_node: int = 0
         self._trail: list[TreeNode] = [self._current_node]
@@ -1038,15 +1270,13 @@ class TreeRecordingObserver(DataObserver):
         if isinstance(value, float):
             value = float_to_int(value)
 
-        assert len(node.constraints) == len(node.values) == len(node.choice_types)
+        assert len(node.signature_ids) == len(node.values)
         if i < len(node.values):
-            if (
-                choice_type != node.choice_types[i]
-                or constraints != node.constraints[i]
-            ):
+            old_choice_type, old_constraints = node.signature(i)
+            if choice_type != old_choice_type or constraints != old_constraints:
                 raise FlakyStrategyDefinition.from_mismatch(
-                    node.choice_types[i],
-                    node.constraints[i],
+                    old_choice_type,
+                    old_constraints,
                     choice_type,
                     constraints,
                 )
@@ -1064,7 +1294,9 @@ class TreeRecordingObserver(DataObserver):
             if value != node.values[i]:
                 node.split_at(i, new_value=value)
                 assert i == len(node.values)
-                new_node = TreeNode()
+                # one for the TreeNode split off, and one for new_node
+                self._tree.node_count += 2
+                new_node = self._new_node()
                 assert isinstance(node.transition, Branch)
                 node.transition.children[value] = new_node
                 self._current_node = new_node
@@ -1072,9 +1304,8 @@ class TreeRecordingObserver(DataObserver):
         else:
             trans = node.transition
             if trans is None:
-                node.choice_types.append(choice_type)
-                node.constraints.append(constraints)
-                node.values.append(value)
+                node.append(choice_type, constraints, value)
+                self._tree.node_count += 1
                 if was_forced:
                     node.mark_forced(i)
                 # generate_novel_prefix assumes the following invariant: any one
@@ -1098,6 +1329,7 @@ class TreeRecordingObserver(DataObserver):
                     and not was_forced
                 ):
                     node.split_at(i, new_value=value)
+                    self._tree.node_count += 1
                     assert isinstance(node.transition, Branch)
                     self._current_node = node.transition.children[value]
                     self._index_in_current_node = 0
@@ -1108,6 +1340,8 @@ class TreeRecordingObserver(DataObserver):
                 raise FlakyStrategyDefinition.with_detail(
                     "The second run drew more data than the first run.\n"
                 )
+            elif isinstance(trans, Summarized):
+                self._leave_tree()
             else:
                 assert isinstance(trans, Branch), trans
                 if choice_type != trans.choice_type or constraints != trans.constraints:
@@ -1120,7 +1354,10 @@ class TreeRecordingObserver(DataObserver):
                 try:
                     self._current_node = trans.children[value]
                 except KeyError:
-                    self._current_node = trans.children.setdefault(value, TreeNode())
+                    self._current_node = trans.children.setdefault(
+                        value, self._new_node()
+                    )
+                    self._tree.node_count += 1
                 self._index_in_current_node = 0
         if self._trail[-1] is not self._current_node:
             self._trail.append(self._current_node)
@@ -1132,6 +1369,12 @@ class TreeRecordingObserver(DataObserver):
 
         self.killed = True
 
+        if self._index_in_current_node == len(self._current_node.values) and (
+            isinstance(self._current_node.transition, Summarized)
+        ):
+            self._leave_tree()
+            return
+
         if self._index_in_current_node < len(self._current_node.values) or (
             self._current_node.transition is not None
             and not isinstance(self._current_node.transition, Killed)
@@ -1142,7 +1385,8 @@ class TreeRecordingObserver(DataObserver):
             )
 
         if self._current_node.transition is None:
-            self._current_node.transition = Killed(TreeNode())
+            self._current_node.transition = Killed(self._new_node())
+            self._tree.node_count += 1
             self.__update_exhausted()
 
         self._current_node = self._current_node.transition.next_node
@@ -1188,11 +1432,29 @@ class TreeRecordingObserver(DataObserver):
 
         assert node is self._trail[-1]
         node.check_exhausted()
-        assert len(node.values) > 0 or node.check_exhausted()
+        assert (
+            len(node.values) > 0
+            or node.check_exhausted()
+            or isinstance(node.transition, Summarized)
+        )
 
         if not self.killed:
             self.__update_exhausted()
 
+        tree = self._tree
+        if tree.max_nodes is not None and tree.node_count > tree.max_nodes:
+            tree.evict()
+
+    def _leave_tree(self) -> None:
+        # We have reached a summarized node, and so don't know what comes next.
+        # Record the rest of this test case into a node which isn't part of the
+        # tree, and so is simply discarded.
+        self._current_node = self._new_node()
+        self._index_in_current_node = 0
+
+    def _new_node(self) -> TreeNode:
+        return TreeNode(signatures=self._tree.signatures)
+
     def __update_exhausted(self) -> None:
         for t in reversed(self._trail):
             # Any node we've traversed might have now become exhausted.
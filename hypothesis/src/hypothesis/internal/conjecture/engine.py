@@ -12,8 +12,9 @@ import importlib
 import math
 import threading
 import time
+from bisect import bisect_left, insort
 from collections import defaultdict
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import timedelta
@@ -50,6 +51,7 @@ from hypothesis.internal.conjecture.data import (
     Overrun,
     Status,
     _Overrun,
+    draw_choice,
 )
 from hypothesis.internal.conjecture.datatree import (
     DataTree,
@@ -66,10 +68,26 @@ from hypothesis.internal.conjecture.providers import (
     HypothesisProvider,
     PrimitiveProvider,
 )
-from hypothesis.internal.conjecture.shrinker import Shrinker, ShrinkPredicateT, sort_key
+from hypothesis.internal.conjecture.shrinker import (
+    Shrinker,
+    ShrinkPass,
+    ShrinkPredicateT,
+    sort_key,
+)
+from hypothesis.internal.conjecture.workers import (
+    KillRecordingObserver,
+    WorkerPool,
+    WorkerResult,
+    can_fork_workers,
+)
 from hypothesis.internal.escalation import InterestingOrigin
 from hypothesis.internal.healthcheck import fail_health_check
-from hypothesis.internal.observability import Observation, with_observability_callback
+from hypothesis.internal.observability import (
+    Observation,
+    observability_enabled,
+    with_observability_callback,
+)
+from hypothesis.internal.scrutineer import Branch
 from hypothesis.reporting import base_report, report, verbose_report
 
 # In most cases, the following constants are all Final. However, we do allow users
@@ -101,6 +119,37 @@ MAX_SHRINKING_SECONDS: int = 300
 #: should not rely on it, except that a linear increase |BUFFER_SIZE| will linearly
 #: increase the amount of entropy a test case can use during generation.
 BUFFER_SIZE: int = 8 * 1024
+
+#: The maximum number of fully explored parts of the search space to remember
+#: between runs of a test, in the |settings.database|.  When this is positive, each
+#: run saves the shortest choice sequence prefixes under which every test case has
+#: already been tried, and later runs avoid generating test cases under those
+#: prefixes once they have reached them again.  Saved prefixes expire after a few
+#: runs, in case the code under test has changed.  This is zero by default, which
+#: disables it.
+MAX_EXPLORED_PREFIXES: int = 0
+
+# How many runs of a test may skip a saved explored prefix without exploring it
+# completely themselves.  The database key only identifies the test function,
+# so after the code under test changes, a region we skip may no longer be fully
+# explored; expiring saved prefixes makes sure we look at it again eventually.
+EXPLORED_PREFIX_RUNS = 10
+
+#: The maximum number of nodes that Hypothesis keeps in its record of which
+#: test cases have been tried.  When this is exceeded, Hypothesis replaces parts
+#: of the record (preferring fully explored parts) with a marker, which frees
+#: memory at the cost of sometimes generating a duplicate test case.  Set this to
+#: ``None`` to keep the whole record.
+MAX_TREE_NODES: int | None = 1_000_000
+
+#: Whether to guide generation by the branch coverage of the test function.
+#: When this is enabled, Hypothesis traces which branches each generated test
+#: case covers, keeps the test cases which covered a branch for the first time,
+#: and spends part of the generation phase mutating and splicing them together
+#: rather than generating entirely new test cases.  Tracing slows down each
+#: test case and is unavailable on PyPy, so this is disabled by default.
+COVERAGE_GUIDED: bool = False
+
 CACHE_SIZE: int = 10000
 MIN_TEST_CALLS: int = 10
 
@@ -178,6 +227,7 @@ class ExitReason(Enum):
     finished = "nothing left to do"
     flaky = "test was flaky"
     very_slow_shrinking = "shrinking was very slow"
+    shrink_time_budget = "settings.shrink_time_budget={s.shrink_time_budget}"
 
     def describe(self, settings: Settings) -> str:
         return self.value.format(s=settings)
@@ -212,6 +262,20 @@ class CallStats(TypedDict):
     events: list[str]
 
 
+ShrinkPassStatistics = TypedDict(
+    "ShrinkPassStatistics",
+    {
+        "calls": int,
+        "shrinks": int,
+        "deletions": int,
+        "runtime": float,
+        "test-runtime": float,
+        "cache-hits": int,
+        "simulated-calls": int,
+    },
+)
+
+
 PhaseStatistics = TypedDict(
     "PhaseStatistics",
     {
@@ -219,6 +283,7 @@ PhaseStatistics = TypedDict(
         "test-cases": list[CallStats],
         "distinct-failures": int,
         "shrinks-successful": int,
+        "shrink-passes": NotRequired[dict[str, ShrinkPassStatistics]],
     },
 )
 StatisticsDict = TypedDict(
@@ -235,6 +300,16 @@ StatisticsDict = TypedDict(
 )
 
 
+def _call_stats(data: ConjectureData) -> CallStats:
+    return {
+        "status": data.status.name.lower(),
+        "runtime": data.finish_time - data.start_time,
+        "drawtime": math.fsum(data.draw_times.values()),
+        "gctime": data.gc_finish_time - data.gc_start_time,
+        "events": sorted(k if v == "" else f"{k}: {v}" for k, v in data.events.items()),
+    }
+
+
 def choice_count(
     choices: Sequence[ChoiceT | ChoiceTemplate | ValueHole],
 ) -> int | None:
@@ -258,6 +333,110 @@ class DiscardObserver(DataObserver):
         raise ContainsDiscard
 
 
+CacheKey = tuple[ChoiceKeyT, ...]
+
+
+class PassingChoiceIndex:
+    """An index of the VALID results in the engine's data cache, so that we
+    can find every passing choice sequence with a given prefix without scanning
+    the whole cache.
+
+    Results are kept sorted by the serialized form of their choices. As
+    ``choices_to_bytes`` is self-delimiting, the results starting with some
+    prefix are then a contiguous run which we can find by bisection. Updates
+    are applied lazily, when the index is next queried, so that adding to and
+    evicting from the cache stays cheap.
+    """
+
+    def __init__(self) -> None:
+        self.__results: dict[CacheKey, ConjectureResult] = {}
+        self.__serialized: dict[CacheKey, bytes] = {}
+        self.__by_serialized: dict[bytes, CacheKey] = {}
+        self.__sorted: list[bytes] = []
+        self.__pending: set[CacheKey] = set()
+        # results whose choices we couldn't serialize, e.g. because they were
+        # produced by an alternative backend. We just check all of these.
+        self.__unindexed: set[CacheKey] = set()
+
+    def __len__(self) -> int:
+        return len(self.__results)
+
+    def add(self, key: CacheKey, result: ConjectureResult) -> None:
+        self.__results[key] = result
+        self.__pending.add(key)
+
+    def discard(self, key: CacheKey) -> None:
+        if self.__results.pop(key, None) is not None:
+            self.__pending.add(key)
+
+    def __sync(self) -> None:
+        for key in self.__pending:
+            if key in self.__results:
+                if key in self.__serialized or key in self.__unindexed:
+                    continue
+                try:
+                    serialized = choices_to_bytes(self.__results[key].choices)
+                except Exception:
+                    self.__unindexed.add(key)
+                    continue
+                self.__serialized[key] = serialized
+                self.__by_serialized[serialized] = key
+                insort(self.__sorted, serialized)
+            elif key in self.__serialized:
+                serialized = self.__serialized.pop(key)
+                del self.__by_serialized[serialized]
+                i = bisect_left(self.__sorted, serialized)
+                assert self.__sorted[i] == serialized
+                del self.__sorted[i]
+            else:
+                self.__unindexed.discard(key)
+        self.__pending.clear()
+
+    def with_prefix(self, prefix: Sequence[ChoiceNode]) -> list[ConjectureResult]:
+        """Returns every result in the index whose nodes start with ``prefix``."""
+        self.__sync()
+        candidates = [self.__results[key] for key in self.__unindexed]
+        try:
+            serialized_prefix = choices_to_bytes(node.value for node in prefix)
+        except Exception:
+            candidates.extend(self.__results.values())
+        else:
+            i = bisect_left(self.__sorted, serialized_prefix)
+            while i < len(self.__sorted) and self.__sorted[i].startswith(
+                serialized_prefix
+            ):
+                candidates.append(
+                    self.__results[self.__by_serialized[self.__sorted[i]]]
+                )
+                i += 1
+        # comparing serialized choices ignores constraints and forcing, which
+        # comparing the nodes themselves takes into account.
+        return [result for result in candidates if startswith(result.nodes, prefix)]
+
+
+class DataCache(LRUReusedCache[CacheKey, ConjectureResult | _Overrun]):
+    """The engine's cache of test results, which also maintains an index of
+    the passing results in it."""
+
+    __slots__ = ("passing",)
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__(max_size)
+        self.passing = PassingChoiceIndex()
+
+    def __setitem__(self, key: CacheKey, value: ConjectureResult | _Overrun) -> None:
+        super().__setitem__(key, value)
+        if value.status is Status.VALID:
+            self.passing.add(key, cast(ConjectureResult, value))
+        else:
+            self.passing.discard(key)
+
+    def on_evict(
+        self, key: CacheKey, value: ConjectureResult | _Overrun, score: object
+    ) -> None:
+        self.passing.discard(key)
+
+
 def realize_choices(data: ConjectureData, *, for_failure: bool) -> None:
     for node in data.nodes:
         value = data.provider.realize(node.value, for_failure=for_failure)
@@ -302,6 +481,13 @@ class ConjectureRunner:
         self.finish_shrinking_deadline: float | None = None
         self.call_count: int = 0
         self.misaligned_count: int = 0
+        # Lookups in cached_test_function which we answered from the cache, or
+        # by simulating the test function with the data tree, instead of
+        # calling the test function. Along with the total runtime of the test
+        # function, the shrinker uses these to profile its shrink passes.
+        self.cache_hit_count: int = 0
+        self.simulated_count: int = 0
+        self.test_function_runtime: float = 0.0
         self.valid_test_cases: int = 0
         self.invalid_test_cases: int = 0
         self.overrun_test_cases: int = 0
@@ -315,6 +501,7 @@ class ConjectureRunner:
         self._current_phase: str = "(not a phase)"
         self.statistics: StatisticsDict = {}
         self.stats_per_test_case: list[CallStats] = []
+        self.shrink_pass_statistics: dict[str, ShrinkPassStatistics] = {}
         # Time spent in any nested phase, so the enclosing phase can exclude it.
         self._nested_phase_seconds: float = 0.0
 
@@ -326,7 +513,19 @@ class ConjectureRunner:
 
         self.shrunk_test_cases: set[InterestingOrigin] = set()
         self.health_check_state: HealthCheckState | None = None
-        self.tree: DataTree = DataTree()
+        self.tree: DataTree = DataTree(max_nodes=MAX_TREE_NODES)
+        # Prefixes which a previous run of this test explored completely, as
+        # loaded from the database (see MAX_EXPLORED_PREFIXES). None if we have
+        # not loaded them.
+        self._saved_explored_prefixes: set[bytes] | None = None
+        # The saved prefixes, with how many more runs may skip them.
+        self._explored_prefixes: dict[
+            tuple[ChoiceKeyT, ...], tuple[tuple[ChoiceT, ...], int]
+        ] = {}
+        # The saved prefixes which this run has reached itself, and so still
+        # exist in the test as it is now. We only skip these.
+        self._reached_explored_prefixes: set[tuple[ChoiceKeyT, ...]] = set()
+        self._longest_explored_prefix: int = 0
         self.provider: PrimitiveProvider | type[PrimitiveProvider] = _get_provider(
             self.settings.backend
         )
@@ -336,6 +535,12 @@ class ConjectureRunner:
         )
         self.best_test_cases_of_observed_targets: dict[str, ConjectureResult] = {}
 
+        # State for coverage-guided generation (see COVERAGE_GUIDED): every
+        # branch of the test function we have seen covered, and the test cases
+        # which first covered each of them, in the order we found them.
+        self._covered_branches: set[Branch] = set()
+        self._coverage_corpus: list[ConjectureResult] = []
+
         # Scheduling state for the target phase. For large max_examples we
         # interleave repeated optimisation passes with generation, aiming to
         # spend up to half the budget on optimisation in total - see
@@ -357,9 +562,7 @@ class ConjectureRunner:
         # from running a choice sequence without recalculating, especially during
         # shrinking where we need to know about the structure of the
         # executed test case.
-        self.__data_cache = LRUReusedCache[
-            tuple[ChoiceKeyT, ...], ConjectureResult | _Overrun
-        ](CACHE_SIZE)
+        self.__data_cache = DataCache(CACHE_SIZE)
 
         self.reused_previously_shrunk_test_case: bool = False
 
@@ -371,6 +574,13 @@ class ConjectureRunner:
         self._verified_by_backend: str | None = None
         self._switch_to_hypothesis_provider: bool = False
 
+        # Created on first use if settings.workers > 1; see _get_worker_pool.
+        self._worker_pool: WorkerPool | None = None
+        self._worker_pool_unavailable: bool = self.settings.workers == 1
+        # Results of test cases run ahead of time by speculate, which we only
+        # count as calls once cached_test_function would have run them.
+        self.__speculated: dict[tuple[ChoiceKeyT, ...], WorkerResult] = {}
+
     @contextmanager
     def _with_switch_to_hypothesis_provider(
         self, value: bool
@@ -388,6 +598,16 @@ class ConjectureRunner:
             self.settings.backend == "hypothesis" or self._switch_to_hypothesis_provider
         )
 
+    @property
+    def collecting_coverage(self) -> bool:
+        """Whether test cases should currently record the branches of the test
+        function they cover, in ``ConjectureData.branches``."""
+        return (
+            COVERAGE_GUIDED
+            and self.using_hypothesis_backend
+            and self._current_phase in ("reuse", "generate")
+        )
+
     def explain_next_call_as(self, explanation: str) -> None:
         self.__pending_call_explanation = explanation
 
@@ -423,6 +643,8 @@ class ConjectureRunner:
             stats["test-cases"] += self.stats_per_test_case
             stats["distinct-failures"] = len(self.interesting_test_cases)
             stats["shrinks-successful"] = self.shrinks
+            if phase == "shrink" and self.shrink_pass_statistics:
+                stats["shrink-passes"] = self.shrink_pass_statistics
             self.stats_per_test_case = saved_stats
             self._current_phase = saved_phase
             self._nested_phase_seconds = saved_nested_seconds + elapsed
@@ -483,18 +705,20 @@ class ConjectureRunner:
         # node templates and value holes represent a not-yet-filled hole and
         # therefore cannot be cached or retrieved from the cache.
         has_value_hole = any(isinstance(choice, ValueHole) for choice in choices)
+        choices_key: tuple[ChoiceKeyT, ...] | None = None
         if not has_value_hole and not any(
             isinstance(choice, ChoiceTemplate) for choice in choices
         ):
             # this type cast is validated by the isinstance checks above (ie,
             # there are no ChoiceTemplate or ValueHole elements).
             choices = cast(Sequence[ChoiceT], choices)
-            key = self._cache_key(choices)
+            key = choices_key = self._cache_key(choices)
             try:
                 cached = self.__data_cache[key]
                 # if we have a cached overrun for this key, but we're allowing extensions
                 # of the nodes, it could in fact run to a valid data if we try.
                 if extend == 0 or cached.status is not Status.OVERRUN:
+                    self.cache_hit_count += 1
                     return cached
             except KeyError:
                 pass
@@ -533,7 +757,9 @@ class ConjectureRunner:
             key = self._cache_key(trial_data.choices)
             if trial_data.status > Status.OVERRUN:
                 try:
-                    return self.__data_cache[key]
+                    result = self.__data_cache[key]
+                    self.simulated_count += 1
+                    return result
                 except KeyError:
                     pass
             else:
@@ -541,12 +767,26 @@ class ConjectureRunner:
                 # an overrun; no need to consult the cache. (and we store this result
                 # for simulation-less lookup later).
                 self.__data_cache[key] = Overrun
+                self.simulated_count += 1
                 return Overrun
             try:
-                return self.__data_cache[key]
+                result = self.__data_cache[key]
+                self.simulated_count += 1
+                return result
             except KeyError:
                 pass
 
+        if (
+            extend == 0
+            and choices_key is not None
+            and (speculated := self.__speculated.pop(choices_key, None)) is not None
+            and self.__record_worker_result(speculated)
+        ):
+            assert speculated.result is not None
+            self.__data_cache[self._cache_key(speculated.choices)] = speculated.result
+            self.__exit_if_limits_reached()
+            return speculated.result
+
         data = self.new_conjecture_data(choices, max_choices=max_length)
         # note that calling test_function caches `data` for us.
         self.test_function(data)
@@ -643,17 +883,8 @@ class ConjectureRunner:
                         finally_early_return = True
 
                 if not finally_early_return:
-                    call_stats: CallStats = {
-                        "status": data.status.name.lower(),
-                        "runtime": data.finish_time - data.start_time,
-                        "drawtime": math.fsum(data.draw_times.values()),
-                        "gctime": data.gc_finish_time - data.gc_start_time,
-                        "events": sorted(
-                            k if v == "" else f"{k}: {v}"
-                            for k, v in data.events.items()
-                        ),
-                    }
-                    self.stats_per_test_case.append(call_stats)
+                    self.stats_per_test_case.append(_call_stats(data))
+                    self.test_function_runtime += data.finish_time - data.start_time
 
                     self._cache(data)
                     if (
@@ -665,6 +896,7 @@ class ConjectureRunner:
             return
 
         self.debug_data(data)
+        self._note_explored_prefixes_reached(data.choices)
 
         if (
             data.target_observations
@@ -696,6 +928,16 @@ class ConjectureRunner:
                     assert not isinstance(data_as_result, _Overrun)
                     self.best_test_cases_of_observed_targets[k] = data_as_result
 
+        if (
+            COVERAGE_GUIDED
+            and data.status >= Status.INVALID
+            and not data.branches.issubset(self._covered_branches)
+        ):
+            self._covered_branches.update(data.branches)
+            data_as_result = data.as_result()
+            assert not isinstance(data_as_result, _Overrun)
+            self._coverage_corpus.append(data_as_result)
+
         if data.status is Status.VALID:
             self.valid_test_cases += 1
         if data.status is Status.INVALID:
@@ -769,6 +1011,8 @@ class ConjectureRunner:
             and self.finish_shrinking_deadline is not None
             and self.finish_shrinking_deadline < time.perf_counter()
         ):
+            if self.settings.shrink_time_budget is not None:
+                self.exit_with(ExitReason.shrink_time_budget)
             # See https://github.com/HypothesisWorks/hypothesis/issues/2340
             report(
                 "WARNING: Hypothesis has spent more than five minutes working to shrink"
@@ -780,6 +1024,10 @@ class ConjectureRunner:
             )
             self.exit_with(ExitReason.very_slow_shrinking)
 
+        self.__exit_if_limits_reached()
+        self.record_for_health_check(data)
+
+    def __exit_if_limits_reached(self) -> None:
         if not self.interesting_test_cases:
             # Note that this logic is reproduced to end the generation phase when
             # we have interesting test cases.  Update that too if you change this!
@@ -795,8 +1043,6 @@ class ConjectureRunner:
         if self.__tree_is_exhausted():
             self.exit_with(ExitReason.finished)
 
-        self.record_for_health_check(data)
-
     def on_pareto_evict(self, data: ConjectureResult) -> None:
         self.settings.database.delete(self.pareto_key, choices_to_bytes(data.choices))
 
@@ -808,7 +1054,91 @@ class ConjectureRunner:
         least one novel prefix left to find. If there were not, then the
         test run should have already stopped due to tree exhaustion.
         """
-        return self.tree.generate_novel_prefix(self.random)
+        prefix = self.tree.generate_novel_prefix(self.random)
+        # Try to avoid parts of the search space which a previous run already
+        # explored, but don't insist - they may be all that is left.
+        for _ in range(10):
+            if not self._previously_explored(prefix):
+                break
+            prefix = self.tree.generate_novel_prefix(self.random)
+        return prefix
+
+    def _previously_explored(self, prefix: Sequence[ChoiceT]) -> bool:
+        if not self._reached_explored_prefixes:
+            return False
+        key = choices_key(prefix)
+        return any(
+            key[:i] in self._reached_explored_prefixes for i in range(1, len(key) + 1)
+        )
+
+    def _note_explored_prefixes_reached(self, choices: Sequence[ChoiceT]) -> None:
+        # A saved prefix describes a region of the test as it was when we saved
+        # it. We only trust it once this run has followed the same path, so
+        # that a prefix the test no longer reaches doesn't hide anything.
+        if len(self._reached_explored_prefixes) == len(self._explored_prefixes):
+            return
+        key = choices_key(choices[: self._longest_explored_prefix])
+        for i in range(1, len(key) + 1):
+            if key[:i] in self._explored_prefixes:
+                self._reached_explored_prefixes.add(key[:i])
+
+    def load_explored_prefixes(self) -> None:
+        if MAX_EXPLORED_PREFIXES <= 0 or self.database is None:
+            return
+        assert self.explored_key is not None
+        self._saved_explored_prefixes = set(self.database.fetch(self.explored_key))
+        for value in self._saved_explored_prefixes:
+            # Each entry is the number of runs which may still skip the prefix,
+            # followed by the prefix itself.
+            choices = choices_from_bytes(value[1:])
+            # entries which fail deserialization are cleared out when we save
+            if choices is not None and value[0] > 0:
+                self._explored_prefixes[choices_key(choices)] = (choices, value[0])
+                self._longest_explored_prefix = max(
+                    self._longest_explored_prefix, len(choices)
+                )
+
+    def save_explored_prefixes(self) -> None:
+        """Merge the parts of the search space which this run explored
+        completely with those saved by previous runs, and save the shortest
+        |MAX_EXPLORED_PREFIXES| of them to the database.
+
+        Prefixes saved by previous runs count down to expiry, while those
+        this run explored completely start again from EXPLORED_PREFIX_RUNS.
+        """
+        if self._saved_explored_prefixes is None:
+            return
+        assert self.database is not None
+        assert self.explored_key is not None
+        candidates: dict[tuple[ChoiceKeyT, ...], tuple[tuple[ChoiceT, ...], int]] = {
+            key: (choices, runs - 1)
+            for key, (choices, runs) in self._explored_prefixes.items()
+            if runs > 1
+        }
+        for prefix in self.tree.exhausted_prefixes():
+            candidates[choices_key(prefix)] = (prefix, EXPLORED_PREFIX_RUNS)
+        keep: set[bytes] = set()
+        keys: set[tuple[ChoiceKeyT, ...]] = set()
+        # shorter prefixes come first, so we skip any prefix which is already
+        # covered by one we have kept.
+        for key, (choices, runs) in sorted(
+            candidates.items(), key=lambda item: shortlex(choices_to_bytes(item[1][0]))
+        ):
+            if len(keep) >= MAX_EXPLORED_PREFIXES:
+                break
+            if any(key[:i] in keys for i in range(1, len(key))):
+                continue
+            keep.add(bytes([runs]) + choices_to_bytes(choices))
+            keys.add(key)
+
+        self.database.delete_many(
+            (self.explored_key, buffer)
+            for buffer in self._saved_explored_prefixes - keep
+        )
+        self.database.save_many(
+            (self.explored_key, buffer)
+            for buffer in keep - self._saved_explored_prefixes
+        )
 
     def record_for_health_check(self, data: ConjectureData) -> None:
         # Once we've actually found a bug, there's no point in trying to run
@@ -967,6 +1297,10 @@ class ConjectureRunner:
     def pareto_key(self) -> bytes | None:
         return self.sub_key(b"pareto")
 
+    @property
+    def explored_key(self) -> bytes | None:
+        return self.sub_key(b"explored")
+
     def debug(self, message: str) -> None:
         if self.settings.verbosity >= Verbosity.debug:
             base_report(message)
@@ -1013,7 +1347,14 @@ class ConjectureRunner:
             try:
                 self._run()
             except RunIsComplete:
-                pass
+                self.save_explored_prefixes()
+            finally:
+                if self._worker_pool is not None:
+                    self._worker_pool.close()
+                    self._worker_pool = None
+                if self.database is not None:
+                    # send any writes the database has buffered during this run
+                    self.database.flush()
             for v in self.interesting_test_cases.values():
                 self.debug_data(v)
             self.debug(
@@ -1055,78 +1396,100 @@ class ConjectureRunner:
             # interesting test cases, but there are a lot of them, so we down
             # sample the secondary corpus to a more manageable size.
 
-            corpus = sorted(
-                self.settings.database.fetch(self.database_key), key=shortlex
+            # Fetch all three corpora in one go, as this might be a single round
+            # trip rather than three for some databases. Deletions are similarly
+            # collected and flushed together once we are done.
+            assert self.database_key is not None
+            assert self.secondary_key is not None
+            assert self.pareto_key is not None
+            fetched = self.settings.database.fetch_many(
+                [self.database_key, self.secondary_key, self.pareto_key]
             )
-            factor = 0.1 if (Phase.generate in self.settings.phases) else 1
-            desired_size = max(2, ceil(factor * self.settings.max_examples))
-            primary_corpus_size = len(corpus)
+            to_delete: list[tuple[bytes, bytes]] = []
+            try:
+                self._reuse_corpora(fetched, to_delete)
+            finally:
+                if to_delete:
+                    self.settings.database.delete_many(to_delete)
+
+    def _reuse_corpora(
+        self,
+        fetched: dict[bytes, list[bytes]],
+        to_delete: list[tuple[bytes, bytes]],
+    ) -> None:
+        assert self.database_key is not None
+        assert self.secondary_key is not None
+        assert self.pareto_key is not None
+        corpus = sorted(fetched[self.database_key], key=shortlex)
+        factor = 0.1 if (Phase.generate in self.settings.phases) else 1
+        desired_size = max(2, ceil(factor * self.settings.max_examples))
+        primary_corpus_size = len(corpus)
 
-            if len(corpus) < desired_size:
-                extra_corpus = list(self.settings.database.fetch(self.secondary_key))
+        if len(corpus) < desired_size:
+            extra_corpus = list(fetched[self.secondary_key])
 
-                shortfall = desired_size - len(corpus)
+            shortfall = desired_size - len(corpus)
 
-                if len(extra_corpus) <= shortfall:
-                    extra = extra_corpus
-                else:
-                    extra = self.random.sample(extra_corpus, shortfall)
-                extra.sort(key=shortlex)
-                corpus.extend(extra)
+            if len(extra_corpus) <= shortfall:
+                extra = extra_corpus
+            else:
+                extra = self.random.sample(extra_corpus, shortfall)
+            extra.sort(key=shortlex)
+            corpus.extend(extra)
 
-            # We want a fast path where every primary entry in the database was
-            # interesting.
-            found_interesting_in_primary = False
-            all_interesting_in_primary_were_exact = True
+        # We want a fast path where every primary entry in the database was
+        # interesting.
+        found_interesting_in_primary = False
+        all_interesting_in_primary_were_exact = True
 
-            for i, existing in enumerate(corpus):
-                if i >= primary_corpus_size and found_interesting_in_primary:
+        for i, existing in enumerate(corpus):
+            if i >= primary_corpus_size and found_interesting_in_primary:
+                break
+            choices = choices_from_bytes(existing)
+            if choices is None:
+                # clear out any keys which fail deserialization
+                to_delete.append((self.database_key, existing))
+                continue
+            data = self.cached_test_function(choices, extend="full")
+            if data.status != Status.INTERESTING:
+                to_delete.append((self.database_key, existing))
+                to_delete.append((self.secondary_key, existing))
+            else:
+                if i < primary_corpus_size:
+                    found_interesting_in_primary = True
+                    assert not isinstance(data, _Overrun)
+                    if choices_key(choices) != choices_key(data.choices):
+                        all_interesting_in_primary_were_exact = False
+                if not self.settings.report_multiple_bugs:
                     break
+        if found_interesting_in_primary:
+            if all_interesting_in_primary_were_exact:
+                self.reused_previously_shrunk_test_case = True
+
+        # Because self.database is not None (because self.has_existing_test_cases())
+        # and self.database_key is not None (because we fetched using it above),
+        # we can guarantee self.pareto_front is not None
+        assert self.pareto_front is not None
+
+        # If we've not found any interesting test cases so far we try some of
+        # the pareto front from the last run.
+        if len(corpus) < desired_size and not self.interesting_test_cases:
+            desired_extra = desired_size - len(corpus)
+            pareto_corpus = list(fetched[self.pareto_key])
+            if len(pareto_corpus) > desired_extra:
+                pareto_corpus = self.random.sample(pareto_corpus, desired_extra)
+            pareto_corpus.sort(key=shortlex)
+
+            for existing in pareto_corpus:
                 choices = choices_from_bytes(existing)
                 if choices is None:
-                    # clear out any keys which fail deserialization
-                    self.settings.database.delete(self.database_key, existing)
+                    to_delete.append((self.pareto_key, existing))
                     continue
                 data = self.cached_test_function(choices, extend="full")
-                if data.status != Status.INTERESTING:
-                    self.settings.database.delete(self.database_key, existing)
-                    self.settings.database.delete(self.secondary_key, existing)
-                else:
-                    if i < primary_corpus_size:
-                        found_interesting_in_primary = True
-                        assert not isinstance(data, _Overrun)
-                        if choices_key(choices) != choices_key(data.choices):
-                            all_interesting_in_primary_were_exact = False
-                    if not self.settings.report_multiple_bugs:
-                        break
-            if found_interesting_in_primary:
-                if all_interesting_in_primary_were_exact:
-                    self.reused_previously_shrunk_test_case = True
-
-            # Because self.database is not None (because self.has_existing_test_cases())
-            # and self.database_key is not None (because we fetched using it above),
-            # we can guarantee self.pareto_front is not None
-            assert self.pareto_front is not None
-
-            # If we've not found any interesting test cases so far we try some of
-            # the pareto front from the last run.
-            if len(corpus) < desired_size and not self.interesting_test_cases:
-                desired_extra = desired_size - len(corpus)
-                pareto_corpus = list(self.settings.database.fetch(self.pareto_key))
-                if len(pareto_corpus) > desired_extra:
-                    pareto_corpus = self.random.sample(pareto_corpus, desired_extra)
-                pareto_corpus.sort(key=shortlex)
-
-                for existing in pareto_corpus:
-                    choices = choices_from_bytes(existing)
-                    if choices is None:
-                        self.settings.database.delete(self.pareto_key, existing)
-                        continue
-                    data = self.cached_test_function(choices, extend="full")
-                    if data not in self.pareto_front:
-                        self.settings.database.delete(self.pareto_key, existing)
-                    if data.status == Status.INTERESTING:
-                        break
+                if data not in self.pareto_front:
+                    to_delete.append((self.pareto_key, existing))
+                if data.status == Status.INTERESTING:
+                    break
 
     def exit_with(self, reason: ExitReason) -> None:
         if self.ignore_limits:
@@ -1188,6 +1551,7 @@ class ConjectureRunner:
             return
 
         self.debug("Generating new test cases")
+        self.load_explored_prefixes()
 
         assert self.should_generate_more()
         self._switch_to_hypothesis_provider = True
@@ -1297,6 +1661,16 @@ class ConjectureRunner:
                 continue
 
             self._current_phase = "generate"
+            if (
+                self._coverage_corpus
+                and self.health_check_state is None
+                and self.random.random() < 0.5
+            ):
+                self.mutate_coverage_corpus()
+                if self._should_optimise_now():
+                    self._run_optimise_pass()
+                continue
+
             prefix = self.generate_novel_prefix()
             if (
                 self.valid_test_cases <= small_test_case_cap
@@ -1348,6 +1722,13 @@ class ConjectureRunner:
                 prefix = trial_data.choices
             else:
                 max_length = None
+                if self.health_check_state is None and (
+                    (pool := self._get_worker_pool()) is not None
+                ):
+                    self._generate_in_workers(pool)
+                    if self._should_optimise_now():
+                        self._run_optimise_pass()
+                    continue
 
             data = self.new_conjecture_data(prefix, max_choices=max_length)
             self.test_function(data)
@@ -1372,6 +1753,191 @@ class ConjectureRunner:
             if self._should_optimise_now():
                 self._run_optimise_pass()
 
+    def _get_worker_pool(self) -> WorkerPool | None:
+        """Return a pool of worker processes to run test cases in, or None if
+        we should run them in this process instead."""
+        if self._worker_pool is None and not self._worker_pool_unavailable:
+            # Workers run test cases with the Hypothesis backend only, and
+            # observations must all be delivered from this process.
+            # Likewise branch coverage, for coverage-guided generation.
+            if (
+                self.settings.backend != "hypothesis"
+                or observability_enabled()
+                or COVERAGE_GUIDED
+                or not can_fork_workers()
+            ):
+                self._worker_pool_unavailable = True
+                self.debug("Worker processes unavailable; running test cases serially")
+            else:
+                self.debug(f"Starting {self.settings.workers} worker processes")
+                self._worker_pool = WorkerPool(self, self.settings.workers)
+        return self._worker_pool
+
+    def run_in_worker(
+        self,
+        prefix: Sequence[ChoiceT],
+        *,
+        seed: int,
+        max_choices: int | None = None,
+        with_result: bool = False,
+    ) -> WorkerResult:
+        """Run the test function on ``prefix`` inside a worker process, and
+        summarise the result for the coordinating process.
+
+        This deliberately touches none of the runner's state - the worker's
+        copy of it is thrown away - and never raises. Any error from the test
+        function is left for the coordinator to reproduce when it replays the
+        test case.
+        """
+        observer = KillRecordingObserver()
+        data = ConjectureData(
+            prefix=prefix,
+            random=Random(seed),
+            observer=observer,
+            provider=HypothesisProvider,
+            max_choices=max_choices,
+        )
+        errored = False
+        try:
+            self.__stoppable_test_function(data)
+        except BaseException:
+            errored = True
+        data.freeze()
+        needs_replay = errored or data.status is Status.INTERESTING
+        return WorkerResult(
+            nodes=data.nodes,
+            status=data.status,
+            killed_at=observer.killed_at,
+            target_observations=dict(data.target_observations),
+            call_stats=_call_stats(data),
+            needs_replay=needs_replay,
+            result=data.as_result() if with_result and not needs_replay else None,
+        )
+
+    def _generate_in_workers(self, pool: WorkerPool) -> None:
+        prefixes: dict[tuple[ChoiceKeyT, ...], tuple[ChoiceT, ...]] = {}
+        for _ in range(2 * pool.workers):
+            prefix = self.generate_novel_prefix()
+            prefixes.setdefault(self._cache_key(prefix), prefix)
+        test_cases = [
+            (prefix, self.random.getrandbits(64), None) for prefix in prefixes.values()
+        ]
+        for result in pool.run(test_cases, with_results=True):
+            data = self._incorporate_worker_result(result)
+            # Mutations are run here rather than in a worker, as they depend
+            # on the coordinator's random state and on each other's results.
+            if not isinstance(data, _Overrun):
+                self.generate_mutations_from(data)
+            if not self.should_generate_more():
+                break
+
+    def _incorporate_worker_result(
+        self, result: WorkerResult
+    ) -> ConjectureData | ConjectureResult | _Overrun:
+        """Update our state with a test case which was run in a worker process,
+        as if it had been run by ``test_function``, and return its result."""
+        if (
+            result.needs_replay
+            or (result.target_observations and self.pareto_front is not None)
+            or any(
+                v > self.best_observed_targets[k]
+                for k, v in result.target_observations.items()
+            )
+            or not self.__record_worker_result(result)
+        ):
+            # Failures, new best targets, and so on need more bookkeeping than
+            # a worker can report, so we just run the test case again here.
+            # The same goes for test cases where the worker disagreed with
+            # our tree, i.e. the test is flaky, so that the usual error
+            # reporting kicks in.
+            data = self.new_conjecture_data(result.choices)
+            self.test_function(data)
+            return data
+        assert result.result is not None
+        self.__data_cache[self._cache_key(result.choices)] = result.result
+        self.__exit_if_limits_reached()
+        return result.result
+
+    def __record_worker_result(self, result: WorkerResult) -> bool:
+        assert not result.needs_replay
+        try:
+            result.record_in(self.tree.new_observer())
+        except HypothesisException:
+            return False
+
+        self.call_count += 1
+        self.stats_per_test_case.append(result.call_stats)
+        self._note_explored_prefixes_reached(result.choices)
+        if result.status is Status.VALID:
+            self.valid_test_cases += 1
+        elif result.status is Status.INVALID:
+            self.invalid_test_cases += 1
+        elif result.status is Status.OVERRUN:
+            self.overrun_test_cases += 1
+        return True
+
+    @property
+    def can_speculate(self) -> bool:
+        """Whether ``speculate`` can run test cases in worker processes."""
+        return self._get_worker_pool() is not None
+
+    def speculate(self, candidates: Sequence[Sequence[ChoiceT]]) -> None:
+        """Run each of ``candidates`` in worker processes ahead of time, so that
+        later calls to ``cached_test_function`` can use their results instead
+        of running the test function.
+
+        A result only counts as a call, and is only recorded in the tree and
+        cache, when ``cached_test_function`` would otherwise have run it. This
+        keeps call counts - and so every limit based on them - the same as
+        without speculation. Interesting test cases are not kept, because they
+        need the full bookkeeping of ``test_function``, and results left over
+        from an earlier batch are dropped.
+        """
+        pool = self._get_worker_pool()
+        assert pool is not None
+        todo: dict[tuple[ChoiceKeyT, ...], Sequence[ChoiceT]] = {}
+        for choices in candidates:
+            key = self._cache_key(choices)
+            if key not in self.__data_cache:
+                todo.setdefault(key, choices)
+        # There is no novel part of these test cases to generate randomly, so
+        # we use a fixed seed rather than disturbing self.random.
+        results = pool.run(
+            [(choices, 0, len(choices)) for choices in todo.values()],
+            with_results=True,
+        )
+        self.__speculated = {
+            key: result
+            for key, result in zip(todo, results, strict=True)
+            if not result.needs_replay
+        }
+
+    def mutate_coverage_corpus(self) -> None:
+        """Run a test case derived from those which first covered some branch
+        of the test function (see COVERAGE_GUIDED).
+
+        We either splice the start of one such test case onto the end of
+        another, or redraw a single choice of one of them at random.  Either
+        way, whatever choices the mutated test case needs after those we have
+        are generated as usual.
+        """
+        entry = self.random.choice(self._coverage_corpus)
+        if len(self._coverage_corpus) > 1 and self.random.random() < 0.5:
+            other = self.random.choice(self._coverage_corpus)
+            i = self.random.randint(0, len(entry.choices))
+            j = self.random.randint(0, len(other.choices))
+            attempt = entry.choices[:i] + other.choices[j:]
+        else:
+            indices = [i for i, node in enumerate(entry.nodes) if not node.was_forced]
+            if not indices:
+                self.test_function(self.new_conjecture_data([]))
+                return
+            i = self.random.choice(indices)
+            node = entry.nodes[i]
+            value = draw_choice(node.type, node.constraints, random=self.random)
+            attempt = entry.choices[:i] + (value,) + entry.choices[i + 1 :]
+        self.cached_test_function(attempt, extend="full")
+
     def generate_mutations_from(self, data: ConjectureData | ConjectureResult) -> None:
         # A thing that is often useful but rarely happens by accident is
         # to generate the same value at multiple different points in the
@@ -1686,7 +2252,10 @@ class ConjectureRunner:
             return
 
         self.debug("Shrinking failing test cases")
-        self.finish_shrinking_deadline = time.perf_counter() + MAX_SHRINKING_SECONDS
+        budget = self.settings.shrink_time_budget
+        self.finish_shrinking_deadline = time.perf_counter() + (
+            MAX_SHRINKING_SECONDS if budget is None else budget.total_seconds()
+        )
 
         for prev_data in sorted(
             self.interesting_test_cases.values(), key=lambda d: sort_key(d.nodes)
@@ -1735,26 +2304,32 @@ class ConjectureRunner:
 
             # It's not worth trying the primary corpus because we already
             # tried all of those in the initial phase.
+            assert self.secondary_key is not None
             corpus = sorted(
                 self.settings.database.fetch(self.secondary_key), key=shortlex
             )
-            for c in corpus:
-                choices = choices_from_bytes(c)
-                if choices is None:
-                    self.settings.database.delete(self.secondary_key, c)
-                    continue
-                primary = {
-                    choices_to_bytes(v.choices)
-                    for v in self.interesting_test_cases.values()
-                }
-                if shortlex(c) > max(map(shortlex, primary)):
-                    break
+            to_delete: list[tuple[bytes, bytes]] = []
+            try:
+                for c in corpus:
+                    choices = choices_from_bytes(c)
+                    if choices is None:
+                        to_delete.append((self.secondary_key, c))
+                        continue
+                    primary = {
+                        choices_to_bytes(v.choices)
+                        for v in self.interesting_test_cases.values()
+                    }
+                    if shortlex(c) > max(map(shortlex, primary)):
+                        break
 
-                self.cached_test_function(choices)
-                # We unconditionally remove c from the secondary key as it
-                # is either now primary or worse than our primary test case
-                # for this reason for interestingness.
-                self.settings.database.delete(self.secondary_key, c)
+                    self.cached_test_function(choices)
+                    # We unconditionally remove c from the secondary key as it
+                    # is either now primary or worse than our primary test case
+                    # for this reason for interestingness.
+                    to_delete.append((self.secondary_key, c))
+            finally:
+                if to_delete:
+                    self.settings.database.delete_many(to_delete)
 
     def shrink(
         self,
@@ -1765,9 +2340,40 @@ class ConjectureRunner:
         ) = None,
     ) -> ConjectureData | ConjectureResult:
         s = self.new_shrinker(initial, predicate, allow_transition)
-        s.shrink()
+        try:
+            s.shrink()
+        finally:
+            if self._current_phase == "shrink":
+                self.record_shrink_pass_statistics(s.shrink_passes)
         return s.shrink_target
 
+    def record_shrink_pass_statistics(self, passes: Iterable[ShrinkPass]) -> None:
+        """Add the profile of each shrink pass which ran to the statistics for
+        the shrink phase, summing over every shrink in this run."""
+        for sp in passes:
+            if sp.calls == 0 and sp.cache_hits == 0 and sp.simulated == 0:
+                continue
+            assert sp.name is not None
+            stats = self.shrink_pass_statistics.setdefault(
+                sp.name,
+                {
+                    "calls": 0,
+                    "shrinks": 0,
+                    "deletions": 0,
+                    "runtime": 0.0,
+                    "test-runtime": 0.0,
+                    "cache-hits": 0,
+                    "simulated-calls": 0,
+                },
+            )
+            stats["calls"] += sp.calls
+            stats["shrinks"] += sp.shrinks
+            stats["deletions"] += sp.deletions
+            stats["runtime"] += sp.runtime
+            stats["test-runtime"] += sp.test_runtime
+            stats["cache-hits"] += sp.cache_hits
+            stats["simulated-calls"] += sp.simulated
+
     def new_shrinker(
         self,
         initial: ConjectureData | ConjectureResult,
@@ -1792,10 +2398,7 @@ class ConjectureRunner:
         Optionally restrict this by a certain prefix, which is useful for explain mode.
         """
         return frozenset(
-            cast(ConjectureResult, result).nodes
-            for key in self.__data_cache
-            if (result := self.__data_cache[key]).status is Status.VALID
-            and startswith(cast(ConjectureResult, result).nodes, prefix)
+            result.nodes for result in self.__data_cache.passing.with_prefix(prefix)
         )
 
 
@@ -425,6 +425,31 @@ def run_conformance_test(
 
                 return choice
 
+            def _draw_many(self, choice_type, constraints, n):
+                del constraints["forced"]
+                draw_func = getattr(self.provider, f"draw_{choice_type}s")
+
+                try:
+                    choices = draw_func(n, **constraints)
+                    note(f"drew {n} {choice_type}s {choices}")
+                    assert len(choices) == n
+                    expected_type = {
+                        "integer": int,
+                        "float": float,
+                        "boolean": bool,
+                    }[choice_type]
+                    for choice in choices:
+                        assert isinstance(choice, expected_type)
+                        assert choice_permitted(choice, constraints)
+                except context_manager_exceptions as e:
+                    note(
+                        f"caught exception {type(e)} in context_manager_exceptions: {e}"
+                    )
+                    try:
+                        self.context_manager.__exit__(type(e), e, None)
+                    except BackendCannotProceed:
+                        self.frozen = True
+
             @precondition(lambda self: not self.frozen)
             @rule(constraints=integer_constraints())
             def draw_integer(self, constraints):
@@ -450,6 +475,21 @@ def run_conformance_test(
             def draw_boolean(self, constraints):
                 self._draw("boolean", constraints)
 
+            @precondition(lambda self: not self.frozen)
+            @rule(constraints=integer_constraints(), n=st.integers(0, 5))
+            def draw_integers(self, constraints, n):
+                self._draw_many("integer", constraints, n)
+
+            @precondition(lambda self: not self.frozen)
+            @rule(constraints=float_constraints(), n=st.integers(0, 5))
+            def draw_floats(self, constraints, n):
+                self._draw_many("float", constraints, n)
+
+            @precondition(lambda self: not self.frozen)
+            @rule(constraints=boolean_constraints(), n=st.integers(0, 5))
+            def draw_booleans(self, constraints, n):
+                self._draw_many("boolean", constraints, n)
+
             @precondition(lambda self: not self.frozen)
             @rule(label=st.integers())
             def span_start(self, label):
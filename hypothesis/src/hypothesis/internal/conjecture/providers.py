@@ -13,7 +13,7 @@ import contextlib
 import math
 import sys
 import warnings
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from contextlib import AbstractContextManager, contextmanager
 from functools import cached_property
 from random import Random
@@ -39,6 +39,7 @@ from hypothesis.internal.conjecture.choice import (
     ChoiceT,
     ChoiceTypeT,
     FloatConstraints,
+    IntegerConstraints,
     choice_constraints_key,
     choice_permitted,
 )
@@ -131,9 +132,11 @@ AVAILABLE_PROVIDERS: dict[str, str | type["PrimitiveProvider"]] = {
     "hypothesis": "hypothesis.internal.conjecture.providers.HypothesisProvider",
     "hypothesis-urandom": "hypothesis.internal.conjecture.providers.URandomProvider",
 }
-# cache the choice_permitted constants for a particular set of constraints.
+# cache the choice_permitted constants for a particular set of constraints, and
+# the number of batches of new local constants of that choice type which the
+# local pool includes (see _local_constants_added).
 CacheKeyT: TypeAlias = tuple[ChoiceTypeT, tuple[Any, ...]]
-CacheValueT: TypeAlias = tuple[tuple["ConstantT", ...], tuple["ConstantT", ...]]
+CacheValueT: TypeAlias = tuple[tuple["ConstantT", ...], tuple["ConstantT", ...], int]
 CONSTANTS_CACHE: LRUCache[CacheKeyT, CacheValueT] = LRUCache(1024)
 
 
@@ -320,6 +323,16 @@ _local_constants = Constants(
 # in the standard case.
 _seen_modules: set[int] = set()
 _sys_modules_len: int | None = None
+# Local constants are only ever added, never removed.  We log each batch of
+# additions by choice type, so that a pool in CONSTANTS_CACHE can be brought up
+# to date by checking just the constants added since it was computed, instead
+# of every pool being thrown away whenever we find a new constant.
+_local_constants_added: dict[ChoiceTypeT, list[tuple["ConstantT", ...]]] = {
+    "integer": [],
+    "float": [],
+    "bytes": [],
+    "string": [],
+}
 
 
 def _get_local_constants() -> Constants:
@@ -336,7 +349,6 @@ def _get_local_constants() -> Constants:
         # ModuleLocation for pyodide instead of this.
         return _local_constants
 
-    count_constants = len(_local_constants)
     # We call this function once per HypothesisProvider instance, i.e. once per
     # input, so it needs to be performant. The logic here is more complicated
     # than necessary because of this.
@@ -368,18 +380,55 @@ def _get_local_constants() -> Constants:
             ) is not None and is_local_module_file(module_file):
                 new_constants |= constants_from_module(module)
             _seen_modules.add(id(module))
+        added = {
+            choice_type: tuple(
+                constant
+                for constant in new_constants.set_for_type(choice_type)
+                if constant not in _local_constants.set_for_type(choice_type)
+            )
+            for choice_type in _local_constants_added
+        }
         _local_constants |= new_constants
+        for choice_type, constants in added.items():
+            if constants:
+                _local_constants_added[choice_type].append(constants)
         _sys_modules_len = sys_modules_len
 
-    # if we add any new constant, invalidate the constant cache for permitted values.
-    # A more efficient approach would be invalidating just the keys with this
-    # choice_type.
-    if len(_local_constants) > count_constants:
-        CONSTANTS_CACHE.cache.clear()
-
     return _local_constants
 
 
+def _sorted_constants(
+    choice_type: ChoiceTypeT, constants: Iterable["ConstantT"]
+) -> tuple["ConstantT", ...]:
+    # local constant pools are always in this order, however they were built,
+    # so that which constant we draw depends only on the random choice and not
+    # on the history of CONSTANTS_CACHE.
+    return tuple(
+        sorted(
+            dict.fromkeys(constants),
+            key=float_to_int if choice_type == "float" else None,
+        )
+    )
+
+
+def _permitted_local_constants(
+    choice_type: ChoiceTypeT,
+    constraints: ChoiceConstraintsT,
+    cached: tuple["ConstantT", ...],
+    batches_seen: int,
+) -> tuple["ConstantT", ...]:
+    # merge the constants added since `cached` was computed into it.
+    new = [
+        constant
+        for batch in _local_constants_added[choice_type][batches_seen:]
+        for constant in batch
+        if choice_permitted(constant, constraints)
+    ]
+    if not new:
+        return cached
+    return _sorted_constants(choice_type, (*cached, *new))
+
+
 @contextmanager
 def with_register_backend(name, provider_cls):
     try:
@@ -416,6 +465,11 @@ class PrimitiveProvider(abc.ABC):
     from these five methods. By overriding them, a |PrimitiveProvider| can control
     the distribution of inputs generated by Hypothesis.
 
+    A |PrimitiveProvider| may also override the batched
+    |PrimitiveProvider.draw_booleans|, |PrimitiveProvider.draw_integers|, and
+    |PrimitiveProvider.draw_floats| methods, which by default call the
+    corresponding single ``draw_*`` method once per choice.
+
     For example, :pypi:`hypothesis-crosshair` implements a |PrimitiveProvider|
     which uses an SMT solver to generate inputs that uncover new branches.
 
@@ -579,6 +633,61 @@ class PrimitiveProvider(abc.ABC):
         """
         raise NotImplementedError
 
+    def draw_booleans(self, n: int, p: float = 0.5) -> list[bool]:
+        """
+        Draw ``n`` boolean choices, as if by calling
+        |PrimitiveProvider.draw_boolean| ``n`` times with the same arguments.
+
+        Hypothesis calls this and the other batched ``draw_*`` methods when a
+        strategy draws many choices with the same constraints at once. The
+        default implementation does exactly that, so providers only need to
+        override these methods if they can draw a batch more efficiently.
+        """
+        return [self.draw_boolean(p) for _ in range(n)]
+
+    def draw_integers(
+        self,
+        n: int,
+        min_value: int | None = None,
+        max_value: int | None = None,
+        *,
+        weights: dict[int, float] | None = None,
+        shrink_towards: int = 0,
+    ) -> list[int]:
+        """
+        Draw ``n`` integer choices, as if by calling
+        |PrimitiveProvider.draw_integer| ``n`` times with the same arguments.
+        """
+        return [
+            self.draw_integer(
+                min_value, max_value, weights=weights, shrink_towards=shrink_towards
+            )
+            for _ in range(n)
+        ]
+
+    def draw_floats(
+        self,
+        n: int,
+        *,
+        min_value: float = -math.inf,
+        max_value: float = math.inf,
+        allow_nan: bool = True,
+        smallest_nonzero_magnitude: float,
+    ) -> list[float]:
+        """
+        Draw ``n`` float choices, as if by calling |PrimitiveProvider.draw_float|
+        ``n`` times with the same arguments.
+        """
+        return [
+            self.draw_float(
+                min_value=min_value,
+                max_value=max_value,
+                allow_nan=allow_nan,
+                smallest_nonzero_magnitude=smallest_nonzero_magnitude,
+            )
+            for _ in range(n)
+        ]
+
     def per_test_case_context_manager(self) -> AbstractContextManager:
         """
         Returns a context manager which will be entered each time Hypothesis
@@ -764,7 +873,14 @@ class HypothesisProvider(PrimitiveProvider):
     @cached_property
     def _local_constants(self):
         # defer computation of local constants until/if we need it
-        return _get_local_constants()
+        constants = _get_local_constants()
+        # how many batches of _local_constants_added these constants include,
+        # so that pools computed from them can be brought up to date later.
+        self._local_constants_batches = {
+            choice_type: len(added)
+            for choice_type, added in _local_constants_added.items()
+        }
+        return constants
 
     def _maybe_draw_constant(
         self,
@@ -784,6 +900,7 @@ class HypothesisProvider(PrimitiveProvider):
         assert self._local_constants is not None
 
         key = (choice_type, choice_constraints_key(choice_type, constraints))
+        batches = len(_local_constants_added[choice_type])
         if key not in CONSTANTS_CACHE:
             CONSTANTS_CACHE[key] = (
                 tuple(
@@ -791,16 +908,25 @@ class HypothesisProvider(PrimitiveProvider):
                     for choice in GLOBAL_CONSTANTS.set_for_type(choice_type)
                     if choice_permitted(choice, constraints)
                 ),
-                tuple(
-                    choice
-                    for choice in self._local_constants.set_for_type(choice_type)
-                    if choice_permitted(choice, constraints)
+                _sorted_constants(
+                    choice_type,
+                    (
+                        choice
+                        for choice in self._local_constants.set_for_type(choice_type)
+                        if choice_permitted(choice, constraints)
+                    ),
                 ),
+                self._local_constants_batches[choice_type],
             )
 
         # split constants into two pools, so we still have a good chance to draw
         # global constants even if there are many local constants.
-        global_constants, local_constants = CONSTANTS_CACHE[key]
+        global_constants, local_constants, batches_seen = CONSTANTS_CACHE[key]
+        if batches_seen < batches:
+            local_constants = _permitted_local_constants(
+                choice_type, constraints, local_constants, batches_seen
+            )
+            CONSTANTS_CACHE[key] = (global_constants, local_constants, batches)
         constants_lists = ([global_constants] if global_constants else []) + (
             [local_constants] if local_constants else []
         )
@@ -828,6 +954,17 @@ class HypothesisProvider(PrimitiveProvider):
 
         return self._random.random() < p
 
+    def draw_booleans(self, n: int, p: float = 0.5) -> list[bool]:
+        assert self._random is not None
+
+        if p <= 0:
+            return [False] * n
+        if p >= 1:
+            return [True] * n
+
+        random = self._random.random
+        return [random() < p for _ in range(n)]
+
     def draw_integer(
         self,
         min_value: int | None = None,
@@ -877,10 +1014,65 @@ class HypothesisProvider(PrimitiveProvider):
 
         return self._draw_integer_from_distribution(min_value, max_value)
 
+    def draw_integers(
+        self,
+        n: int,
+        min_value: int | None = None,
+        max_value: int | None = None,
+        *,
+        weights: dict[int, float] | None = None,
+        shrink_towards: int = 0,
+    ) -> list[int]:
+        assert self._cd is not None
+        constraints: IntegerConstraints = {
+            "min_value": min_value,
+            "max_value": max_value,
+            "weights": weights,
+            "shrink_towards": shrink_towards,
+        }
+        sampler = None
+        if weights is not None:
+            assert min_value is not None
+            assert max_value is not None
+
+            # see draw_integer for the interpretation of weights.
+            sampler = Sampler(
+                [1 - sum(weights.values()), *weights.values()], observe=False
+            )
+        # the parts of the distribution which don't depend on the random draw are
+        # computed once per batch, rather than once per integer.
+        bounds = self._integer_distribution_bounds(min_value, max_value)
+
+        result = []
+        for _ in range(n):
+            if (
+                constant := self._maybe_draw_constant("integer", constraints)
+            ) is not None:
+                assert isinstance(constant, int)
+                result.append(constant)
+                continue
+
+            if sampler is not None:
+                assert weights is not None
+                idx = sampler.sample(self._cd)
+                if idx != 0:
+                    # implicit reliance on dicts being sorted for determinism
+                    result.append(list(weights)[idx - 1])
+                    continue
+
+            result.append(self._sample_integer(*bounds))
+        return result
+
     def _draw_integer_from_distribution(
         self, min_value: int | None, max_value: int | None
     ) -> int:
-        assert self._random is not None
+        return self._sample_integer(
+            *self._integer_distribution_bounds(min_value, max_value)
+        )
+
+    def _integer_distribution_bounds(
+        self, min_value: int | None, max_value: int | None
+    ) -> tuple[int, int, float, float, bool]:
         dist = INTEGERS_DISTRIBUTION
 
         # Our integers distribution is defined over the full float64 range. If the user
@@ -932,6 +1124,14 @@ class HypothesisProvider(PrimitiveProvider):
             if hi - lo < 1e-13:
                 safe_bounds = False
 
+        return (min_value, max_value, lo, hi, safe_bounds)
+
+    def _sample_integer(
+        self, min_value: int, max_value: int, lo: float, hi: float, safe_bounds: bool
+    ) -> int:
+        assert self._random is not None
+        dist = INTEGERS_DISTRIBUTION
+
         if safe_bounds:
             # inverse_cdf requires strictly 0 < p < 1. Resample until we get it.
             while (p := lo + self._random.random() * (hi - lo)) in {0, 1}:
@@ -969,9 +1169,68 @@ class HypothesisProvider(PrimitiveProvider):
             assert isinstance(constant, float)
             return constant
 
+        weird_floats = self._weird_floats(constraints)
+        if weird_floats and self._random.random() < 0.05:
+            return self._random.choice(weird_floats)
+
+        clamper = make_float_clamper(
+            min_value,
+            max_value,
+            smallest_nonzero_magnitude=smallest_nonzero_magnitude,
+            allow_nan=allow_nan,
+        )
+        return self._draw_clamped_float(clamper, allow_nan=allow_nan)
+
+    def draw_floats(
+        self,
+        n: int,
+        *,
+        min_value: float = -math.inf,
+        max_value: float = math.inf,
+        allow_nan: bool = True,
+        smallest_nonzero_magnitude: float,
+    ) -> list[float]:
+        assert self._random is not None
+
+        constraints: FloatConstraints = {
+            "min_value": min_value,
+            "max_value": max_value,
+            "allow_nan": allow_nan,
+            "smallest_nonzero_magnitude": smallest_nonzero_magnitude,
+        }
+        # the weird floats and the clamper only depend on the constraints, so
+        # we compute them once per batch rather than once per float.
+        weird_floats = self._weird_floats(constraints)
+        clamper = make_float_clamper(
+            min_value,
+            max_value,
+            smallest_nonzero_magnitude=smallest_nonzero_magnitude,
+            allow_nan=allow_nan,
+        )
+
+        results = []
+        for _ in range(n):
+            if (
+                constant := self._maybe_draw_constant("float", constraints, p=0.15)
+            ) is not None:
+                assert isinstance(constant, float)
+                results.append(constant)
+                continue
+
+            if weird_floats and self._random.random() < 0.05:
+                results.append(self._random.choice(weird_floats))
+                continue
+
+            results.append(self._draw_clamped_float(clamper, allow_nan=allow_nan))
+        return results
+
+    @staticmethod
+    def _weird_floats(constraints: FloatConstraints) -> list[float]:
         # on top of the probability to draw a constant float, we independently
         # upweight 0.0/-0.0, math.inf, -math.inf, nans, and boundary values.
-        weird_floats = [
+        min_value = constraints["min_value"]
+        max_value = constraints["max_value"]
+        return [
             f
             for f in [
                 0.0,
@@ -992,16 +1251,9 @@ class HypothesisProvider(PrimitiveProvider):
             if choice_permitted(f, constraints)
         ]
 
-        if weird_floats and self._random.random() < 0.05:
-            return self._random.choice(weird_floats)
-
-        clamper = make_float_clamper(
-            min_value,
-            max_value,
-            smallest_nonzero_magnitude=smallest_nonzero_magnitude,
-            allow_nan=allow_nan,
-        )
-
+    def _draw_clamped_float(
+        self, clamper: Callable[[float], float], *, allow_nan: bool
+    ) -> float:
         result = self._draw_float()
         if allow_nan and math.isnan(result):
             clamped = result  # pragma: no cover
@@ -8,7 +8,11 @@
 # v. 2.0. If a copy of the MPL was not distributed with this file, You can
 # obtain one at https://mozilla.org/MPL/2.0/.
 
+import copy
+import hashlib
+import json
 import math
+import time
 import unicodedata
 from collections import defaultdict
 from collections.abc import Callable, Iterator, Sequence
@@ -22,6 +26,7 @@ from typing import (
     cast,
 )
 
+from hypothesis.database import choices_to_bytes
 from hypothesis.internal.conjecture.choice import (
     ChoiceNode,
     ChoiceT,
@@ -60,6 +65,7 @@ from hypothesis.internal.conjecture.shrinking.choicetree import (
     prefix_selection_order,
     random_selection_order,
 )
+from hypothesis.internal.conjecture.shrinking.scheduler import ShrinkPassScheduler
 from hypothesis.internal.floats import MAX_PRECISE_INTEGER
 
 if TYPE_CHECKING:
@@ -133,6 +139,13 @@ class ShrinkPass:
     misaligned: int = 0
     shrinks: int = 0
     deletions: int = 0
+    # wall-clock seconds spent in this pass, and how much of that was spent in
+    # the test function. The remainder is overhead in the shrinker and engine.
+    runtime: float = 0.0
+    test_runtime: float = 0.0
+    # candidates answered from the cache or by simulation, without a call
+    cache_hits: int = 0
+    simulated: int = 0
 
     def __post_init__(self):
         if self.name is None:
@@ -142,10 +155,19 @@ class ShrinkPass:
         return hash(self.name)
 
 
+# How often a long-running shrink saves a checkpoint to the database, in
+# seconds. See Shrinker._save_checkpoint.
+CHECKPOINT_INTERVAL_SECONDS = 10
+
+
 class StopShrinking(Exception):
     pass
 
 
+class StopSpeculating(Exception):
+    pass
+
+
 class Shrinker:
     """A shrinker is a child object of a ConjectureRunner which is designed to
     manage the associated state of a particular shrink problem. That is, we
@@ -341,6 +363,7 @@ class Shrinker:
         self.calls_at_last_shrink = self.initial_calls
 
         self.shrink_passes: list[ShrinkPass] = [
+            ShrinkPass(self.delete_child_spans),
             ShrinkPass(self.try_trivial_spans),
             self.node_program("X" * 5),
             self.node_program("X" * 4),
@@ -363,6 +386,29 @@ class Shrinker:
         self.__extend: Literal["full"] | int = "full" if in_target_phase else 0
         self.should_explain = explain
 
+        # While speculating about the candidates a shrink pass will try (see
+        # speculate), this collects them instead of running the test function.
+        self.__speculative_candidates: dict[Any, Sequence[ChoiceNode]] | None = None
+
+        # Shrinks which are stopped before they finish save a checkpoint of
+        # their progress to the database, so that a later run which starts
+        # shrinking from the same target can resume where this one stopped.
+        self.__checkpoint_key = (
+            None
+            if in_target_phase or engine.settings.database is None
+            else engine.sub_key(b"shrinking")
+        )
+        self.__checkpoint: bytes | None = None
+        self.__last_checkpoint_time = time.perf_counter()
+        self.__coarse_reduction_done = False
+
+        # We order shrink passes and limit how long each may fail for based on
+        # how useful they have been in earlier shrinks of this test.
+        self.scheduler = ShrinkPassScheduler(
+            engine.settings.database,
+            None if in_target_phase else engine.sub_key(b"shrink-passes"),
+        )
+
     @derived_value  # type: ignore
     def cached_calculations(self):
         return {}
@@ -407,6 +453,14 @@ class Shrinker:
         if any(not choice_permitted(node.value, node.constraints) for node in nodes):
             return (False, None)
 
+        if self.__speculative_candidates is not None:
+            # Speculatively assume that this candidate fails to shrink, which
+            # is the common case, and see what we would have tried next.
+            self.__speculative_candidates.setdefault(
+                choices_key([n.value for n in nodes]), nodes
+            )
+            return (False, None)
+
         result = self.engine.cached_test_function(
             [n.value for n in nodes], extend=self.__extend
         )
@@ -444,14 +498,25 @@ class Shrinker:
         have any effect, though it has a non-zero probability of doing so.
         """
 
+        self.scheduler.order(self.shrink_passes)
+        self._resume_from_checkpoint()
+        finished = False
         try:
-            self.initial_coarse_reduction()
+            if not self.__coarse_reduction_done:
+                self.initial_coarse_reduction()
+                self.__coarse_reduction_done = True
             self.greedy_shrink()
+            finished = True
         except StopShrinking:
             # If we stopped shrinking because we're making slow progress (instead of
             # reaching a local optimum), don't run the explain-phase logic.
             self.should_explain = False
         finally:
+            if finished:
+                self._delete_checkpoint()
+            else:
+                self._save_checkpoint()
+            self.scheduler.record(self.shrink_passes)
             if self.engine.report_debug_info:
 
                 def s(n):
@@ -461,13 +526,17 @@ class Shrinker:
                 calls = self.engine.call_count - self.initial_calls
                 misaligned = self.engine.misaligned_count - self.initial_misaligned
 
+                runtime = sum(sp.runtime for sp in self.shrink_passes)
+                test_runtime = sum(sp.test_runtime for sp in self.shrink_passes)
                 self.debug(
                     "---------------------\n"
                     "Shrink pass profiling\n"
                     "---------------------\n\n"
                     f"Shrinking made a total of {calls} call{s(calls)} of which "
                     f"{self.shrinks} shrank and {misaligned} were misaligned. This "
-                    f"deleted {total_deleted} choices out of {self.initial_size}."
+                    f"deleted {total_deleted} choices out of {self.initial_size}. "
+                    f"Shrink passes took {runtime:.2f}s, of which {test_runtime:.2f}s "
+                    "was in the test function."
                 )
                 for useful in [True, False]:
                     self.debug("")
@@ -488,11 +557,95 @@ class Shrinker:
                         self.debug(
                             f"  * {pass_.name} made {pass_.calls} call{s(pass_.calls)} of which "
                             f"{pass_.shrinks} shrank and {pass_.misaligned} were misaligned, "
-                            f"deleting {pass_.deletions} choice{s(pass_.deletions)}."
+                            f"deleting {pass_.deletions} choice{s(pass_.deletions)}. "
+                            f"It took {pass_.runtime:.2f}s ({pass_.test_runtime:.2f}s "
+                            f"in the test function), and {pass_.cache_hits} cache "
+                            f"hit{s(pass_.cache_hits)} and {pass_.simulated} "
+                            f"simulation{s(pass_.simulated)} avoided calls."
                         )
                 self.debug("")
         self.explain()
 
+    def _target_digest(self) -> str:
+        return hashlib.sha1(choices_to_bytes(self.shrink_target.choices)).hexdigest()
+
+    def _save_checkpoint(self) -> None:
+        """Save the current shrink target, along with the order, position
+        (``last_prefix``), and exhaustion of each shrink pass for that target,
+        replacing any checkpoint we saved earlier."""
+        if self.__checkpoint_key is None:
+            return
+        trees = self.shrink_pass_choice_trees
+        value = json.dumps(
+            {
+                "target": self._target_digest(),
+                "coarse": self.__coarse_reduction_done,
+                "passes": [
+                    [sp.name, list(sp.last_prefix), sp in trees and trees[sp].exhausted]
+                    for sp in self.shrink_passes
+                ],
+            },
+            separators=(",", ":"),
+        ).encode()
+        if value != self.__checkpoint:
+            db = self.engine.settings.database
+            if self.__checkpoint is not None:
+                db.delete(self.__checkpoint_key, self.__checkpoint)
+            db.save(self.__checkpoint_key, value)
+            self.__checkpoint = value
+        self.__last_checkpoint_time = time.perf_counter()
+
+    def _delete_checkpoint(self) -> None:
+        if self.__checkpoint_key is not None and self.__checkpoint is not None:
+            self.engine.settings.database.delete(
+                self.__checkpoint_key, self.__checkpoint
+            )
+            self.__checkpoint = None
+
+    def _resume_from_checkpoint(self) -> None:
+        """Restore the state saved by ``_save_checkpoint`` if it was for our
+        initial shrink target, and delete checkpoints for targets which are no
+        longer among the engine's interesting test cases."""
+        if self.__checkpoint_key is None:
+            return
+        db = self.engine.settings.database
+        digest = self._target_digest()
+        live = {
+            hashlib.sha1(choices_to_bytes(result.choices)).hexdigest()
+            for result in self.engine.interesting_test_cases.values()
+        }
+        checkpoint = None
+        stale = []
+        for value in db.fetch(self.__checkpoint_key):
+            try:
+                saved = json.loads(value)
+                target = saved["target"]
+            except Exception:
+                stale.append(value)
+                continue
+            if target == digest and checkpoint is None:
+                checkpoint = saved
+                self.__checkpoint = value
+            elif target not in live:
+                stale.append(value)
+        if stale:
+            db.delete_many([(self.__checkpoint_key, value) for value in stale])
+        if checkpoint is None:
+            return
+
+        self.debug("Resuming shrink from checkpoint")
+        self.__coarse_reduction_done = checkpoint["coarse"]
+        passes = {sp.name: sp for sp in self.shrink_passes}
+        ordered = []
+        for name, last_prefix, exhausted in checkpoint["passes"]:
+            if (sp := passes.pop(name, None)) is None:
+                continue
+            sp.last_prefix = tuple(last_prefix)
+            if exhausted:
+                self.shrink_pass_choice_trees[sp].mark_exhausted()
+            ordered.append(sp)
+        self.shrink_passes[:] = ordered + list(passes.values())
+
     def explain(self) -> None:
         if not self.should_explain or not self.shrink_target.arg_spans:
             return
@@ -521,6 +674,29 @@ class Shrinker:
         seen_passing_seq = self.engine.passing_choice_sequences(
             prefix=self.nodes[: min(start for start, _ in arg_ranges.values())]
         )
+        # A passing sequence makes varying nodes[start:end] redundant if it
+        # shares at least ``start`` leading and ``len(nodes) - end`` trailing
+        # nodes with ours. So for each length of common prefix we record the
+        # longest common suffix among sequences with at least that much in
+        # common, and checking a span is then a lookup.
+        longest_common_suffix = [-1] * (len(nodes) + 2)
+        for seen in seen_passing_seq:
+            limit = min(len(seen), len(nodes))
+            prefix_len = 0
+            while prefix_len < limit and seen[prefix_len] == nodes[prefix_len]:
+                prefix_len += 1
+            suffix_len = 0
+            while (
+                suffix_len < limit and seen[-1 - suffix_len] == nodes[-1 - suffix_len]
+            ):
+                suffix_len += 1
+            longest_common_suffix[prefix_len] = max(
+                longest_common_suffix[prefix_len], suffix_len
+            )
+        for i in reversed(range(len(nodes) + 1)):
+            longest_common_suffix[i] = max(
+                longest_common_suffix[i], longest_common_suffix[i + 1]
+            )
 
         # Now that we've shrunk to a minimal failing test case, it's time to try
         # varying each part that we've noted will go in the final report.  Consider
@@ -536,10 +712,7 @@ class Shrinker:
 
             # Check for any previous test cases that match the prefix and suffix,
             # so we can skip if we found a passing test case while shrinking.
-            if any(
-                startswith(seen, nodes[:start]) and endswith(seen, nodes[end:])
-                for seen in seen_passing_seq
-            ):
+            if longest_common_suffix[start] >= len(nodes) - end:
                 continue
 
             # Skip spans whose ranges are subsets of already-explained ranges.
@@ -832,6 +1005,60 @@ class Shrinker:
     def shrink_pass_choice_trees(self) -> dict[Any, ChoiceTree]:
         return defaultdict(ChoiceTree)
 
+    @derived_value  # type: ignore
+    def speculated_steps(self) -> dict[Any, int]:
+        return defaultdict(int)
+
+    def speculate(self, shrink_pass: ShrinkPass, *, random_order: bool) -> None:
+        """Run the candidates from the next few steps of ``shrink_pass`` in
+        worker processes, so that the steps themselves will mostly find their
+        results in the engine's cache.
+
+        We find these candidates by running the steps against a copy of the
+        pass's choice tree, on the assumption that every candidate fails to
+        shrink. That's the usual case, and when it's wrong the real step runs
+        the successful candidate locally, exactly as it would have without
+        speculation - so we shrink to the same result either way.
+        """
+        if self.speculated_steps[shrink_pass] > 0:
+            self.speculated_steps[shrink_pass] -= 1
+            return
+        if self.__extend != 0 or not self.engine.can_speculate:
+            return
+
+        batch_size = 2 * self.engine.settings.workers
+        tree = copy.deepcopy(self.shrink_pass_choice_trees[shrink_pass])
+        last_prefix = shrink_pass.last_prefix
+        random_state = self.random.getstate()
+        candidates: dict[Any, Sequence[ChoiceNode]] = {}
+        steps = 0
+        self.__speculative_candidates = candidates
+        try:
+            while (
+                not tree.exhausted
+                and len(candidates) < batch_size
+                and steps < 10 * batch_size
+            ):
+                if random_order:
+                    selection_order = random_selection_order(self.random)
+                else:
+                    selection_order = prefix_selection_order(last_prefix)
+                last_prefix = tree.step(selection_order, shrink_pass.function)
+                steps += 1
+        except StopSpeculating:
+            pass
+        finally:
+            self.__speculative_candidates = None
+            # The real steps must make the same random choices we just did.
+            self.random.setstate(random_state)
+
+        # the current step is one of those we speculated about
+        self.speculated_steps[shrink_pass] = steps - 1
+        if candidates:
+            self.engine.speculate(
+                [[n.value for n in nodes] for nodes in candidates.values()]
+            )
+
     def step(self, shrink_pass: ShrinkPass, *, random_order: bool = False) -> bool:
         tree = self.shrink_pass_choice_trees[shrink_pass]
         if tree.exhausted:
@@ -840,6 +1067,10 @@ class Shrinker:
         initial_shrinks = self.shrinks
         initial_calls = self.calls
         initial_misaligned = self.misaligned
+        initial_cache_hits = self.engine.cache_hit_count
+        initial_simulated = self.engine.simulated_count
+        initial_test_runtime = self.engine.test_function_runtime
+        start_time = time.perf_counter()
         size = len(self.shrink_target.choices)
         assert shrink_pass.name is not None
         self.engine.explain_next_call_as(shrink_pass.name)
@@ -850,6 +1081,7 @@ class Shrinker:
             selection_order = prefix_selection_order(shrink_pass.last_prefix)
 
         try:
+            self.speculate(shrink_pass, random_order=random_order)
             shrink_pass.last_prefix = tree.step(
                 selection_order,
                 lambda chooser: shrink_pass.function(chooser),
@@ -859,9 +1091,31 @@ class Shrinker:
             shrink_pass.misaligned += self.misaligned - initial_misaligned
             shrink_pass.shrinks += self.shrinks - initial_shrinks
             shrink_pass.deletions += size - len(self.shrink_target.choices)
+            shrink_pass.cache_hits += self.engine.cache_hit_count - initial_cache_hits
+            shrink_pass.simulated += self.engine.simulated_count - initial_simulated
+            shrink_pass.test_runtime += (
+                self.engine.test_function_runtime - initial_test_runtime
+            )
+            shrink_pass.runtime += time.perf_counter() - start_time
             self.engine.clear_call_explanation()
+        if (
+            time.perf_counter() - self.__last_checkpoint_time
+            >= CHECKPOINT_INTERVAL_SECONDS
+        ):
+            self._save_checkpoint()
         return True
 
+    def is_low_yield(self, sp: ShrinkPass, passes: list[ShrinkPass]) -> bool:
+        """If the user has set a |settings.shrink_time_budget|, we stop running
+        a shrink pass once it has used more than its share of the budget while
+        shrinking less often per second than ``passes`` as a whole."""
+        budget = self.engine.settings.shrink_time_budget
+        if budget is None or sp.runtime < budget.total_seconds() / len(passes):
+            return False
+        runtime = sum(p.runtime for p in passes)
+        shrinks = sum(p.shrinks for p in passes)
+        return sp.shrinks * runtime < shrinks * sp.runtime
+
     def fixate_shrink_passes(self, passes: list[ShrinkPass]) -> None:
         """Run steps from each pass in ``passes`` until the current shrink target
         is a fixed point of all of them."""
@@ -887,6 +1141,9 @@ class Shrinker:
             max_calls_per_failing_step = 1
 
             for sp in passes:
+                if self.is_low_yield(sp, passes):
+                    continue
+
                 if can_discard:
                     can_discard = self.remove_discarded()
 
@@ -896,7 +1153,7 @@ class Shrinker:
                 # max_failures times in a row. This implicitly boosts shrink
                 # passes that are more likely to work.
                 failures = 0
-                max_failures = 20
+                max_failures = self.scheduler.max_failures(sp)
                 while failures < max_failures:
                     # We don't allow more than max_stall consecutive failures
                     # to shrink, but this means that if we're unlucky and the
@@ -1351,6 +1608,57 @@ class Shrinker:
                 return False
         return True
 
+    @derived_value  # type: ignore
+    def spans_with_deletable_children(self):
+        """Returns the indices of spans with at least two non-empty children,
+        shallowest first."""
+        spans = self.spans
+        return sorted(
+            (
+                i
+                for i, children in enumerate(spans.children)
+                if sum(spans[c].choice_count > 0 for c in children) >= 2
+            ),
+            key=lambda i: (spans[i].depth, i),
+        )
+
+    def delete_child_spans(self, chooser):
+        """Try deleting chunks of the children of a span, in the style of
+        delta debugging.
+
+        We start by trying to delete each half of the children at once, then
+        each quarter, and so on down to each child individually. This means
+        that when most of the children of a large span, such as the elements
+        of a long list or the steps of a stateful test, are irrelevant to the
+        failure, we can usually delete them in a number of calls logarithmic
+        in the number of children, where the ``node_program`` passes need a
+        number of calls linear in the number of nodes.
+
+        Because we try the shallowest spans first, this deletes whole subtrees
+        before trying to delete their descendants.
+        """
+        i = chooser.choose(self.spans_with_deletable_children)
+
+        def deletable_children():
+            # The span at index i keeps its index as long as we only delete
+            # its descendants, but we check its structure is still there in
+            # case the test function behaves differently without them.
+            if i >= len(self.spans):
+                return []
+            spans = self.spans
+            return [spans[c] for c in spans.children[i] if spans[c].choice_count > 0]
+
+        k = len(deletable_children()) // 2
+        while k > 0:
+            j = 0
+            while j < len(children := deletable_children()):
+                nodes = list(self.nodes)
+                for span in reversed(children[j : j + k]):
+                    del nodes[span.start : span.end]
+                if not self.consider_new_nodes(nodes):
+                    j += k
+            k = min(k // 2, len(deletable_children()) // 2)
+
     @derived_value  # type: ignore
     def duplicated_nodes(self):
         """Returns a list of nodes grouped (choice_type, value)."""
@@ -1681,6 +1989,9 @@ class Shrinker:
             + (ValueHole(span.recorded_value),)
             + self.choices[span.end :]
         )
+        if self.__speculative_candidates is not None:
+            # we can't run value holes in a worker
+            raise StopSpeculating
         self.incorporate_test_data(self.engine.cached_test_function(attempt))
 
     def minimize_nodes(self, nodes):
@@ -127,6 +127,11 @@ class ChoiceTree:
     def exhausted(self) -> bool:
         return self.root.exhausted
 
+    def mark_exhausted(self) -> None:
+        """Record that every sequence of choices has been tried, e.g. by an
+        earlier shrink which we are resuming."""
+        self.root.live_child_count = 0
+
     def step(
         self,
         selection_order: Callable[[int, int], Iterable[int]],
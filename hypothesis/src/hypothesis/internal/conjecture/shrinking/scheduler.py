@@ -0,0 +1,148 @@
+# This file is part of Hypothesis, which may be found at
+# https://github.com/HypothesisWorks/hypothesis/
+#
+# Copyright the Hypothesis Authors.
+# Individual contributors are listed in AUTHORS.rst and the git log.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hypothesis.database import ExampleDatabase
+    from hypothesis.internal.conjecture.shrinker import ShrinkPass
+
+# How many shrinks a pass must have been run in before we trust its history.
+MIN_RUNS = 3
+
+# Once a pass has been run in this many shrinks we halve its statistics, so
+# that its recent behaviour counts for more than its distant history.
+MAX_RUNS = 20
+
+# How many steps in a row may fail before fixate_shrink_passes moves on to the
+# next pass. Passes which have never shrunk anything get a smaller budget.
+DEFAULT_MAX_FAILURES = 20
+USELESS_MAX_FAILURES = 5
+
+# [runs, calls, shrinks, deletions]
+PassStats = list[int]
+
+
+def _parse(value: bytes) -> dict[str, PassStats]:
+    stats = json.loads(value)
+    assert isinstance(stats, dict)
+    return {
+        name: [int(n) for n in counts]
+        for name, counts in stats.items()
+        if isinstance(counts, list) and len(counts) == 4
+    }
+
+
+def _merge(into: dict[str, PassStats], stats: dict[str, PassStats]) -> None:
+    for name, counts in stats.items():
+        existing = into.setdefault(name, [0, 0, 0, 0])
+        for i, n in enumerate(counts):
+            existing[i] += n
+        if existing[0] > MAX_RUNS:
+            into[name] = [n // 2 for n in existing]
+
+
+def _total_runs(stats: dict[str, PassStats]) -> int:
+    return sum(counts[0] for counts in stats.values())
+
+
+class ShrinkPassScheduler:
+    """Decides the order in which to run shrink passes, and how many failed
+    steps in a row each may take, based on how useful they were in earlier
+    shrinks of the same test.
+
+    The statistics for a test are stored under ``key`` as a single snapshot,
+    which each shrink replaces with an updated copy.  If concurrent shrinks
+    leave several snapshots behind, we use the one covering the most runs and
+    never add them together, so no shrink is counted twice.  The statistics
+    for a pass are only used once they cover at least ``MIN_RUNS`` shrinks.
+    If ``db`` or ``key`` is None, nothing is recorded and every pass gets the
+    default order and budget.
+    """
+
+    def __init__(self, db: "ExampleDatabase | None", key: bytes | None) -> None:
+        self.db = db if key is not None else None
+        self.key = key
+        self.__loaded: tuple[dict[str, PassStats], list[bytes]] | None = None
+
+    def _stats(self) -> dict[str, PassStats]:
+        if self.__loaded is None:
+            assert self.db is not None
+            assert self.key is not None
+            stats: dict[str, PassStats] = {}
+            values = []
+            for value in self.db.fetch(self.key):
+                values.append(value)
+                try:
+                    snapshot = _parse(value)
+                except Exception:
+                    continue
+                if _total_runs(snapshot) > _total_runs(stats):
+                    stats = snapshot
+            self.__loaded = (stats, values)
+        return self.__loaded[0]
+
+    def history(self, name: str) -> PassStats | None:
+        """Returns the recorded ``[runs, calls, shrinks, deletions]`` for the
+        shrink pass called ``name``, or None if we know too little about it."""
+        if self.db is None:
+            return None
+        counts = self._stats().get(name)
+        if counts is not None and counts[0] >= MIN_RUNS:
+            return counts
+        return None
+
+    def rank(self, sp: "ShrinkPass") -> int:
+        # This follows the ranking used by fixate_shrink_passes: passes which
+        # delete choices come first, and passes which never shrink come last.
+        assert sp.name is not None
+        counts = self.history(sp.name)
+        if counts is None:
+            return 0
+        _, _, shrinks, deletions = counts
+        if deletions > 0:
+            return -1
+        if shrinks == 0:
+            return 1
+        return 0
+
+    def order(self, passes: list["ShrinkPass"]) -> None:
+        """Sorts ``passes`` in place, keeping the existing order for passes
+        of equal rank."""
+        passes.sort(key=self.rank)
+
+    def max_failures(self, sp: "ShrinkPass") -> int:
+        if self.rank(sp) == 1:
+            return USELESS_MAX_FAILURES
+        return DEFAULT_MAX_FAILURES
+
+    def record(self, passes: list["ShrinkPass"]) -> None:
+        """Adds the statistics of each pass in ``passes`` which ran at least
+        once to the history for this test, replacing the stored snapshot."""
+        if self.db is None:
+            return
+        assert self.key is not None
+        new: dict[str, PassStats] = {}
+        for sp in passes:
+            if sp.calls > 0:
+                assert sp.name is not None
+                new[sp.name] = [1, sp.calls, sp.shrinks, sp.deletions]
+        if not new:
+            return
+        stats = {name: list(counts) for name, counts in self._stats().items()}
+        assert self.__loaded is not None
+        _, values = self.__loaded
+        _merge(stats, new)
+        value = json.dumps(stats, separators=(",", ":"), sort_keys=True).encode()
+        for old in values:
+            self.db.delete(self.key, old)
+        self.db.save(self.key, value)
+        self.__loaded = (stats, [value])
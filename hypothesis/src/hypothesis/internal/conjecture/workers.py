@@ -0,0 +1,177 @@
+# This file is part of Hypothesis, which may be found at
+# https://github.com/HypothesisWorks/hypothesis/
+#
+# Copyright the Hypothesis Authors.
+# Individual contributors are listed in AUTHORS.rst and the git log.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Support for running the test function in several worker processes at once,
+as configured by ``settings(workers=n)``.
+
+The design is deliberately lopsided: worker processes are forked from the
+process running the engine and do nothing but execute choice sequences, while
+the engine (the "coordinator") keeps sole ownership of the DataTree, pareto
+front, and interesting test cases. Workers report back a compact summary of
+each test case, which the coordinator replays into its own data structures.
+Anything which needs full bookkeeping - such as a failure, which we want to
+save to the database and shrink - is simply re-run by the coordinator.
+"""
+
+import multiprocessing
+import os
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from hypothesis.internal.conjecture.choice import ChoiceNode, ChoiceT
+from hypothesis.internal.conjecture.data import (
+    ConjectureResult,
+    DataObserver,
+    Status,
+    _Overrun,
+)
+from hypothesis.internal.conjecture.datatree import TreeRecordingObserver
+
+if TYPE_CHECKING:
+    from hypothesis.internal.conjecture.engine import CallStats, ConjectureRunner
+
+# The runner whose test function worker processes should execute. This is
+# set before forking, so that each worker inherits it without our having to
+# pickle the test function (which is usually impossible).
+_runner: Optional["ConjectureRunner"] = None
+
+
+@dataclass(slots=True, frozen=True)
+class WorkerResult:
+    """A picklable summary of running one choice sequence in a worker."""
+
+    nodes: tuple[ChoiceNode, ...]
+    status: Status
+    # the number of draws made before the test case called kill_branch, or
+    # None if it never did.
+    killed_at: int | None
+    target_observations: dict[str, int | float]
+    call_stats: "CallStats"
+    # True if the coordinator must re-run this choice sequence itself rather
+    # than trust this summary, e.g. because the test case failed or raised.
+    needs_replay: bool
+    # The full result, if requested and the test case doesn't need replaying.
+    # This is much larger than the rest of the summary, so we only send it
+    # when the coordinator wants to cache it.
+    result: ConjectureResult | _Overrun | None = None
+
+    @property
+    def choices(self) -> tuple[ChoiceT, ...]:
+        return tuple(node.value for node in self.nodes)
+
+    def record_in(self, observer: TreeRecordingObserver) -> None:
+        """Replay this test case into a DataTree, as if we had run it locally
+        with ``observer`` attached."""
+        for i, node in enumerate(self.nodes):
+            if i == self.killed_at:
+                observer.kill_branch()
+            observer.draw_value(
+                node.type,
+                node.value,
+                was_forced=node.was_forced,
+                constraints=node.constraints,
+            )
+        if self.killed_at == len(self.nodes):
+            observer.kill_branch()
+        observer.conclude_test(self.status, None)
+
+
+class KillRecordingObserver(DataObserver):
+    """Records when (if ever) a test case in a worker process calls
+    ``kill_branch``, so that we can do the same when replaying it."""
+
+    def __init__(self) -> None:
+        self.draws: int = 0
+        self.killed_at: int | None = None
+
+    def kill_branch(self) -> None:
+        if self.killed_at is None:
+            self.killed_at = self.draws
+
+    def draw_integer(self, value: Any, *, constraints: Any, was_forced: bool) -> None:
+        self.draws += 1
+
+    def draw_float(self, value: Any, *, constraints: Any, was_forced: bool) -> None:
+        self.draws += 1
+
+    def draw_string(self, value: Any, *, constraints: Any, was_forced: bool) -> None:
+        self.draws += 1
+
+    def draw_bytes(self, value: Any, *, constraints: Any, was_forced: bool) -> None:
+        self.draws += 1
+
+    def draw_boolean(self, value: Any, *, constraints: Any, was_forced: bool) -> None:
+        self.draws += 1
+
+
+def can_fork_workers() -> bool:
+    """Whether it is currently safe to fork worker processes.
+
+    We require the ``fork`` start method, because it is the only way for
+    workers to inherit a test function which can't be pickled. Forking a
+    multi-threaded process is unsafe (and deprecated from Python 3.12), and
+    daemonic processes - including our own workers - may not have children.
+    """
+    return (
+        hasattr(os, "fork")
+        and "fork" in multiprocessing.get_all_start_methods()
+        and threading.active_count() == 1
+        and not multiprocessing.current_process().daemon
+    )
+
+
+def _run_in_worker(
+    prefix: Sequence[ChoiceT], seed: int, max_choices: int | None, with_result: bool
+) -> WorkerResult:
+    assert _runner is not None
+    return _runner.run_in_worker(
+        prefix, seed=seed, max_choices=max_choices, with_result=with_result
+    )
+
+
+class WorkerPool:
+    """A pool of worker processes executing the test function of ``runner``.
+
+    Workers are forked when the pool is created, and so see the runner (and
+    the rest of the process) in the state it was in at that time.
+    """
+
+    def __init__(self, runner: "ConjectureRunner", workers: int) -> None:
+        global _runner
+        assert workers > 1
+        self.workers = workers
+        _runner = runner
+        try:
+            self._pool = multiprocessing.get_context("fork").Pool(workers)
+        except BaseException:
+            _runner = None
+            raise
+
+    def run(
+        self,
+        test_cases: Sequence[tuple[Sequence[ChoiceT], int, int | None]],
+        *,
+        with_results: bool = False,
+    ) -> list[WorkerResult]:
+        """Run each ``(prefix, seed, max_choices)`` triple in ``test_cases`` in
+        a worker, returning the results in the same order."""
+        return self._pool.starmap(
+            _run_in_worker,
+            [(*test_case, with_results) for test_case in test_cases],
+            chunksize=1,
+        )
+
+    def close(self) -> None:
+        global _runner
+        self._pool.terminate()
+        self._pool.join()
+        _runner = None
@@ -9,12 +9,19 @@
 # obtain one at https://mozilla.org/MPL/2.0/.
 
 import ast
+import atexit
 import hashlib
 import inspect
+import marshal
 import math
+import os
 import sys
+import tempfile
+import threading
+import time
 from ast import Constant, Expr, NodeVisitor, UnaryOp, USub
-from collections.abc import Iterator, MutableSet
+from collections.abc import Generator, Iterator, MutableSet
+from contextlib import contextmanager
 from functools import lru_cache
 from itertools import chain
 from pathlib import Path
@@ -197,15 +204,179 @@ def _constants_file_str(constants: Constants) -> str:
     return str(sorted(constants, key=lambda v: (str(type(v)), v)))
 
 
+# How long ConstantsIndex.save waits for another process to finish saving.
+INDEX_LOCK_TIMEOUT_SECONDS = 5.0
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    def _try_lock(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class ConstantsIndex:
+    """An index of the constants in each local source file, stored as a single
+    file which is shared by every process using this storage directory, such as
+    the workers of a pytest-xdist run.
+
+    Entries are keyed by path and ``limit``, and remain valid for as long as the
+    size and modification time of the file are unchanged.  A hit therefore costs
+    one ``os.stat()``, rather than reading, hashing, and parsing the file.  New
+    entries are merged into the index file by ``save()`` when the process exits,
+    so that each process only does work for files which have changed since the
+    index was written.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, bool], tuple] | None = None
+        self._new: dict[tuple[str, bool], tuple] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _filename() -> str:
+        # the marshal format may change between Python versions
+        return f"index-{hypothesis.__version__}-{sys.implementation.cache_tag}"
+
+    def _read(self) -> dict[tuple[str, bool], tuple]:
+        try:
+            path = storage_directory("constants", intent_to_write=False).path
+            entries = marshal.loads((path / self._filename()).read_bytes())
+            assert isinstance(entries, dict)
+            return entries
+        except Exception:
+            return {}
+
+    def get(self, path: str, stat: os.stat_result, *, limit: bool) -> Constants | None:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            entry = self._entries.get((path, limit))
+        if entry is None or entry[:2] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        integers, floats, bytes_, strings = entry[2:]
+        return Constants(
+            integers=set(integers),
+            floats=set(floats),
+            bytes=set(bytes_),
+            strings=set(strings),
+        )
+
+    def add(
+        self, path: str, stat: os.stat_result, constants: Constants, *, limit: bool
+    ) -> None:
+        entry = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            tuple(constants.integers),
+            tuple(constants.floats),
+            tuple(constants.bytes),
+            tuple(constants.strings),
+        )
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            self._entries[(path, limit)] = entry
+            self._new[(path, limit)] = entry
+
+    @contextmanager
+    def _file_lock(self, directory: Path) -> Generator[bool, None, None]:
+        """Holds a lock on a file next to the index, so that processes saving
+        at the same time don't each overwrite the index with only their own new
+        entries.  Yields False if we couldn't take the lock in time.
+
+        The operating system releases the lock if its process dies, so unlike
+        a lock file we never have to guess whether a lock is stale.
+        """
+        deadline = time.monotonic() + INDEX_LOCK_TIMEOUT_SECONDS
+        with open(directory / f"{self._filename()}.lock", "wb") as f:
+            while True:
+                try:
+                    _try_lock(f.fileno())
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        yield False
+                        return
+                    time.sleep(0.01)
+            try:
+                yield True
+            finally:
+                _unlock(f.fileno())
+
+    def save(self) -> None:
+        """Merge new entries into the index file, which other processes may
+        have updated since we read it."""
+        with self._lock:
+            if not self._new:
+                return
+            new, self._new = self._new, {}
+        try:
+            cache_dir = storage_directory("constants")
+            cache_dir.create_if_missing()
+            with self._file_lock(cache_dir.path) as locked:
+                if not locked:
+                    # try again on the next save.
+                    with self._lock:
+                        self._new = {**new, **self._new}
+                    return
+                entries = self._read()
+                entries.update(new)
+                # drop entries for files which no longer exist, so that the
+                # index doesn't grow forever.
+                entries = {k: v for k, v in entries.items() if os.path.exists(k[0])}
+                # Write the index atomically, so that readers, which don't take
+                # the lock, see either the old or the new version.
+                fd, tmpfile = tempfile.mkstemp(dir=cache_dir.path)
+                with os.fdopen(fd, "wb") as f:
+                    marshal.dump(entries, f)
+                os.replace(tmpfile, cache_dir.path / self._filename())
+        except Exception:  # pragma: no cover
+            pass
+
+
+constants_index = ConstantsIndex()
+
+
+@atexit.register
+def _save_constants_index() -> None:
+    # share what we found with other processes in a single write, rather than
+    # while generating test cases.
+    constants_index.save()
+
+
 @lru_cache(4096)
 def constants_from_module(module: ModuleType, *, limit: bool = True) -> Constants:
     try:
         module_file = inspect.getsourcefile(module)
-        # use type: ignore because we know this might error
-        source_bytes = Path(module_file).read_bytes()  # type: ignore
+        stat = os.stat(module_file)  # type: ignore
     except Exception:
         return Constants()
 
+    assert module_file is not None
+    if (constants := constants_index.get(module_file, stat, limit=limit)) is None:
+        constants = _constants_from_file(module_file, limit=limit)
+        constants_index.add(module_file, stat, constants, limit=limit)
+    return constants
+
+
+def _constants_from_file(module_file: str, *, limit: bool) -> Constants:
+    try:
+        source_bytes = Path(module_file).read_bytes()
+    except Exception:  # pragma: no cover
+        return Constants()
+
     if limit and len(source_bytes) > 512 * 1024:
         # Skip files over 512kb. For reference, the largest source file
         # in Hypothesis is strategies/_internal/core.py at 107kb at time
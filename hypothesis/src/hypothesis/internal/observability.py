@@ -10,25 +10,31 @@
 
 """Observability tools to spit out analysis-ready tables, one row per test case."""
 
+import atexit
 import base64
 import dataclasses
 import json
 import math
 import os
+import struct
 import sys
 import threading
 import time
 import warnings
-from collections.abc import Callable, Generator
-from contextlib import contextmanager
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from datetime import date, timedelta
 from functools import lru_cache
 from pathlib import Path
+from queue import Empty, Full, Queue
+from random import Random
 from threading import Lock
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
     Literal,
     Optional,
     TypeAlias,
@@ -37,7 +43,7 @@ from typing import (
 )
 
 from hypothesis.configuration import storage_directory
-from hypothesis.errors import HypothesisWarning
+from hypothesis.errors import HypothesisWarning, InvalidArgument
 from hypothesis.internal.conjecture.choice import (
     BooleanConstraints,
     BytesConstraints,
@@ -481,38 +487,571 @@ def make_testcase(
     )
 
 
+class ObservationSummary:
+    """Rolled-up statistics about the test cases of one run of a test function,
+    for the aggregated observability mode enabled by |OBSERVABILITY_SAMPLE|.
+
+    Every test case is counted towards the statistics, which is cheap.  We
+    also keep a uniformly random sample of ``sample_size`` test cases, chosen
+    by reservoir sampling, for which a full observation is built.  Callers
+    ask |ObservationSummary.should_sample| before running each test case, so
+    that the expensive parts of observing it - like printing its arguments -
+    can be skipped entirely for the rest.
+    """
+
+    # The maximum number of distinct values we count for each feature, so
+    # that features with many values don't use unbounded memory.
+    max_feature_values = 100
+
+    def __init__(self, sample_size: int, *, random: Random | None = None) -> None:
+        self.sample_size = sample_size
+        self.random = random or Random()
+        self.count = 0
+        self.statuses: Counter[str] = Counter()
+        self.features: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self.timing: defaultdict[str, Counter[int]] = defaultdict(Counter)
+        self.sample: list[TestCaseObservation] = []
+        self._sample_index: int | None = None
+
+    def should_sample(self) -> bool:
+        """Returns whether the next test case is in the sample, in which case
+        the caller should pass a full observation of it to |ObservationSummary.record|.
+
+        Call this exactly once before each test case."""
+        self.count += 1
+        if self.count <= self.sample_size:
+            self._sample_index = self.count - 1
+        else:
+            i = self.random.randrange(self.count)
+            self._sample_index = i if i < self.sample_size else None
+        return self._sample_index is not None
+
+    def record(
+        self,
+        data: "ConjectureData",
+        *,
+        timing: dict[str, float],
+        observation: TestCaseObservation | None = None,
+    ) -> None:
+        from hypothesis.internal.conjecture.data import Status
+
+        self.statuses[
+            {
+                Status.OVERRUN: "gave_up",
+                Status.INVALID: "gave_up",
+                Status.VALID: "passed",
+                Status.INTERESTING: "failed",
+            }[data.status]
+        ] += 1
+        for key, value in data.events.items():
+            counts = self.features[key]
+            value = str(value)
+            if value in counts or len(counts) < self.max_feature_values:
+                counts[value] += 1
+        for key, seconds in timing.items():
+            # bucket by the next power of two, in microseconds
+            microseconds = max(seconds * 1e6, 1)
+            self.timing[key][2 ** math.ceil(math.log2(microseconds))] += 1
+
+        if observation is not None and self._sample_index is not None:
+            if self._sample_index < len(self.sample):
+                self.sample[self._sample_index] = observation
+            else:
+                self.sample.append(observation)
+        self._sample_index = None
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "test_cases": self.count,
+            "statuses": dict(self.statuses),
+            "features": {k: dict(v) for k, v in self.features.items()},
+            "timing": {
+                k: {f"<={bound}us": n for bound, n in sorted(v.items())}
+                for k, v in self.timing.items()
+            },
+        }
+
+
 _WROTE_TO: set[Path] = set()
-_deliver_to_file_lock = Lock()
+
+# The background writer also writes out its buffer once it holds this many
+# observations.  We count observations rather than bytes, because binary
+# observations are only encoded when they are written.
+_MAX_PENDING_OBSERVATIONS = 1000
+
+
+class _Flush:
+    pass
+
+
+class _Close:
+    pass
+
+
+_FLUSH = _Flush()
+_CLOSE = _Close()
+
+
+class _ObservationWriter:
+    """Writes observations to JSONL files, one per day and kind of observation.
+
+    Observations are converted to json on the thread which produced them, and
+    put on a bounded queue.  A background thread takes them off the queue and
+    buffers them in memory, writing them to a long-lived handle for each file
+    every |OBSERVABILITY_FLUSH_SECONDS|, whenever the buffer gets large, and on
+    exit.  With |OBSERVABILITY_BINARY|, each such write is one block of the
+    binary format (see ``encode_observations``), encoded on that thread.
+
+    This means that producing an observation never waits on the disk, or on
+    other threads producing observations - unless the queue is full, in which
+    case we follow |OBSERVABILITY_QUEUE_FULL|.
+    """
+
+    def __init__(self, directory: Path | None = None) -> None:
+        # None means the "observed" storage directory, which we look up when
+        # each observation is written, in case it changes.
+        self.directory = directory
+        self.dropped = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        # Called on init, and in the child after a fork. The child gets none
+        # of our threads, and must not write the parent's pending observations
+        # a second time. We write to raw unbuffered files, so that there is no
+        # hidden buffer in the file objects themselves which might do that.
+        self._lock = Lock()
+        self._queue: Queue[tuple[Path, object] | _Flush | _Close] | None = None
+        self._thread: threading.Thread | None = None
+        # a thread which has been sent _CLOSE, and may still be writing. We wait
+        # for it to finish before starting another, as they share our buffers.
+        self._closing_thread: threading.Thread | None = None
+        self._files: dict[Path, BinaryIO] = {}
+        self._pending: dict[Path, list[object]] = {}
+        self._pending_count = 0
+        # errors from writing to disk, which we report from the next thread to
+        # call write(), flush(), or close(), where warnings filters apply.
+        self._errors: deque[Exception] = deque()
+
+    def write(self, observation: Observation) -> None:
+        from hypothesis.strategies._internal.utils import to_jsonable
+
+        kind = "testcases" if observation.type == "test_case" else "info"
+        directory = self.directory or storage_directory("observed").path
+        item: tuple[Path, object]
+        if OBSERVABILITY_BINARY:
+            path = directory / f"{date.today().isoformat()}_{kind}.bin"
+            # Encoding happens on the background thread, a block at a time.
+            item = (path, _to_binary_jsonable(observation))
+        else:
+            path = directory / f"{date.today().isoformat()}_{kind}.jsonl"
+            line = json.dumps(to_jsonable(observation, avoid_realization=False))
+            item = (path, line.encode() + b"\n")
+        _WROTE_TO.add(path)
+
+        self._report_errors()
+        queue = self._start()
+        if OBSERVABILITY_QUEUE_FULL == "drop":
+            try:
+                queue.put_nowait(item)
+            except Full:
+                self.dropped += 1
+        else:
+            queue.put(item)
+
+    def flush(self) -> None:
+        """Wait until every observation written so far is on disk."""
+        self._send(_FLUSH)
+
+    def close(self) -> None:
+        """Write every pending observation to disk, and stop the background
+        thread.  It will be started again if there are more observations."""
+        self._send(_CLOSE)
+
+    def _send(self, message: _Flush | _Close) -> None:
+        with self._lock:
+            queue = self._queue
+            if queue is None:
+                return
+            if message is _CLOSE:
+                self._closing_thread = self._thread
+                self._queue = None
+                self._thread = None
+        queue.put(message)
+        queue.join()
+        self._report_errors()
+
+    def _report_errors(self) -> None:
+        while True:
+            try:
+                err = self._errors.popleft()
+            except IndexError:
+                return
+            warnings.warn(
+                f"Failed to write observations to disk, and dropped them: {err!r}",
+                HypothesisWarning,
+                stacklevel=3,
+            )
+
+    def _start(self) -> "Queue[tuple[Path, object] | _Flush | _Close]":
+        with self._lock:
+            if self._queue is None:
+                if self._closing_thread is not None:
+                    self._closing_thread.join()
+                    self._closing_thread = None
+                self._queue = Queue(maxsize=OBSERVABILITY_QUEUE_SIZE)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="hypothesis-observability",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._queue
+
+    def _run(self, queue: "Queue[tuple[Path, object] | _Flush | _Close]") -> None:
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = queue.get(timeout=OBSERVABILITY_FLUSH_SECONDS)
+            except Empty:
+                self._try_write_pending()
+                last_flush = time.monotonic()
+                continue
+            try:
+                if isinstance(item, tuple):
+                    path, value = item
+                    self._pending.setdefault(path, []).append(value)
+                    self._pending_count += 1
+                if (
+                    not isinstance(item, tuple)
+                    or self._pending_count >= _MAX_PENDING_OBSERVATIONS
+                    or time.monotonic() - last_flush >= OBSERVABILITY_FLUSH_SECONDS
+                ):
+                    self._try_write_pending()
+                    last_flush = time.monotonic()
+                if item is _CLOSE:
+                    self._close_files()
+                    return
+            finally:
+                queue.task_done()
+
+    def _try_write_pending(self) -> None:
+        # If we stopped on an error, nothing would take observations off the
+        # queue, and anything waiting on it - including flush() and close(), at
+        # exit - would hang.  So we drop this batch and carry on instead.
+        try:
+            self._write_pending()
+        except Exception as err:
+            self.dropped += self._pending_count
+            self._pending.clear()
+            self._pending_count = 0
+            # the files may be unusable, e.g. if their directory was deleted,
+            # so we reopen them for the next batch.
+            self._close_files()
+            self._errors.append(err)
+
+    def _close_files(self) -> None:
+        for f in self._files.values():
+            with suppress(OSError):
+                f.close()
+        self._files.clear()
+
+    def _write_pending(self) -> None:
+        for path in list(self._pending):
+            values = self._pending[path]
+            if path not in self._files:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._files[path] = path.open(mode="ab", buffering=0)
+            if path.suffix == ".bin":
+                self._files[path].write(encode_observations(values))
+            else:
+                self._files[path].write(b"".join(cast(list[bytes], values)))
+            del self._pending[path]
+            self._pending_count -= len(values)
+
+
+_file_writer = _ObservationWriter()
+if hasattr(os, "register_at_fork"):  # pragma: no branch  # not on Windows
+    os.register_at_fork(after_in_child=_file_writer._reset)
 
 
 def _deliver_to_file(
     observation: Observation, thread_id: int
 ) -> None:  # pragma: no cover
-    from hypothesis.strategies._internal.utils import to_jsonable
+    _file_writer.write(observation)
+
+
+# The binary observation format, used instead of JSON lines if
+# OBSERVABILITY_BINARY is set.  A file is a sequence of blocks, each of which
+# is the magic bytes, the uleb128 length of the rest of the block, and then
+# one encoded value for each observation in the block.
+#
+# Each value starts with a tag byte.  Strings are interned per block: the
+# first occurrence of a string is written out in full, and assigned the next
+# id, and later occurrences write only that id.  The choice nodes of a test
+# case are written as their choices in the choices_to_bytes format, followed
+# by an id for each node's (type, constraints, was_forced), interned the same
+# way.  Because each block starts afresh, blocks can be decoded independently,
+# and several processes can append blocks to the same file.
+_BINARY_MAGIC = b"HOB\x01"
+(
+    _TAG_NONE,
+    _TAG_FALSE,
+    _TAG_TRUE,
+    _TAG_INT,
+    _TAG_FLOAT,
+    _TAG_NEW_STRING,
+    _TAG_STRING,
+    _TAG_LIST,
+    _TAG_DICT,
+    _TAG_CHOICE_NODES,
+) = range(10)
 
-    kind = "testcases" if observation.type == "test_case" else "info"
-    observed_dir = storage_directory("observed")
-    observed_dir.create_if_missing()
-    observation_p = observed_dir.path / f"{date.today().isoformat()}_{kind}.jsonl"
 
-    observation_bytes = (
-        json.dumps(to_jsonable(observation, avoid_realization=False)) + "\n"
+@dataclass(slots=True, frozen=True)
+class _ChoiceNodes:
+    # Stands in for the json of metadata.choice_nodes until we encode it.
+    nodes: tuple[ChoiceNode, ...]
+
+
+def _to_binary_jsonable(observation: Observation) -> Any:
+    from hypothesis.strategies._internal.utils import to_jsonable
+
+    if observation.type != "test_case" or observation.metadata.choice_nodes is None:
+        return to_jsonable(observation, avoid_realization=False)
+    # skip converting the nodes to json, which we'd only throw away.
+    nodes = observation.metadata.choice_nodes
+    metadata = dataclasses.replace(observation.metadata, choice_nodes=None)
+    value = cast(
+        dict[str, Any],
+        to_jsonable(
+            dataclasses.replace(observation, metadata=metadata),
+            avoid_realization=False,
+        ),
     )
-    # only allow one conccurent file write to avoid write races. This is likely to make
-    # HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY quite slow under threading. A queue
-    # would be an improvement, but that requires a background thread, and I
-    # would prefer to avoid a thread in the single-threaded case. We could
-    # switch over to a queue if we detect multithreading, but it's tricky to get
-    # right.
-    with _deliver_to_file_lock:
-        _WROTE_TO.add(observation_p)
-        with observation_p.open(mode="a") as f:
-            f.write(observation_bytes)
+    value["metadata"]["choice_nodes"] = _ChoiceNodes(nodes)
+    return value
+
+
+class _BinaryEncoder:
+    def __init__(self) -> None:
+        from hypothesis.internal.conjecture.datatree import SignatureTable
+
+        self.parts: list[bytes] = []
+        self.strings: dict[str, int] = {}
+        self.signatures: dict[tuple[int, bool], int] = {}
+        self.signature_table = SignatureTable()
+
+    def encode(self, value: Any) -> None:
+        from hypothesis.database import _pack_uleb128
+
+        parts = self.parts
+        if value is None:
+            parts.append(bytes([_TAG_NONE]))
+        elif value is False:
+            parts.append(bytes([_TAG_FALSE]))
+        elif value is True:
+            parts.append(bytes([_TAG_TRUE]))
+        elif isinstance(value, int):
+            zigzag = (value << 1) if value >= 0 else ((-value << 1) - 1)
+            parts.append(bytes([_TAG_INT]) + _pack_uleb128(zigzag))
+        elif isinstance(value, float):
+            parts.append(bytes([_TAG_FLOAT]) + struct.pack("<d", value))
+        elif isinstance(value, str):
+            self.encode_string(value)
+        elif isinstance(value, (list, tuple)):
+            parts.append(bytes([_TAG_LIST]) + _pack_uleb128(len(value)))
+            for v in value:
+                self.encode(v)
+        elif isinstance(value, dict):
+            parts.append(bytes([_TAG_DICT]) + _pack_uleb128(len(value)))
+            for k, v in value.items():
+                # convert keys to strings the same way json does
+                self.encode_string(k if isinstance(k, str) else json.dumps(k))
+                self.encode(v)
+        elif isinstance(value, _ChoiceNodes):
+            self.encode_nodes(value.nodes)
+        else:
+            raise TypeError(f"Cannot encode {value!r} as an observation")
+
+    def encode_string(self, value: str) -> None:
+        from hypothesis.database import _pack_uleb128
+
+        if (i := self.strings.get(value)) is not None:
+            self.parts.append(bytes([_TAG_STRING]) + _pack_uleb128(i))
+            return
+        self.strings[value] = len(self.strings)
+        encoded = value.encode(errors="surrogatepass")
+        self.parts.append(bytes([_TAG_NEW_STRING]) + _pack_uleb128(len(encoded)))
+        self.parts.append(encoded)
+
+    def encode_nodes(self, nodes: tuple[ChoiceNode, ...]) -> None:
+        from hypothesis.database import _pack_uleb128, choices_to_bytes
+
+        choices = choices_to_bytes(node.value for node in nodes)
+        self.parts.append(
+            bytes([_TAG_CHOICE_NODES])
+            + _pack_uleb128(len(nodes))
+            + _pack_uleb128(len(choices))
+            + choices
+        )
+        for node in nodes:
+            key = (
+                self.signature_table.intern(node.type, node.constraints),
+                node.was_forced,
+            )
+            i = self.signatures.get(key)
+            if i is not None:
+                self.parts.append(_pack_uleb128(i))
+                continue
+            # A new signature is its id, followed by its definition.
+            i = self.signatures[key] = len(self.signatures)
+            self.parts.append(_pack_uleb128(i))
+            self.encode(node.type)
+            self.encode(_constraints_to_json(node.type, node.constraints))
+            self.encode(node.was_forced)
+
+
+def encode_observations(values: Iterable[Any]) -> bytes:
+    """Encode ``values``, which are observations converted to json-compatible
+    form, as one block of the binary observation format."""
+    from hypothesis.database import _pack_uleb128
+
+    encoder = _BinaryEncoder()
+    for value in values:
+        encoder.encode(value)
+    body = b"".join(encoder.parts)
+    return _BINARY_MAGIC + _pack_uleb128(len(body)) + body
+
+
+class _BinaryDecoder:
+    def __init__(self, buffer: bytes) -> None:
+        self.buffer = buffer
+        self.index = 0
+        self.strings: list[str] = []
+        self.signatures: list[tuple[str, Any, bool]] = []
+
+    def uleb128(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self.buffer[self.index]
+            self.index += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value
+
+    def take(self, n: int) -> bytes:
+        chunk = self.buffer[self.index : self.index + n]
+        self.index += n
+        return chunk
+
+    def decode(self) -> Any:
+        tag = self.buffer[self.index]
+        self.index += 1
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_INT:
+            zigzag = self.uleb128()
+            return (zigzag >> 1) if not zigzag & 1 else -((zigzag + 1) >> 1)
+        if tag == _TAG_FLOAT:
+            return struct.unpack("<d", self.take(8))[0]
+        if tag == _TAG_NEW_STRING:
+            value = self.take(self.uleb128()).decode(errors="surrogatepass")
+            self.strings.append(value)
+            return value
+        if tag == _TAG_STRING:
+            return self.strings[self.uleb128()]
+        if tag == _TAG_LIST:
+            return [self.decode() for _ in range(self.uleb128())]
+        if tag == _TAG_DICT:
+            return {self.decode(): self.decode() for _ in range(self.uleb128())}
+        if tag == _TAG_CHOICE_NODES:
+            return self.decode_nodes()
+        raise ValueError(f"Unknown tag {tag} in binary observations")
+
+    def decode_nodes(self) -> list[dict[str, Any]]:
+        from hypothesis.database import choices_from_bytes
+
+        n = self.uleb128()
+        choices = choices_from_bytes(self.take(self.uleb128()))
+        assert choices is not None
+        assert len(choices) == n
+        nodes = []
+        for choice in choices:
+            i = self.uleb128()
+            if i == len(self.signatures):
+                signature = (self.decode(), self.decode(), self.decode())
+                self.signatures.append(signature)
+            choice_type, constraints, was_forced = self.signatures[i]
+            nodes.append(
+                {
+                    "type": choice_type,
+                    "value": _choice_to_json(choice),
+                    "constraints": constraints,
+                    "was_forced": was_forced,
+                }
+            )
+        return nodes
+
+
+def read_observations(path: str | Path) -> Generator[dict[str, Any], None, None]:
+    """
+    Yields each observation in the file at ``path``, which is in the binary
+    format written when |OBSERVABILITY_BINARY| is set.
+
+    Each observation is returned in the same form as the corresponding line of
+    a JSON lines observability file, after parsing it with :func:`json.loads`.
+    Observations are decoded as they are read, so this uses little memory even
+    for large files.  A block which was only partially written, for instance
+    because the process writing it was killed, ends the file.
+    """
+    from hypothesis.database import _unpack_uleb128
+
+    with open(path, "rb") as f:
+        while magic := f.read(len(_BINARY_MAGIC)):
+            if len(magic) < len(_BINARY_MAGIC):
+                return
+            if magic != _BINARY_MAGIC:
+                raise ValueError(f"{path} is not a binary observations file")
+            # A uleb128 ends at the first byte without its high bit set.
+            length_bytes = b""
+            while (byte := f.read(1)) and byte[0] & 0x80:
+                length_bytes += byte
+            if not byte:
+                return
+            _, length = _unpack_uleb128(length_bytes + byte)
+            body = f.read(length)
+            if len(body) < length:
+                return
+            decoder = _BinaryDecoder(body)
+            while decoder.index < len(body):
+                yield decoder.decode()
 
 
 _imported_at = time.time()
 
 
+def _sample_size_from_environ() -> int | None:
+    value = os.environ.get("HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY_SAMPLE")
+    if value is None:
+        return None
+    try:
+        sample_size = int(value)
+    except ValueError:
+        sample_size = -1
+    if sample_size < 0:
+        raise InvalidArgument(
+            f"HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY_SAMPLE={value!r} must be "
+            "a non-negative integer."
+        )
+    return sample_size
+
+
 @lru_cache
 def _system_metadata() -> dict[str, Any]:
     return {
@@ -544,6 +1083,44 @@ OBSERVABILITY_COLLECT_COVERAGE = (
 #:     be renamed without notice.
 #:
 OBSERVABILITY_CHOICES = "HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY_CHOICES" in os.environ
+#: If ``True``, write observations to files in a compact binary format, rather
+#: than as JSON lines, when observations are written to files.
+#:
+#: ``False`` by default, and set to ``True`` by the
+#: ``HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY_BINARY`` environment variable.
+#: Binary observability files end in ``.bin`` rather than ``.jsonl``; use
+#: |read_observations| to read them.
+OBSERVABILITY_BINARY = "HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY_BINARY" in os.environ
+#: If set to an integer, observe each run of a test function in aggregate,
+#: rather than one test case at a time.  Hypothesis then delivers an ``info``
+#: observation titled ``"Hypothesis Test Case Summary"`` at the end of each run,
+#: with the number of test cases by status, counts of the values of each
+#: feature, and histograms of timings.  Full test case observations are only
+#: built and delivered for a random sample of this many test cases, plus any
+#: failing examples Hypothesis reports.
+#:
+#: ``None`` by default, and set by the
+#: ``HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY_SAMPLE`` environment variable.
+#: This is much cheaper than observing every test case, for tests which run
+#: many test cases.
+OBSERVABILITY_SAMPLE: int | None = _sample_size_from_environ()
+#: The maximum number of observations waiting to be written to disk when
+#: observations are written to files, by setting the
+#: ``HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY`` environment variable.
+#:
+#: Observations are written from a background thread, so that producing one
+#: does not wait for the disk.  This bounds the memory that thread can fall
+#: behind by.
+OBSERVABILITY_QUEUE_SIZE: int = 10_000
+#: What to do with an observation when |OBSERVABILITY_QUEUE_SIZE| observations
+#: are already waiting to be written to disk.  ``"block"`` (the default) waits
+#: until there is room for it, and ``"drop"`` discards it instead, never
+#: slowing down the test which produced it.
+OBSERVABILITY_QUEUE_FULL: Literal["block", "drop"] = "block"
+#: The longest time in seconds between an observation being produced and being
+#: written to disk, when observations are written to files.  Observations are
+#: also written when Hypothesis exits.
+OBSERVABILITY_FLUSH_SECONDS: float = 1.0
 
 if OBSERVABILITY_COLLECT_COVERAGE is False and (
     sys.version_info[:2] >= (3, 12)
@@ -560,9 +1137,10 @@ if (
     or OBSERVABILITY_COLLECT_COVERAGE is False
 ):  # pragma: no cover
     add_observability_callback(_deliver_to_file, all_threads=True)
+    atexit.register(_file_writer.close)
 
     # Remove files more than a week old, to cap the size on disk
     max_age = (date.today() - timedelta(days=8)).isoformat()
-    for p in storage_directory("observed", intent_to_write=False).path.glob("*.jsonl"):
-        if p.stem < max_age:  # pragma: no branch
+    for p in storage_directory("observed", intent_to_write=False).path.glob("*_*.*"):
+        if p.suffix in (".jsonl", ".bin") and p.stem < max_age:  # pragma: no branch
             p.unlink(missing_ok=True)
@@ -0,0 +1,129 @@
+# This file is part of Hypothesis, which may be found at
+# https://github.com/HypothesisWorks/hypothesis/
+#
+# Copyright the Hypothesis Authors.
+# Individual contributors are listed in AUTHORS.rst and the git log.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+"""A best-effort on-disk cache for the results of pure, deterministic and
+expensive computations done while constructing strategies, such as the
+intervals for a charset query.
+
+Each cache is a single JSON file under the Hypothesis storage directory, in a
+subdirectory for the current Hypothesis version, so that a new version never
+reads results computed by an old one.  The file is read once, on first use, and
+new entries are merged into it when the process exits.  Any error reading or
+writing the file is ignored, and we just compute the value again.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+from typing import Any
+
+from hypothesis.configuration import StorageDirectory, storage_directory
+from hypothesis.version import __version__
+
+#: Whether to persist the results of expensive and deterministic parts of
+#: strategy construction, such as charset queries, under the Hypothesis storage
+#: directory so that they can be reused by other processes.
+#:
+#: This may be monkeypatched to ``False`` to disable reading and writing these
+#: files.
+PERSISTENT_STRATEGY_CACHE: bool = True
+
+_caches: list["PersistentCache"] = []
+_caches_lock = threading.Lock()
+
+
+class PersistentCache:
+    """A dict-like mapping from string keys to json-serializable values, which
+    is loaded from and saved to ``{storage}/strategy_cache/{version}/{name}.json``.
+
+    At most ``max_size`` entries are kept, dropping the oldest first.
+    """
+
+    def __init__(self, name: str, *, max_size: int = 1024) -> None:
+        self.name = name
+        self.max_size = max_size
+        self._entries: dict[str, Any] | None = None
+        self._new: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, *, intent_to_write: bool) -> StorageDirectory:
+        return storage_directory(
+            "strategy_cache", __version__, intent_to_write=intent_to_write
+        )
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            path = self._path(intent_to_write=False).path / f"{self.name}.json"
+            entries = json.loads(path.read_bytes())
+            assert isinstance(entries, dict)
+            return entries
+        except Exception:
+            return {}
+
+    def _load(self) -> dict[str, Any]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def get(self, key: str) -> Any:
+        """Return the value for ``key``, or None if it is not cached."""
+        if not PERSISTENT_STRATEGY_CACHE:
+            return None
+        with self._lock:
+            return self._load().get(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if not PERSISTENT_STRATEGY_CACHE:
+            return
+        with self._lock:
+            self._load()[key] = value
+            self._new[key] = value
+        _register(self)
+
+    def save(self) -> None:
+        """Merge any new entries into the file on disk, which another process
+        may have updated since we read it."""
+        with self._lock:
+            if not self._new:
+                return
+            new, self._new = self._new, {}
+        entries = self._read()
+        for key, value in new.items():
+            entries.pop(key, None)
+            entries[key] = value
+        for key in list(entries)[: max(0, len(entries) - self.max_size)]:
+            del entries[key]
+        try:
+            storage_dir = self._path(intent_to_write=True)
+            storage_dir.create_if_missing()
+            # Write the file atomically, so that concurrent readers see either
+            # the old or the new contents.
+            fd, tmpfile = tempfile.mkstemp(dir=storage_dir.path)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, separators=(",", ":"))
+            os.replace(tmpfile, storage_dir.path / f"{self.name}.json")
+        except Exception:
+            pass
+
+
+def _register(cache: PersistentCache) -> None:
+    with _caches_lock:
+        if cache in _caches:
+            return
+        if not _caches:
+            atexit.register(save_all)
+        _caches.append(cache)
+
+
+def save_all() -> None:
+    for cache in _caches:
+        cache.save()
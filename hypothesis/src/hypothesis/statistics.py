@@ -122,6 +122,19 @@ def describe_statistics(stats_dict: "StatisticsDict") -> str:
                     len(cases), d["shrinks-successful"]
                 )
             )
+            passes = d.get("shrink-passes", {})
+            if passes:
+                lines.append("    - Slowest shrink passes:")
+                for name, p in sorted(
+                    passes.items(), key=lambda kv: (-kv[1]["runtime"], kv[0])
+                )[:5]:
+                    avoided = p["cache-hits"] + p["simulated-calls"]
+                    lines.append(
+                        f"      * {name}: {p['runtime']:.2f} seconds, of which "
+                        f"{p['test-runtime']:.2f} in the test function. "
+                        f"{p['shrinks']} of {p['calls']} calls shrank, and "
+                        f"{avoided} calls were avoided by caching"
+                    )
         lines.append("")
 
     target_lines = describe_targets(stats_dict.get("targets", {}))
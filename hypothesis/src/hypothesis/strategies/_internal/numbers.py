@@ -58,6 +58,15 @@ class IntegersStrategy(SearchStrategy[int]):
         assert start is None or end is None or start <= end
         self.start = start
         self.end = end
+        # For bounded integers, make the bounds and near-bounds more likely.
+        self.weights: dict[int, float] | None = None
+        if end is not None and start is not None and end - start > 127:
+            self.weights = {
+                start: (2 / 128),
+                start + 1: (1 / 128),
+                end - 1: (1 / 128),
+                end: (2 / 128),
+            }
 
     def __repr__(self) -> str:
         if self.start is None and self.end is None:
@@ -69,22 +78,8 @@ class IntegersStrategy(SearchStrategy[int]):
         return f"integers({self.start}, {self.end})"
 
     def do_draw(self, data: ConjectureData) -> int:
-        # For bounded integers, make the bounds and near-bounds more likely.
-        weights = None
-        if (
-            self.end is not None
-            and self.start is not None
-            and self.end - self.start > 127
-        ):
-            weights = {
-                self.start: (2 / 128),
-                self.start + 1: (1 / 128),
-                self.end - 1: (1 / 128),
-                self.end: (2 / 128),
-            }
-
         return data.draw_integer(
-            min_value=self.start, max_value=self.end, weights=weights
+            min_value=self.start, max_value=self.end, weights=self.weights
         )
 
     def _invert(self, value: Any) -> tuple[ChoiceT, ...]:
@@ -20,6 +20,7 @@ from hypothesis.internal.conjecture.data import ConjectureData, Status, StopTest
 from hypothesis.internal.conjecture.datatree import (
     Branch,
     DataTree,
+    Summarized,
     compute_max_children,
 )
 from hypothesis.internal.conjecture.engine import ConjectureRunner
@@ -111,6 +112,85 @@ def test_non_dead_root():
         data.draw_boolean()
 
 
+def test_exhausted_prefixes():
+    @runner_for((False, 0.0), (False, -0.0), (True, False), (True, True))
+    def runner(data):
+        if data.draw_boolean():
+            data.draw_boolean()
+        else:
+            data.draw_float()
+
+    prefixes = runner.tree.exhausted_prefixes()
+    assert len(prefixes) == 3
+    assert (True,) in prefixes
+    assert {str(p) for p in prefixes if not p[0]} == {"(False, 0.0)", "(False, -0.0)"}
+
+
+def test_exhausted_tree_has_no_exhausted_prefixes():
+    @runner_for((False,), (True,))
+    def runner(data):
+        data.draw_boolean()
+
+    assert runner.tree.exhausted_prefixes() == []
+
+
+def record(tree, choices, *, draws=2):
+    data = ConjectureData.for_choices(choices, observer=tree.new_observer())
+    for _ in range(draws):
+        data.draw_integer(0, 255)
+    data.freeze()
+    return data
+
+
+def test_tree_node_count_is_bounded():
+    tree = DataTree(max_nodes=50)
+    for i in range(256):
+        record(tree, (i % 16, i // 16))
+        assert tree.node_count <= 50
+
+
+def test_evicts_exhausted_subtrees_first():
+    tree = DataTree(max_nodes=20)
+    for j in range(256):
+        record(tree, (0, j))
+    assert tree.root.transition.children[0].is_exhausted
+    for i in range(1, 4):
+        record(tree, (i, 0))
+    assert isinstance(tree.root.transition.children[0].transition, Summarized)
+    for i in range(1, 4):
+        assert not isinstance(tree.root.transition.children[i].transition, Summarized)
+
+
+def test_can_record_through_summarized_nodes():
+    tree = DataTree(max_nodes=20)
+    for j in range(256):
+        record(tree, (0, j))
+    record(tree, (1, 0))
+    assert isinstance(tree.root.transition.children[0].transition, Summarized)
+    node_count = tree.node_count
+    data = record(tree, (0, 1))
+    assert data.status == Status.VALID
+    assert tree.node_count == node_count
+    assert tree.rewrite((0, 1)) == ((0, 1), None)
+    assert tree.generate_novel_prefix(Random(0))
+
+
+def test_does_not_evict_without_max_nodes():
+    tree = DataTree()
+    for i in range(256):
+        record(tree, (i % 16, i // 16))
+    assert tree.node_count > 256
+
+
+def test_interns_signatures_across_nodes():
+    tree = DataTree()
+    for i in range(10):
+        record(tree, (i, 0))
+    assert tree.signatures.choice_types == ["integer"]
+    children = list(tree.root.transition.children.values())
+    assert all(child.constraints[0] is children[0].constraints[0] for child in children)
+
+
 def test_can_reexecute_dead_examples():
     @runner_for((False, False), (False, True), (False, False))
     def runner(data):
@@ -396,6 +396,30 @@ def test_does_not_save_on_interrupt():
     assert not db.data
 
 
+class FlushCountingDatabase(InMemoryExampleDatabase):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_flushes_database_at_end_of_run(fails):
+    def f(data):
+        if data.draw_boolean() and fails:
+            data.mark_interesting(interesting_origin())
+
+    db = FlushCountingDatabase()
+    runner = ConjectureRunner(
+        f, settings=settings(max_examples=10, database=db), database_key=b"key"
+    )
+    runner.run()
+    assert db.flushes == 1
+    assert bool(db.data.get(b"key")) == fails
+
+
 def test_saves_on_skip_exceptions_to_reraise():
     # skip exceptions should be saved to the db so we spend as little time as
     # possible exploring these tests in the future (if eg the skip is guarded
@@ -965,6 +989,45 @@ def test_exit_because_shrink_phase_timeout(monkeypatch):
     assert runner.statistics["stopped-because"] == "shrinking was very slow"
 
 
+def test_exit_because_shrink_time_budget(monkeypatch):
+    val = 0
+
+    def fast_time():
+        nonlocal val
+        val += 1
+        return val
+
+    def f(data):
+        if data.draw_integer(0, 2**64 - 1) > 2**33:
+            data.mark_interesting(interesting_origin())
+
+    monkeypatch.setattr(time, "perf_counter", fast_time)
+    runner = ConjectureRunner(
+        f,
+        settings=settings(database=None, max_examples=100_000, shrink_time_budget=10),
+    )
+    with capture_out() as out:
+        runner.run()
+    assert runner.exit_reason == ExitReason.shrink_time_budget
+    assert "very slow progress" not in out.getvalue()
+
+
+def test_records_shrink_pass_statistics():
+    def f(data):
+        if sum(data.draw_integer(0, 2**8 - 1) for _ in range(4)) >= 100:
+            data.mark_interesting(interesting_origin())
+
+    runner = ConjectureRunner(
+        f, settings=settings(database=None, max_examples=1000), random=Random(0)
+    )
+    runner.run()
+    passes = runner.statistics["shrink-phase"]["shrink-passes"]
+    assert passes
+    for stats in passes.values():
+        assert 0 <= stats["test-runtime"] <= stats["runtime"]
+    assert sum(stats["shrinks"] for stats in passes.values()) > 0
+
+
 def test_dependent_block_pairs_can_lower_to_zero():
     @shrinking_from((True, 1))
     def shrinker(data: ConjectureData):
@@ -1096,6 +1159,49 @@ def test_will_evict_entries_from_the_cache(monkeypatch):
     assert count == 30
 
 
+def test_passing_choice_sequences_by_prefix():
+    def tf(data):
+        if data.draw_integer(0, 2**8 - 1) == 3:
+            data.mark_invalid()
+        data.draw_integer(0, 2**8 - 1)
+
+    runner = ConjectureRunner(tf, settings=runner_settings)
+    for a in range(5):
+        for b in (0, 1, 255):
+            runner.cached_test_function((a, b))
+
+    def passing(prefix):
+        return {
+            tuple(node.value for node in seq)
+            for seq in runner.passing_choice_sequences(prefix=prefix)
+        }
+
+    all_nodes = runner.cached_test_function((1, 0)).nodes
+    assert len(passing(())) == 12
+    assert passing(all_nodes[:1]) == {(1, 0), (1, 1), (1, 255)}
+    assert passing(all_nodes) == {(1, 0)}
+    assert passing(runner.cached_test_function((4, 255)).nodes[:1]) == {
+        (4, 0),
+        (4, 1),
+        (4, 255),
+    }
+
+
+def test_passing_choice_sequences_forgets_evicted_entries(monkeypatch):
+    monkeypatch.setattr(engine_module, "CACHE_SIZE", 5)
+
+    def tf(data):
+        data.draw_integer(0, 2**8 - 1)
+
+    runner = ConjectureRunner(tf, settings=runner_settings)
+    for n in range(10):
+        runner.cached_test_function((n,))
+        assert len(runner.passing_choice_sequences()) == min(n + 1, 5)
+    assert {seq[0].value for seq in runner.passing_choice_sequences()} == set(
+        range(5, 10)
+    )
+
+
 def test_branch_ending_in_write():
     seen = set()
 
@@ -1887,3 +1993,169 @@ def test_flaky_strategy_definition_reports_stateful_steps(monkeypatch):
     with capture_out() as out, pytest.raises(FlakyStrategyDefinition):
         ConjectureRunner(test, settings=settings(database=None)).run()
     assert "Steps leading up to this error" in out.getvalue()
+
+
+def test_skips_prefixes_explored_by_previous_runs(monkeypatch):
+    monkeypatch.setattr(engine_module, "MAX_EXPLORED_PREFIXES", 100)
+    db = InMemoryExampleDatabase()
+    small_branch = []
+
+    def f(data):
+        if data.draw_boolean():
+            small_branch.append(data.draw_integer(0, 3))
+        else:
+            data.draw_integer(0, 2**64)
+
+    def run():
+        small_branch.clear()
+        runner = ConjectureRunner(
+            f,
+            settings=settings(max_examples=100, database=db),
+            database_key=b"key",
+            random=Random(0),
+        )
+        runner.run()
+        return runner
+
+    def saved_prefixes():
+        return [choices_from_bytes(b[1:]) for b in db.fetch(runner.explored_key)]
+
+    runner = run()
+    assert sorted(small_branch) == [0, 1, 2, 3]
+    # we also save individual test cases under the False branch, which are
+    # trivially explored completely.
+    saved = saved_prefixes()
+    assert 0 < len(saved) <= 100
+    assert [p for p in saved if p[0]] == [(True,)]
+
+    run()
+    assert len(small_branch) < 4
+    # the explored prefix is still remembered, even though this run did not
+    # explore it completely.
+    assert (True,) in saved_prefixes()
+
+
+def test_saved_explored_prefixes_expire(monkeypatch):
+    monkeypatch.setattr(engine_module, "MAX_EXPLORED_PREFIXES", 100)
+    monkeypatch.setattr(engine_module, "EXPLORED_PREFIX_RUNS", 2)
+    db = InMemoryExampleDatabase()
+    small_branch = []
+
+    def f(data):
+        if data.draw_boolean():
+            small_branch.append(data.draw_integer(0, 3))
+        else:
+            data.draw_integer(0, 2**64)
+
+    def run():
+        small_branch.clear()
+        runner = ConjectureRunner(
+            f,
+            settings=settings(max_examples=100, database=db),
+            database_key=b"key",
+            random=Random(0),
+        )
+        runner.run()
+        return {choices_from_bytes(b[1:]): b[0] for b in db.fetch(runner.explored_key)}
+
+    assert run()[(True,)] == 2
+    # the next run skips the explored branch, and so counts down its expiry
+    assert run()[(True,)] == 1
+    assert len(small_branch) < 4
+    assert (True,) not in run()
+    # once expired, we explore the branch again
+    assert run()[(True,)] == 2
+    assert sorted(small_branch) == [0, 1, 2, 3]
+
+
+def test_skips_saved_explored_prefixes_only_once_reached(monkeypatch):
+    monkeypatch.setattr(engine_module, "MAX_EXPLORED_PREFIXES", 100)
+    db = InMemoryExampleDatabase()
+
+    def f(data):
+        data.draw_integer(0, 2**64)
+
+    runner = ConjectureRunner(
+        f, settings=settings(max_examples=10, database=db), database_key=b"key"
+    )
+    runner.load_explored_prefixes()
+    assert not runner._previously_explored((5,))
+    db.save(runner.explored_key, bytes([3]) + choices_to_bytes((5,)))
+    runner.load_explored_prefixes()
+    # the test may have changed since we saved this prefix, so we don't skip
+    # it until we have seen that the test still reaches it.
+    assert not runner._previously_explored((5,))
+    runner.cached_test_function((6,))
+    assert not runner._previously_explored((5,))
+    runner.cached_test_function((5,))
+    assert runner._previously_explored((5,))
+
+
+def test_does_not_save_explored_prefixes_by_default():
+    db = InMemoryExampleDatabase()
+
+    def f(data):
+        data.draw_boolean()
+
+    runner = ConjectureRunner(
+        f, settings=settings(max_examples=10, database=db), database_key=b"key"
+    )
+    runner.run()
+    assert not list(db.fetch(runner.explored_key))
+
+
+def nested_branches(data):
+    # Simulates tracing a test function which only reaches each branch if it
+    # took all the branches before it, and fails at the end of the chain.
+    values = [data.draw_integer(0, 15) for _ in range(3)]
+    depth = 0
+    while depth < 3 and values[depth] == (13, 6, 9)[depth]:
+        depth += 1
+    data.branches = frozenset((None, ("test", i)) for i in range(depth + 1))
+    if depth == 3:
+        data.mark_interesting(interesting_origin())
+
+
+def test_coverage_guided_generation_keeps_test_cases_covering_new_branches(
+    monkeypatch,
+):
+    monkeypatch.setattr(engine_module, "COVERAGE_GUIDED", True)
+
+    def f(data):
+        n = data.draw_integer(0, 3)
+        data.branches = frozenset({(None, ("test", n))})
+
+    runner = ConjectureRunner(
+        f, settings=settings(max_examples=100, database=None), random=Random(0)
+    )
+    runner.run()
+    assert runner._covered_branches == {(None, ("test", n)) for n in range(4)}
+    assert sorted(data.choices for data in runner._coverage_corpus) == [
+        (0,),
+        (1,),
+        (2,),
+        (3,),
+    ]
+
+
+def test_coverage_guided_generation_reaches_nested_branches(monkeypatch):
+    monkeypatch.setattr(engine_module, "COVERAGE_GUIDED", True)
+    runner = ConjectureRunner(
+        nested_branches,
+        settings=settings(max_examples=1000, database=None, phases=[Phase.generate]),
+        random=Random(0),
+    )
+    runner.run()
+    assert runner.interesting_test_cases
+    assert len(runner._coverage_corpus) == 4
+
+
+def test_ignores_branches_unless_coverage_guided():
+    runner = ConjectureRunner(
+        nested_branches,
+        settings=settings(max_examples=100, database=None),
+        random=Random(0),
+    )
+    runner.run()
+    assert not runner._covered_branches
+    assert not runner._coverage_corpus
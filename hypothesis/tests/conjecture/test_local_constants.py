@@ -10,18 +10,27 @@
 
 import math
 import sys
-from types import SimpleNamespace
+from random import Random
+from types import ModuleType, SimpleNamespace
 
 import pytest
 
 from hypothesis import given, settings, strategies as st
 from hypothesis.configuration import StorageDirectory
 from hypothesis.internal.conjecture import providers
-from hypothesis.internal.conjecture.choice import choice_equal
-from hypothesis.internal.conjecture.providers import CONSTANTS_CACHE
+from hypothesis.internal.conjecture.choice import (
+    choice_constraints_key,
+    choice_equal,
+)
+from hypothesis.internal.conjecture.providers import (
+    CONSTANTS_CACHE,
+    HypothesisProvider,
+)
 from hypothesis.internal.constants_ast import Constants
+from hypothesis.internal.intervalsets import IntervalSet
 
 from tests.common.debug import find_any
+from tests.conjecture.common import float_constr, integer_constr, string_constr
 from tests.common.utils import Why, xfail_on_crosshair
 
 
@@ -106,3 +115,92 @@ def test_unhashable_sys_modules_entry(monkeypatch):
     monkeypatch.setitem(sys.modules, "_unhashable_test_mod", SimpleNamespace())
 
     providers._get_local_constants()
+
+
+def test_new_local_constants_are_merged_into_cached_pools(monkeypatch):
+    monkeypatch.setattr(providers, "_sys_modules_len", None)
+    monkeypatch.setattr(providers, "_seen_modules", set())
+    monkeypatch.setattr(providers, "_local_constants", Constants())
+    monkeypatch.setattr(
+        providers,
+        "_local_constants_added",
+        {choice_type: [] for choice_type in providers._local_constants_added},
+    )
+    monkeypatch.setattr(providers, "is_local_module_file", lambda f: f == "fake.py")
+    monkeypatch.setattr(
+        providers,
+        "constants_from_module",
+        lambda module: Constants(integers={5000, 3000, 10**9}),
+    )
+    CONSTANTS_CACHE.cache.clear()
+
+    ints = integer_constr(0, 10**6)
+    strings = string_constr(IntervalSet.from_string("abc"))
+    int_key = ("integer", choice_constraints_key("integer", ints))
+    str_key = ("string", choice_constraints_key("string", strings))
+
+    def draw_constants():
+        provider = HypothesisProvider(None)
+        provider._random = Random(0)
+        provider._maybe_draw_constant("integer", ints, p=1)
+        provider._maybe_draw_constant("string", strings, p=1)
+
+    draw_constants()
+    assert CONSTANTS_CACHE.cache[int_key][1:] == ((), 0)
+    string_pool = CONSTANTS_CACHE.cache[str_key]
+
+    module = ModuleType("fake")
+    module.__file__ = "fake.py"
+    monkeypatch.setitem(sys.modules, "fake", module)
+    draw_constants()
+    # only the permitted new constants are merged into the integer pool, and
+    # the string pool is untouched.
+    assert CONSTANTS_CACHE.cache[int_key][1:] == ((3000, 5000), 1)
+    assert CONSTANTS_CACHE.cache[str_key] is string_pool
+
+
+def test_merged_local_constant_pools_match_fresh_ones(monkeypatch):
+    monkeypatch.setattr(providers, "_sys_modules_len", None)
+    monkeypatch.setattr(providers, "_seen_modules", set())
+    monkeypatch.setattr(providers, "_local_constants", Constants())
+    monkeypatch.setattr(
+        providers,
+        "_local_constants_added",
+        {choice_type: [] for choice_type in providers._local_constants_added},
+    )
+    monkeypatch.setattr(
+        providers, "is_local_module_file", lambda f: f in ("first.py", "second.py")
+    )
+    batches = {
+        "first": Constants(strings={"bb", "cab", "b"}, floats={2.5, -1.0}),
+        "second": Constants(strings={"ab", "ca", "a"}, floats={-0.0, 1.5}),
+    }
+    monkeypatch.setattr(
+        providers, "constants_from_module", lambda module: batches[module.__name__]
+    )
+    CONSTANTS_CACHE.cache.clear()
+
+    strings = string_constr(IntervalSet.from_string("abc"))
+    floats = float_constr(-10, 10)
+    keys = [
+        ("string", choice_constraints_key("string", strings)),
+        ("float", choice_constraints_key("float", floats)),
+    ]
+
+    def draw_constants():
+        provider = HypothesisProvider(None)
+        provider._random = Random(0)
+        provider._maybe_draw_constant("string", strings, p=1)
+        provider._maybe_draw_constant("float", floats, p=1)
+
+    for name in batches:
+        module = ModuleType(name)
+        module.__file__ = f"{name}.py"
+        monkeypatch.setitem(sys.modules, name, module)
+        draw_constants()
+    merged = [CONSTANTS_CACHE.cache[key][1] for key in keys]
+    assert merged[0] == ("a", "ab", "b", "bb", "ca", "cab")
+
+    CONSTANTS_CACHE.cache.clear()
+    draw_constants()
+    assert [CONSTANTS_CACHE.cache[key][1] for key in keys] == merged
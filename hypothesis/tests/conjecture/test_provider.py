@@ -56,7 +56,8 @@ from hypothesis.internal.conjecture.providers import (
     HypothesisProvider,
     with_register_backend,
 )
-from hypothesis.internal.floats import SIGNALING_NAN, clamp
+from hypothesis.internal.floats import SIGNALING_NAN, clamp, float_to_int
+from hypothesis.internal import observability
 from hypothesis.internal.intervalsets import IntervalSet
 from hypothesis.internal.observability import Observation, _callbacks
 
@@ -545,6 +546,24 @@ def test_custom_observations_from_backend():
     assert {"title": "trivial-data", "content": {"k2": "v2"}} in infos
 
 
+def test_sampled_observability_delivers_every_information_message(monkeypatch):
+    monkeypatch.setattr(observability, "OBSERVABILITY_SAMPLE", 0)
+    with temp_register_backend("observable", ObservableProvider):
+
+        @given(st.booleans())
+        @settings(backend="observable", database=None, max_examples=10)
+        def test_function(_):
+            pass
+
+        with capture_observations() as ls:
+            test_function()
+
+    assert not [t for t in ls if t.type == "test_case"]
+    (summary,) = [t for t in ls if t.title == "Hypothesis Test Case Summary"]
+    infos = [t for t in ls if t.title == "trivial-data"]
+    assert len(infos) >= summary.content["test_cases"]
+
+
 class NeverProceedsObservable(ObservableProvider):
     def realize(self, value, *, for_failure=False):
         raise BackendCannotProceed
@@ -825,6 +844,40 @@ class ObservingHypothesisProvider(HypothesisProvider):
         yield {"type": "info", "title": "observing-provider", "content": {}}
 
 
+def test_default_batched_draws_call_single_draws():
+    provider = PrngProvider(None)
+    integers = provider.draw_integers(5, 0, 10)
+    floats = provider.draw_floats(5, min_value=0.0, smallest_nonzero_magnitude=1.0)
+    booleans = provider.draw_booleans(5, p=0.5)
+
+    expected = PrngProvider(None)
+    assert integers == [expected.draw_integer(0, 10) for _ in range(5)]
+    assert floats == [
+        expected.draw_float(min_value=0.0, smallest_nonzero_magnitude=1.0)
+        for _ in range(5)
+    ]
+    assert booleans == [expected.draw_boolean(0.5) for _ in range(5)]
+
+
+@pytest.mark.parametrize(
+    "method, constraints",
+    [
+        ("integer", {"min_value": 0, "max_value": 1000, "weights": {0: 0.1}}),
+        ("integer", {}),
+        ("float", {"min_value": -1.0, "smallest_nonzero_magnitude": 1e-300}),
+        ("boolean", {"p": 0.3}),
+    ],
+)
+def test_hypothesis_provider_batched_draws_match_single_draws(method, constraints):
+    provider = ConjectureData(random=Random(0)).provider
+    batch = getattr(provider, f"draw_{method}s")(50, **constraints)
+    provider = ConjectureData(random=Random(0)).provider
+    single = [getattr(provider, f"draw_{method}")(**constraints) for _ in range(50)]
+    if method == "float":
+        batch, single = [list(map(float_to_int, xs)) for xs in (batch, single)]
+    assert batch == single
+
+
 @pytest.mark.parametrize(
     "provider", [HypothesisProvider, PrngProvider, ObservingHypothesisProvider]
 )
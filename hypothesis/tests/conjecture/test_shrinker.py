@@ -10,19 +10,25 @@
 
 import dataclasses
 import datetime as dt
+import json
 import time
 
 import pytest
 
 from hypothesis import HealthCheck, assume, example, given, settings, strategies as st
 from hypothesis.control import BuildContext
+from hypothesis.database import InMemoryExampleDatabase
 from hypothesis.errors import CannotInvert
 from hypothesis.internal.compat import PYPY
-from hypothesis.internal.conjecture.data import ChoiceNode, ConjectureData
+from hypothesis.internal.conjecture.data import ChoiceNode, ConjectureData, Status
 from hypothesis.internal.conjecture.datatree import compute_max_children
 from hypothesis.internal.conjecture.engine import ConjectureRunner
 from hypothesis.internal.conjecture.shrinker import Shrinker, ShrinkPass, StopShrinking
 from hypothesis.internal.conjecture.shrinking.common import Shrinker as ShrinkerPass
+from hypothesis.internal.conjecture.shrinking.scheduler import (
+    MIN_RUNS,
+    ShrinkPassScheduler,
+)
 from hypothesis.internal.conjecture.utils import Sampler
 from hypothesis.internal.floats import MAX_PRECISE_INTEGER
 from hypothesis.strategies._internal.lazy import unwrap_strategies
@@ -1079,3 +1085,166 @@ def test_ephemeral_objects_are_not_widened():
         [ShrinkPass(shrinker.widen_to_span_with_recorded_value)]
     )
     assert shrinker.choices == (1, 0)
+
+
+def interrupt_greedy_shrink(self):
+    self.shrink_passes.reverse()
+    self.shrink_passes[0].last_prefix = (1, 2)
+    raise StopShrinking
+
+
+def test_interrupted_shrink_resumes_from_checkpoint(monkeypatch):
+    def f(data):
+        if sum(data.draw_integer(0, 2**8 - 1) for _ in range(4)) >= 100:
+            data.mark_interesting(interesting_origin())
+
+    db = InMemoryExampleDatabase()
+    runner = ConjectureRunner(
+        f,
+        settings=settings(database=db, suppress_health_check=list(HealthCheck)),
+        database_key=b"key",
+    )
+    data = runner.cached_test_function((255,) * 4)
+    shrinker = runner.new_shrinker(data, lambda d: d.status == Status.INTERESTING)
+    with monkeypatch.context() as m:
+        m.setattr(Shrinker, "greedy_shrink", interrupt_greedy_shrink)
+        shrinker.shrink()
+    assert len(list(db.fetch(b"key.shrinking"))) == 1
+
+    resumed = runner.new_shrinker(
+        runner.cached_test_function(shrinker.choices),
+        lambda d: d.status == Status.INTERESTING,
+    )
+    called = []
+    monkeypatch.setattr(
+        Shrinker, "initial_coarse_reduction", lambda self: called.append(True)
+    )
+    monkeypatch.setattr(Shrinker, "greedy_shrink", lambda self: None)
+    resumed.shrink()
+    assert not called
+    assert [sp.name for sp in resumed.shrink_passes] == [
+        sp.name for sp in shrinker.shrink_passes
+    ]
+    assert resumed.shrink_passes[0].last_prefix == (1, 2)
+
+
+def test_completed_shrink_deletes_checkpoint(monkeypatch):
+    def f(data):
+        if sum(data.draw_integer(0, 2**8 - 1) for _ in range(4)) >= 100:
+            data.mark_interesting(interesting_origin())
+
+    db = InMemoryExampleDatabase()
+    runner = ConjectureRunner(
+        f,
+        settings=settings(database=db, suppress_health_check=list(HealthCheck)),
+        database_key=b"key",
+    )
+    data = runner.cached_test_function((255,) * 4)
+    shrinker = runner.new_shrinker(data, lambda d: d.status == Status.INTERESTING)
+    with monkeypatch.context() as m:
+        m.setattr(Shrinker, "greedy_shrink", interrupt_greedy_shrink)
+        shrinker.shrink()
+
+    resumed = runner.new_shrinker(
+        runner.cached_test_function(shrinker.choices),
+        lambda d: d.status == Status.INTERESTING,
+    )
+    resumed.shrink()
+    assert resumed.choices == (0, 0, 0, 100)
+    assert not list(db.fetch(b"key.shrinking"))
+
+
+def test_deletes_checkpoints_for_stale_targets():
+    def f(data):
+        if data.draw_integer(0, 2**8 - 1) >= 100:
+            data.mark_interesting(interesting_origin())
+
+    db = InMemoryExampleDatabase()
+    db.save(b"key.shrinking", b"not json")
+    db.save(b"key.shrinking", b'{"target":"0","coarse":true,"passes":[]}')
+    runner = ConjectureRunner(
+        f,
+        settings=settings(database=db, suppress_health_check=list(HealthCheck)),
+        database_key=b"key",
+    )
+    data = runner.cached_test_function((255,))
+    shrinker = runner.new_shrinker(data, lambda d: d.status == Status.INTERESTING)
+    shrinker._resume_from_checkpoint()
+    assert not list(db.fetch(b"key.shrinking"))
+
+
+def test_scheduler_learns_shrink_pass_order_across_shrinks():
+    db = InMemoryExampleDatabase()
+    useless = ShrinkPass(lambda chooser: None, name="useless", calls=10)
+    deleter = ShrinkPass(lambda chooser: None, name="deleter", calls=10, deletions=3)
+    for _ in range(MIN_RUNS):
+        ShrinkPassScheduler(db, b"key").record([useless, deleter])
+
+    scheduler = ShrinkPassScheduler(db, b"key")
+    passes = [useless, ShrinkPass(lambda chooser: None, name="unknown"), deleter]
+    scheduler.order(passes)
+    assert [sp.name for sp in passes] == ["deleter", "unknown", "useless"]
+    assert scheduler.max_failures(useless) < scheduler.max_failures(deleter)
+
+    # each test learns only from its own history
+    other = ShrinkPassScheduler(db, b"other")
+    assert other.max_failures(useless) > scheduler.max_failures(useless)
+
+
+def test_scheduler_does_not_sum_concurrent_snapshots():
+    db = InMemoryExampleDatabase()
+    first = ShrinkPassScheduler(db, b"key")
+    second = ShrinkPassScheduler(db, b"key")
+    assert first.history("p") is None
+    assert second.history("p") is None
+    first.record([ShrinkPass(lambda chooser: None, name="p", calls=1)])
+    second.record([ShrinkPass(lambda chooser: None, name="p", calls=2)])
+    assert len(list(db.fetch(b"key"))) == 2
+
+    scheduler = ShrinkPassScheduler(db, b"key")
+    assert scheduler._stats()["p"][0] == 1
+    scheduler.record([ShrinkPass(lambda chooser: None, name="p", calls=1)])
+    (stats,) = db.fetch(b"key")
+    assert json.loads(stats)["p"][0] == 2
+
+
+def test_shrink_records_shrink_pass_statistics():
+    def f(data):
+        if sum(data.draw_integer(0, 2**8 - 1) for _ in range(4)) >= 100:
+            data.mark_interesting(interesting_origin())
+
+    db = InMemoryExampleDatabase()
+    runner = ConjectureRunner(
+        f,
+        settings=settings(database=db, suppress_health_check=list(HealthCheck)),
+        database_key=b"key",
+    )
+    data = runner.cached_test_function((255,) * 4)
+    runner.new_shrinker(data, lambda d: d.status == Status.INTERESTING).shrink()
+    (stats,) = db.fetch(b"key.shrink-passes")
+    assert "minimize_individual_choices" in json.loads(stats)
+
+
+def test_shrink_time_budget_skips_low_yield_passes():
+    @shrinking_from((255,) * 4)
+    def shrinker(data: ConjectureData):
+        if sum(data.draw_integer(0, 2**8 - 1) for _ in range(4)) >= 100:
+            data.mark_interesting(interesting_origin())
+
+    shrinker.engine.settings = settings(shrinker.engine.settings, shrink_time_budget=10)
+    slow = ShrinkPass(lambda chooser: None, name="slow", runtime=6.0)
+    fast = ShrinkPass(lambda chooser: None, name="fast", runtime=1.0, shrinks=5)
+    assert shrinker.is_low_yield(slow, [slow, fast])
+    assert not shrinker.is_low_yield(fast, [slow, fast])
+
+
+def test_delete_child_spans_deletes_irrelevant_elements_in_few_calls():
+    @shrinking_from((True, 50) * 700 + (True, 500) + (True, 50) * 299 + (False,))
+    def shrinker(data: ConjectureData):
+        if any(x >= 100 for x in data.draw(st.lists(st.integers(0, 1000)))):
+            data.mark_interesting(interesting_origin())
+
+    initial_calls = shrinker.engine.call_count
+    shrinker.fixate_shrink_passes([ShrinkPass(shrinker.delete_child_spans)])
+    assert shrinker.choices == (True, 500, False)
+    assert shrinker.engine.call_count - initial_calls <= 50
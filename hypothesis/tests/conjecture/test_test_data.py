@@ -10,6 +10,7 @@
 
 import gc
 import itertools
+from random import Random
 
 import pytest
 
@@ -29,7 +30,11 @@ from hypothesis.internal.conjecture.data import (
 )
 from hypothesis.strategies import SearchStrategy
 
-from tests.conjecture.common import buffer_size_limit, interesting_origin
+from tests.conjecture.common import (
+    buffer_size_limit,
+    fresh_data,
+    interesting_origin,
+)
 
 
 def test_cannot_draw_after_freeze():
@@ -213,6 +218,61 @@ def test_can_observe_draws():
     ]
 
 
+def test_batched_draws_record_individual_choices():
+    log = []
+
+    class LoggingObserver(DataObserver):
+        def draw_integer(self, value: int, *, was_forced: bool, constraints: dict):
+            log.append(value)
+
+    d = fresh_data(random=Random(0), observer=LoggingObserver())
+    values = d.draw_integers(5, 0, 10)
+    floats = d.draw_floats(3, 0.0, 1.0)
+    booleans = d.draw_booleans(4)
+    assert log == values
+    assert d.choices == (*values, *floats, *booleans)
+    assert [node.index for node in d.nodes] == list(range(12))
+
+    replay = ConjectureData.for_choices(d.choices)
+    assert [replay.draw_integer(0, 10) for _ in range(5)] == values
+    assert [replay.draw_float(0.0, 1.0) for _ in range(3)] == floats
+    assert replay.draw_booleans(4) == booleans
+
+
+def test_batched_draws_replay_then_generate():
+    d = ConjectureData(prefix=(1, 2), random=Random(0))
+    values = d.draw_integers(5, 0, 10)
+    assert values[:2] == [1, 2]
+    assert len(d.nodes) == 5
+
+
+def test_batched_draws_can_give_each_choice_a_span():
+    d = ConjectureData(prefix=(1, 2), random=Random(0))
+    d.draw_integers(5, 0, 10, label=1)
+    d.draw_booleans(2)
+    d.freeze()
+    assert [(s.label, s.start, s.end) for s in d.spans][1:] == [
+        (1, i, i + 1) for i in range(5)
+    ]
+
+
+def test_batched_draws_overrun_at_max_choices():
+    d = ConjectureData.for_choices((1, 2))
+    with pytest.raises(StopTest):
+        d.draw_integers(3, 0, 10)
+    assert d.status == Status.OVERRUN
+    assert d.choices == (1, 2)
+
+
+def test_batched_draws_overrun_at_max_length():
+    d = fresh_data(random=Random(0))
+    d.max_length = 10
+    with pytest.raises(StopTest):
+        d.draw_integers(100, 0, 10)
+    assert d.status == Status.OVERRUN
+    assert 0 < len(d.nodes) < 100
+
+
 def test_calls_concluded_implicitly():
     class NoteConcluded(DataObserver):
         def conclude_test(self, status, reason):
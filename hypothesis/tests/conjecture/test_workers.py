@@ -0,0 +1,227 @@
+# This file is part of Hypothesis, which may be found at
+# https://github.com/HypothesisWorks/hypothesis/
+#
+# Copyright the Hypothesis Authors.
+# Individual contributors are listed in AUTHORS.rst and the git log.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+import threading
+from random import Random
+
+import pytest
+
+from hypothesis import HealthCheck, given, settings, strategies as st
+from hypothesis.internal.conjecture import engine as engine_module
+from hypothesis.internal.conjecture.engine import ConjectureRunner, ExitReason
+from hypothesis.internal.conjecture.shrinker import Shrinker
+from hypothesis.internal.conjecture.workers import can_fork_workers
+
+from tests.conjecture.common import interesting_origin
+
+pytestmark = pytest.mark.skipif(
+    not can_fork_workers(), reason="worker processes require os.fork"
+)
+
+worker_settings = settings(
+    max_examples=200,
+    database=None,
+    suppress_health_check=list(HealthCheck),
+    workers=2,
+)
+
+
+@pytest.fixture
+def pool_runs(monkeypatch):
+    runs = []
+    original = engine_module.WorkerPool.run
+
+    def run(self, test_cases, **kwargs):
+        runs.append(len(test_cases))
+        return original(self, test_cases, **kwargs)
+
+    monkeypatch.setattr(engine_module.WorkerPool, "run", run)
+    return runs
+
+
+def test_runs_test_cases_in_workers(pool_runs):
+    def f(data):
+        data.draw_integer(0, 2**32)
+
+    runner = ConjectureRunner(f, settings=worker_settings, random=Random(0))
+    runner.run()
+    assert pool_runs
+    assert runner.valid_test_cases == worker_settings.max_examples
+    assert runner.exit_reason == ExitReason.max_examples
+    assert runner._worker_pool is None
+
+
+def test_exhausts_tree_from_worker_results(pool_runs):
+    def f(data):
+        data.draw_integer(0, 100)
+
+    runner = ConjectureRunner(f, settings=worker_settings, random=Random(0))
+    runner.run()
+    assert pool_runs
+    assert runner.exit_reason == ExitReason.finished
+    assert runner.tree.is_exhausted
+    # the coordinator's tree should prevent workers repeating a test case
+    assert runner.valid_test_cases == 101
+
+
+def test_shrinks_failure_found_in_worker(pool_runs):
+    def f(data):
+        if data.draw_integer(0, 2**16) >= 1000:
+            data.mark_interesting(interesting_origin())
+
+    runner = ConjectureRunner(f, settings=worker_settings, random=Random(0))
+    runner.run()
+    (result,) = runner.interesting_test_cases.values()
+    assert result.choices == (1000,)
+
+
+def test_caches_passing_test_cases_from_workers(pool_runs):
+    def f(data):
+        data.draw_integer(0, 2**32)
+
+    runner = ConjectureRunner(f, settings=worker_settings, random=Random(0))
+    runner.run()
+    assert pool_runs
+    passing = runner.passing_choice_sequences()
+    assert len(passing) >= worker_settings.max_examples
+    calls = runner.call_count
+    for nodes in passing:
+        runner.cached_test_function([node.value for node in nodes])
+    assert runner.call_count == calls
+
+
+def test_mutates_test_cases_from_workers(pool_runs, monkeypatch):
+    mutated = []
+    original = ConjectureRunner.generate_mutations_from
+
+    def generate_mutations_from(self, data):
+        if self.health_check_state is None:
+            mutated.append(data.choices)
+        original(self, data)
+
+    monkeypatch.setattr(
+        ConjectureRunner, "generate_mutations_from", generate_mutations_from
+    )
+
+    def f(data):
+        data.draw_integer(0, 2**32)
+
+    runner = ConjectureRunner(f, settings=worker_settings, random=Random(0))
+    runner.run()
+    assert pool_runs
+    assert mutated
+
+
+def test_replays_killed_branches(pool_runs):
+    def f(data):
+        data.start_span(1)
+        data.draw_integer(0, 50)
+        data.stop_span(discard=True)
+        data.draw_integer(0, 2**32)
+
+    runner = ConjectureRunner(f, settings=worker_settings, random=Random(0))
+    runner.run()
+    assert pool_runs
+    # every branch is killed after the first draw, so we can only exhaust the
+    # tree if the kills from worker processes are recorded.
+    assert runner.exit_reason == ExitReason.finished
+    assert runner.valid_test_cases == 51
+
+
+def test_falls_back_to_serial_with_other_threads(pool_runs):
+    done = threading.Event()
+    thread = threading.Thread(target=done.wait)
+    thread.start()
+    try:
+
+        def f(data):
+            data.draw_integer(0, 2**32)
+
+        runner = ConjectureRunner(f, settings=worker_settings, random=Random(0))
+        runner.run()
+    finally:
+        done.set()
+        thread.join()
+    assert not pool_runs
+    assert runner.valid_test_cases == worker_settings.max_examples
+
+
+def test_given_with_workers_reports_failure():
+    @worker_settings
+    @given(st.lists(st.integers()))
+    def test(xs):
+        assert sum(xs) < 1000
+
+    with pytest.raises(AssertionError):
+        test()
+
+
+def test_speculated_test_cases_are_cached(pool_runs):
+    calls = []
+
+    def f(data):
+        calls.append(data.draw_integer(0, 100))
+
+    runner = ConjectureRunner(f, settings=worker_settings, random=Random(0))
+    assert runner.can_speculate
+    try:
+        runner.speculate([[1], [2], [3]])
+        assert pool_runs == [3]
+        # speculated test cases only count as calls once they're used
+        assert runner.call_count == 0
+        for i in [1, 2, 3]:
+            assert runner.cached_test_function([i]).choices == (i,)
+        assert runner.call_count == 3
+        assert runner.cached_test_function([1]).choices == (1,)
+        assert runner.call_count == 3
+        assert calls == []
+    finally:
+        runner._worker_pool.close()
+
+
+def test_speculative_shrinking_matches_serial_shrinking(pool_runs, monkeypatch):
+    steps = []
+    original_step = Shrinker.step
+
+    def step(self, *args, **kwargs):
+        steps.append(None)
+        return original_step(self, *args, **kwargs)
+
+    monkeypatch.setattr(Shrinker, "step", step)
+
+    def f(data):
+        n = data.draw_integer(0, 30)
+        xs = [data.draw_integer(0, 10**6) for _ in range(n)]
+        if n >= 3 and sum(xs) > 2000:
+            data.mark_interesting(interesting_origin())
+
+    def shrink(workers):
+        steps.clear()
+        runner = ConjectureRunner(
+            f, settings=settings(worker_settings, workers=workers), random=Random(0)
+        )
+        initial = runner.cached_test_function((25, *(10**5 - 7 * i for i in range(25))))
+        shrinker = runner.new_shrinker(initial, lambda d: d.status == initial.status)
+        try:
+            shrinker.shrink()
+        finally:
+            if runner._worker_pool is not None:
+                runner._worker_pool.close()
+        return (
+            shrinker.shrink_target.choices,
+            len(steps),
+            shrinker.calls,
+            [(sp.name, sp.calls, sp.shrinks) for sp in shrinker.shrink_passes],
+        )
+
+    serial = shrink(1)
+    assert serial[0] == (3, 0, 0, 2001)
+    assert shrink(2) == serial
+    assert pool_runs
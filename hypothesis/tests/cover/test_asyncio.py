@@ -9,12 +9,14 @@
 # obtain one at https://mozilla.org/MPL/2.0/.
 
 import asyncio
+import time
 import warnings
 from unittest import TestCase
 
 import pytest
 
 from hypothesis import assume, given, settings, strategies as st
+from hypothesis.errors import DeadlineExceeded
 from hypothesis.internal.compat import PYPY
 
 from tests.common.utils import skipif_emscripten
@@ -93,3 +95,105 @@ class TestAsyncioRun(TestCase):
         assume(x)
         await asyncio.sleep(0.001)
         assert x
+
+
+@skipif_emscripten
+def test_runs_async_test_functions_natively():
+    calls = []
+
+    @settings(database=None)
+    @given(st.integers())
+    async def test(x):
+        await asyncio.sleep(0)
+        calls.append(asyncio.get_running_loop())
+
+    test()
+    assert len(calls) == settings().max_examples
+    # one event loop per test function, shared by all test cases, and
+    # closed once the test function returns
+    assert len(set(calls)) == 1
+    assert calls[0].is_closed()
+
+
+@skipif_emscripten
+def test_native_async_test_failures_are_shrunk():
+    @settings(database=None)
+    @given(st.integers())
+    async def test(x):
+        await asyncio.sleep(0)
+        assert x < 10
+
+    with pytest.raises(AssertionError) as err:
+        test()
+    assert "x=10" in "\n".join(err.value.__notes__)
+
+
+@skipif_emscripten
+def test_native_async_deadline_cancels_with_loop_time():
+    cancelled = []
+
+    @settings(database=None, deadline=50, derandomize=True, max_examples=5)
+    @given(st.integers())
+    async def test(x):
+        try:
+            # advance the clock ourselves, so this works if time is mocked
+            while True:
+                time.sleep(0.01)  # noqa: ASYNC251
+                await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+
+    with pytest.raises(DeadlineExceeded):
+        test()
+    assert cancelled
+
+
+def slow_integers():
+    def slow(x):
+        time.sleep(0.1)
+        return x
+
+    return st.integers().map(slow)
+
+
+@skipif_emscripten
+def test_native_async_deadline_excludes_draw_time():
+    @settings(database=None, deadline=50, max_examples=5)
+    @given(st.data())
+    async def test(data):
+        data.draw(slow_integers())
+        # give the deadline a chance to cancel us
+        for _ in range(2):
+            await asyncio.sleep(0)
+
+    test()
+
+
+@skipif_emscripten
+def test_native_async_fuzz_one_input_closes_event_loop():
+    loops = []
+
+    @given(st.integers())
+    async def test(x):
+        loops.append(asyncio.get_running_loop())
+
+    fuzz = test.hypothesis.fuzz_one_input
+    fuzz(bytes(100))
+    fuzz(bytes(range(100)))
+    assert len(loops) == 2
+    assert all(loop.is_closed() for loop in loops)
+
+
+@skipif_emscripten
+def test_native_async_cancels_leftover_tasks():
+    tasks = []
+
+    @settings(database=None, max_examples=3)
+    @given(st.integers())
+    async def test(x):
+        tasks.append(asyncio.create_task(asyncio.sleep(10)))
+
+    test()
+    assert len(tasks) == 3
+    assert all(t.cancelled() for t in tasks)
@@ -8,6 +8,7 @@
 # v. 2.0. If a copy of the MPL was not distributed with this file, You can
 # obtain one at https://mozilla.org/MPL/2.0/.
 
+import mmap
 import os
 import sys
 import tempfile
@@ -87,7 +88,7 @@ def test_reload_charmap():
 def test_recreate_charmap():
     x = cm.charmap()
     assert x is cm.charmap()
-    cm._charmap = None
+    cm._charmap = cm._charmap_table = None
     cm.charmap_file().unlink()
     y = cm.charmap()
     assert x is not y
@@ -122,7 +123,7 @@ def test_uses_cached_charmap():
     assert statinfo.st_mtime == mtime
 
     # Force reload of charmap from cache file and check that mtime is unchanged.
-    cm._charmap = None
+    cm._charmap = cm._charmap_table = None
     cm.charmap()
     statinfo = cm.charmap_file().stat()
     assert statinfo.st_mtime == mtime
@@ -174,7 +175,7 @@ def test_exception_in_write_does_not_lead_to_broken_charmap(monkeypatch):
     def broken(*args, **kwargs):
         raise ValueError
 
-    cm._charmap = None
+    cm._charmap = cm._charmap_table = None
     monkeypatch.setattr(os.path, "exists", lambda p: False)
     monkeypatch.setattr(os, "rename", broken)
 
@@ -186,9 +187,10 @@ def test_exception_in_write_does_not_lead_to_broken_charmap(monkeypatch):
 def test_regenerate_broken_charmap_file():
     cm.charmap()
 
+    # release the memory-mapped file before we truncate it
+    cm._charmap = cm._charmap_table = None
     cm.charmap_file().write_bytes(b"")  # overwrite with empty file
 
-    cm._charmap = None
     cm.charmap()
 
 
@@ -211,16 +213,54 @@ def test_error_writing_charmap_file_is_suppressed(monkeypatch):
     try:
         # Cache the charmap to avoid a performance hit the next time
         # somebody tries to use it.
-        saved = cm._charmap
-        cm._charmap = None
+        saved = cm._charmap, cm._charmap_table
+        cm._charmap = cm._charmap_table = None
         cm.charmap_file().unlink()
 
         cm.charmap()
     finally:
-        cm._charmap = saved
+        cm._charmap, cm._charmap_table = saved
 
 
 def test_categoryname_literal_is_correct():
     minor_categories = set(cm.categories())
     major_categories = {c[0] for c in minor_categories}
     assert set(get_args(cm.CategoryName)) == minor_categories | major_categories
+
+
+@skipif_threading
+def test_charmap_table_is_memory_mapped_from_cache_file():
+    cm.charmap()
+    cm._charmap = cm._charmap_table = None
+    table = cm.charmap_table()
+    assert all(isinstance(v.obj, mmap.mmap) for v in table.values())
+    assert cm.charmap()["Co"] == (
+        (57344, 63743),
+        (983040, 1048573),
+        (1048576, 1114109),
+    )
+
+
+@skipif_threading
+def test_charmap_file_with_wrong_magic_is_regenerated():
+    cm.charmap()
+    cm._charmap = cm._charmap_table = None
+    f = cm.charmap_file()
+    f.write_bytes(b"XXXX" + f.read_bytes()[4:])
+    assert cm.charmap_table()["Co"].tolist() == [
+        57344,
+        63743,
+        983040,
+        1048573,
+        1048576,
+        1114109,
+    ]
+
+
+@given(st.sets(st.sampled_from(cm.categories()), min_size=1))
+def test_query_for_key_is_union_of_categories(cats):
+    key = tuple(c for c in cm.categories() if c in cats)
+    expected = IntervalSet(())
+    for c in key:
+        expected |= IntervalSet(cm.charmap()[c])
+    assert cm._query_for_key(key) == expected.intervals
@@ -10,17 +10,22 @@
 
 import ast
 import inspect
+import os
 import subprocess
 import sys
 import textwrap
+import threading
 from types import ModuleType
 
 import pytest
 
 from hypothesis import example, given, note, settings, strategies as st
+from hypothesis.configuration import StorageDirectory
+from hypothesis.internal import constants_ast
 from hypothesis.internal.compat import PYPY
 from hypothesis.internal.constants_ast import (
     Constants,
+    ConstantsIndex,
     ConstantVisitor,
     TooManyConstants,
     _constants_file_str,
@@ -317,3 +322,133 @@ def test_module_too_large(tmp_path):
     module.__file__ = str(p)
     assert constants_from_module(module) == Constants()
     assert constants_from_module(module, limit=False) == Constants(integers={constant})
+
+
+@pytest.fixture
+def fresh_constants_index(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        constants_ast,
+        "storage_directory",
+        lambda *names, **kwargs: StorageDirectory(
+            tmp_path.joinpath("storage", *names), home_directory=tmp_path / "storage"
+        ),
+    )
+    monkeypatch.setattr(constants_ast, "constants_index", ConstantsIndex())
+    constants_from_module.cache_clear()
+    yield
+    constants_from_module.cache_clear()
+
+
+def _module_from_source(path, source):
+    path.write_text(source, encoding="utf-8")
+    module = ModuleType(path.stem)
+    module.__file__ = str(path)
+    return module
+
+
+@skipif_threading
+def test_constants_index_is_shared_after_save(fresh_constants_index, tmp_path):
+    module = _module_from_source(tmp_path / "a.py", "a = 1234\nb = 'hello'")
+    expected = Constants(integers={1234}, strings={"hello"})
+    assert constants_from_module(module) == expected
+    constants_ast.constants_index.save()
+
+    # a new process reads the index, and doesn't need to look at the source
+    constants_from_module.cache_clear()
+    constants_ast.constants_index = ConstantsIndex()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should have used the index")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(constants_ast, "_constants_from_file", fail)
+        assert constants_from_module(module) == expected
+
+
+@skipif_threading
+def test_constants_index_ignores_changed_files(fresh_constants_index, tmp_path):
+    path = tmp_path / "a.py"
+    module = _module_from_source(path, "a = 1234")
+    assert constants_from_module(module) == Constants(integers={1234})
+    constants_ast.constants_index.save()
+
+    path.write_text("a = 12345", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    constants_from_module.cache_clear()
+    constants_ast.constants_index = ConstantsIndex()
+    assert constants_from_module(module) == Constants(integers={12345})
+
+
+@skipif_threading
+def test_constants_index_drops_deleted_files(fresh_constants_index, tmp_path):
+    a = _module_from_source(tmp_path / "a.py", "a = 1234")
+    b = _module_from_source(tmp_path / "b.py", "b = 5678")
+    constants_from_module(a)
+    constants_from_module(b)
+    (tmp_path / "a.py").unlink()
+    constants_ast.constants_index.save()
+    assert {path for path, _limit in ConstantsIndex()._read()} == {b.__file__}
+
+
+@skipif_threading
+def test_concurrent_constants_index_saves_keep_every_entry(
+    fresh_constants_index, tmp_path, monkeypatch
+):
+    # our tests patch time.sleep to return immediately, and time.monotonic to
+    # advance by the time slept, so we'd otherwise soon give up waiting for the
+    # lock.
+    monkeypatch.setattr(constants_ast, "INDEX_LOCK_TIMEOUT_SECONDS", 10**9)
+    # as if each thread were an xdist worker starting up at the same time
+    modules = [
+        _module_from_source(tmp_path / f"m{i}.py", f"x = {1000 + i}") for i in range(8)
+    ]
+    indexes = []
+    for module in modules:
+        index = ConstantsIndex()
+        index.add(module.__file__, os.stat(module.__file__), Constants(), limit=True)
+        indexes.append(index)
+    barrier = threading.Barrier(len(indexes))
+
+    def save(index):
+        barrier.wait()
+        index.save()
+
+    threads = [threading.Thread(target=save, args=(index,)) for index in indexes]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert {path for path, _limit in ConstantsIndex()._read()} == {
+        m.__file__ for m in modules
+    }
+
+
+@skipif_threading
+def test_constants_index_save_retries_if_locked(
+    fresh_constants_index, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(constants_ast, "INDEX_LOCK_TIMEOUT_SECONDS", 0)
+    module = _module_from_source(tmp_path / "a.py", "a = 1234")
+    constants_from_module(module)
+    cache_dir = constants_ast.storage_directory("constants")
+    cache_dir.create_if_missing()
+
+    with ConstantsIndex()._file_lock(cache_dir.path) as locked:
+        assert locked
+        constants_ast.constants_index.save()
+        assert ConstantsIndex()._read() == {}
+
+    # the lock file is left behind, but isn't locked by anyone
+    assert (cache_dir.path / f"{ConstantsIndex._filename()}.lock").exists()
+    constants_ast.constants_index.save()
+    assert {path for path, _limit in ConstantsIndex()._read()} == {module.__file__}
+
+
+@skipif_threading
+def test_constants_index_is_saved_at_exit(fresh_constants_index, tmp_path):
+    module = _module_from_source(tmp_path / "a.py", "a = 1234")
+    constants_from_module(module)
+    assert ConstantsIndex()._read() == {}
+    constants_ast._save_constants_index()
+    assert {path for path, _limit in ConstantsIndex()._read()} == {module.__file__}
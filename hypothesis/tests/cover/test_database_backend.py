@@ -8,9 +8,11 @@
 # v. 2.0. If a copy of the MPL was not distributed with this file, You can
 # obtain one at https://mozilla.org/MPL/2.0/.
 
+import multiprocessing
 import os
 import re
 import shutil
+import sqlite3
 import tempfile
 import time
 import zipfile
@@ -23,6 +25,7 @@ from shutil import make_archive, rmtree
 
 import pytest
 
+import _hypothesis_globals
 from hypothesis import (
     HealthCheck,
     configuration,
@@ -39,14 +42,21 @@ from hypothesis.database import (
     InMemoryExampleDatabase,
     MultiplexedDatabase,
     ReadOnlyDatabase,
+    SQLiteExampleDatabase,
+    _DatabaseServer,
     _db_for_path,
+    _RemoteDatabase,
     _hash,
     _pack_uleb128,
     _unpack_uleb128,
     choices_from_bytes,
     choices_to_bytes,
 )
-from hypothesis.errors import HypothesisDeprecationWarning, HypothesisWarning
+from hypothesis.errors import (
+    HypothesisDeprecationWarning,
+    HypothesisException,
+    HypothesisWarning,
+)
 from hypothesis.internal.compat import WINDOWS
 from hypothesis.internal.conjecture.choice import choice_equal
 from hypothesis.stateful import (
@@ -113,12 +123,19 @@ def test_does_not_error_when_fetching_when_not_exist(tmp_path):
     db.fetch(b"foo")
 
 
-@pytest.fixture(scope="function", params=["memory", "directory"])
+@pytest.fixture(scope="function", params=["memory", "directory", "sqlite", "remote"])
 def exampledatabase(request, tmp_path):
     if request.param == "memory":
-        return InMemoryExampleDatabase()
-    assert request.param == "directory"
-    return DirectoryBasedExampleDatabase(tmp_path / "examples")
+        yield InMemoryExampleDatabase()
+    elif request.param == "remote":
+        server = _DatabaseServer(DirectoryBasedExampleDatabase(tmp_path / "examples"))
+        yield _RemoteDatabase(server.address, server.authkey)
+        server.close()
+    elif request.param == "sqlite":
+        yield SQLiteExampleDatabase(tmp_path / "examples.db")
+    else:
+        assert request.param == "directory"
+        yield DirectoryBasedExampleDatabase(tmp_path / "examples")
 
 
 def test_can_delete_a_key_that_is_not_present(exampledatabase):
@@ -153,6 +170,43 @@ def test_an_absent_value_is_present_after_it_moves_to_self(exampledatabase):
     assert next(exampledatabase.fetch(b"a")) == b"b"
 
 
+def test_bulk_methods(exampledatabase):
+    exampledatabase.save_many([(b"a", b"1"), (b"a", b"2"), (b"b", b"3")])
+    fetched = exampledatabase.fetch_many([b"a", b"b", b"c"])
+    assert {k: set(vs) for k, vs in fetched.items()} == {
+        b"a": {b"1", b"2"},
+        b"b": {b"3"},
+        b"c": set(),
+    }
+    exampledatabase.delete_many([(b"a", b"1"), (b"b", b"3"), (b"c", b"4")])
+    fetched = exampledatabase.fetch_many([b"a", b"b"])
+    assert {k: set(vs) for k, vs in fetched.items()} == {b"a": {b"2"}, b"b": set()}
+
+
+def test_bulk_methods_on_wrappers():
+    db1 = InMemoryExampleDatabase()
+    db2 = InMemoryExampleDatabase()
+    db2.save(b"a", b"1")
+    multi = MultiplexedDatabase(db1, db2)
+    multi.save_many([(b"a", b"1"), (b"a", b"2")])
+    assert sorted(multi.fetch_many([b"a"])[b"a"]) == [b"1", b"2"]
+    assert sorted(ReadOnlyDatabase(multi).fetch_many([b"a"])[b"a"]) == [b"1", b"2"]
+
+    ReadOnlyDatabase(multi).delete_many([(b"a", b"1")])
+    assert set(db1.fetch(b"a")) == {b"1", b"2"}
+    multi.delete_many([(b"a", b"1")])
+    assert set(db1.fetch(b"a")) == set(db2.fetch(b"a")) == {b"2"}
+
+
+@skipif_emscripten
+def test_background_write_database_bulk_methods():
+    db = BackgroundWriteDatabase(InMemoryExampleDatabase())
+    db.save_many([(b"a", b"1"), (b"a", b"2")])
+    db.delete_many([(b"a", b"1")])
+    db.flush()
+    assert db.fetch_many([b"a"]) == {b"a": [b"2"]}
+
+
 @skipif_threading
 def test_two_directory_databases_can_interact(tmp_path):
     db1 = DirectoryBasedExampleDatabase(tmp_path)
@@ -715,6 +769,13 @@ def test_database_listener_background_write():
     )
 
 
+def test_database_listener_sqlite():
+    _database_conforms_to_listener_api(
+        lambda path: SQLiteExampleDatabase(path / "examples.db", batch_size=3),
+        parent_settings=settings(max_examples=5, stateful_step_count=10),
+    )
+
+
 def test_can_remove_nonexistent_listener():
     db = InMemoryExampleDatabase()
     db.remove_listener(lambda event: event)
@@ -856,6 +917,7 @@ def test_deprecated_example_database_no_args():
     "db1, db2",
     [
         (DirectoryBasedExampleDatabase("a"), DirectoryBasedExampleDatabase("a")),
+        (SQLiteExampleDatabase("a"), SQLiteExampleDatabase("a")),
         (
             MultiplexedDatabase(
                 DirectoryBasedExampleDatabase("a"), DirectoryBasedExampleDatabase("b")
@@ -885,6 +947,7 @@ def test_database_equal(db1, db2):
         (InMemoryExampleDatabase(), DirectoryBasedExampleDatabase("a")),
         (BackgroundWriteDatabase(InMemoryExampleDatabase()), InMemoryExampleDatabase()),
         (DirectoryBasedExampleDatabase("a"), DirectoryBasedExampleDatabase("b")),
+        (SQLiteExampleDatabase("a"), DirectoryBasedExampleDatabase("a")),
         (
             ReadOnlyDatabase(DirectoryBasedExampleDatabase("a")),
             ReadOnlyDatabase(DirectoryBasedExampleDatabase("b")),
@@ -914,3 +977,125 @@ def test_directory_db_removes_empty_dirs(tmp_path):
     db.delete(b"k1", b"v2")
     assert not db._key_path(b"k1").exists()
     assert set(db.fetch(db._metakeys_name)) == set()
+
+
+def test_sqlite_db_batches_writes(tmp_path):
+    db = SQLiteExampleDatabase(tmp_path / "examples.db", batch_size=3)
+    other = SQLiteExampleDatabase(tmp_path / "examples.db")
+    db.save(b"k", b"v1")
+    db.save(b"k", b"v2")
+    # not yet committed, so not visible to other connections
+    assert set(other.fetch(b"k")) == set()
+    db.save(b"k", b"v3")
+    assert set(other.fetch(b"k")) == {b"v1", b"v2", b"v3"}
+
+    db.delete(b"k", b"v1")
+    assert set(other.fetch(b"k")) == {b"v1", b"v2", b"v3"}
+    db.flush()
+    assert set(other.fetch(b"k")) == {b"v2", b"v3"}
+
+
+def test_sqlite_db_keeps_writes_pending_if_commit_fails(tmp_path, monkeypatch):
+    def commit(conn, pending):
+        raise sqlite3.OperationalError("database is locked")
+
+    db = SQLiteExampleDatabase(tmp_path / "examples.db", batch_size=1)
+    with monkeypatch.context() as m:
+        m.setattr(SQLiteExampleDatabase, "_commit", staticmethod(commit))
+        db.save(b"k", b"v")
+        db.flush()
+    db.flush()
+    assert set(SQLiteExampleDatabase(tmp_path / "examples.db").fetch(b"k")) == {b"v"}
+
+
+def test_sqlite_db_is_hashable():
+    assert hash(SQLiteExampleDatabase("a")) == hash(SQLiteExampleDatabase("a"))
+
+
+def test_sqlite_db_save_then_delete_before_commit(tmp_path):
+    db = SQLiteExampleDatabase(tmp_path / "examples.db")
+    db.save(b"k", b"v")
+    db.delete(b"k", b"v")
+    db.move(b"k", b"k2", b"v2")
+    assert set(db.fetch(b"k")) == set()
+    assert set(db.fetch(b"k2")) == {b"v2"}
+
+
+@skipif_threading  # race in tmp_path
+def test_sqlite_db_migrates_directory_db(tmp_path):
+    source = DirectoryBasedExampleDatabase(tmp_path / "examples")
+    source.save(b"k1", b"v1")
+    source.save(b"k1", b"v2")
+    source.save(b"k2", b"v3")
+
+    db = SQLiteExampleDatabase(tmp_path / "examples.db")
+    assert db.migrate_directory(tmp_path / "examples") == 3
+    assert set(db.fetch(b"k1")) == {b"v1", b"v2"}
+    assert set(db.fetch(b"k2")) == {b"v3"}
+    assert set(db.fetch(source._metakeys_name)) == set()
+
+
+@skipif_threading  # race in tmp_path
+def test_directory_db_bulk_methods_maintain_metakeys(tmp_path):
+    db = DirectoryBasedExampleDatabase(tmp_path)
+    db.save_many([(b"k1", b"v1"), (b"k1", b"v2"), (b"k2", b"v3")])
+    assert set(db.fetch(db._metakeys_name)) == {b"k1", b"k2"}
+
+    db.delete_many([(b"k1", b"v1"), (b"k2", b"v3")])
+    assert db._key_path(b"k1").exists()
+    assert not db._key_path(b"k2").exists()
+    assert set(db.fetch(db._metakeys_name)) == {b"k1"}
+
+
+@pytest.mark.skipif(WINDOWS, reason="uses fork")
+def test_remote_database_shares_writes_between_processes(tmp_path):
+    server = _DatabaseServer(InMemoryExampleDatabase())
+    db = _RemoteDatabase(server.address, server.authkey)
+    db.save(b"key", b"parent")
+    ctx = multiprocessing.get_context("fork")
+    p = ctx.Process(target=db.save, args=(b"key", b"child"))
+    p.start()
+    p.join()
+    assert p.exitcode == 0
+    assert sorted(db.fetch(b"key")) == [b"child", b"parent"]
+    assert sorted(server.db.fetch(b"key")) == [b"child", b"parent"]
+    server.close()
+
+
+def test_remote_database_reports_errors():
+    class BrokenDatabase(InMemoryExampleDatabase):
+        def save(self, key, value):
+            raise ValueError("oops")
+
+    server = _DatabaseServer(BrokenDatabase())
+    db = _RemoteDatabase(server.address, server.authkey)
+    with pytest.raises(HypothesisException, match="ValueError: oops"):
+        db.save(b"key", b"value")
+    # the connection is still usable afterwards
+    assert list(db.fetch(b"key")) == []
+    server.close()
+
+
+def test_remote_database_forwards_flush(tmp_path):
+    server = _DatabaseServer(SQLiteExampleDatabase(tmp_path / "examples.db"))
+    db = _RemoteDatabase(server.address, server.authkey)
+    db.save(b"key", b"value")
+    db.flush()
+    # a second connection to the same file sees the flushed write
+    assert list(SQLiteExampleDatabase(tmp_path / "examples.db").fetch(b"key")) == [
+        b"value"
+    ]
+    server.close()
+
+
+def test_default_database_is_shared_if_served(monkeypatch):
+    server = _DatabaseServer(InMemoryExampleDatabase())
+    monkeypatch.setattr(
+        _hypothesis_globals, "shared_database", (server.address, server.authkey)
+    )
+    db = _db_for_path(not_set)
+    assert isinstance(db, _RemoteDatabase)
+    assert db is _db_for_path(not_set)
+    db.save(b"key", b"value")
+    assert list(server.db.fetch(b"key")) == [b"value"]
+    server.close()
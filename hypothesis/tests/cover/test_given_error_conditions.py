@@ -99,19 +99,6 @@ def test_given_is_not_a_class_decorator():
             pass
 
 
-def test_specific_error_for_coroutine_functions():
-    @settings(database=None)
-    @given(booleans())
-    async def foo(x):
-        pass
-
-    with pytest.raises(
-        InvalidArgument,
-        match="Hypothesis doesn't know how to run async test functions",
-    ):
-        foo()
-
-
 @pytest.mark.parametrize("setting_name", all_settings)
 def test_suggests_at_settings_if_extra_kwarg_matches_setting_name(setting_name):
     val = 1
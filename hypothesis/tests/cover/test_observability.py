@@ -17,6 +17,7 @@ import threading
 import warnings
 from collections import defaultdict
 from contextlib import nullcontext
+from random import Random
 
 import pytest
 
@@ -33,6 +34,7 @@ from hypothesis import (
     target,
 )
 from hypothesis.database import InMemoryExampleDatabase
+from hypothesis.errors import HypothesisWarning, InvalidArgument
 from hypothesis.internal.compat import PYPY
 from hypothesis.internal.conjecture.choice import ChoiceNode, choices_key
 from hypothesis.internal.conjecture.data import Span
@@ -42,13 +44,19 @@ from hypothesis.internal.intervalsets import IntervalSet
 from hypothesis.internal.observability import (
     TESTCASE_CALLBACKS,
     InfoObservation,
+    ObservationSummary,
     TestCaseObservation,
     _callbacks,
     _callbacks_all_threads,
+    _ObservationWriter,
+    _sample_size_from_environ,
+    _to_binary_jsonable,
+    encode_observations,
     add_observability_callback,
     choices_to_json,
     nodes_to_json,
     observability_enabled,
+    read_observations,
     remove_observability_callback,
     with_observability_callback,
 )
@@ -95,8 +103,17 @@ def test_observability():
             do_it_all()
 
     infos = [t for t in ls if t.type == "info"]
-    assert len(infos) == 2
-    assert {t.title for t in infos} == {"Hypothesis Statistics"}
+    assert [t.title for t in infos].count("Hypothesis Statistics") == 2
+    assert {t.title for t in infos} == {
+        "Hypothesis Statistics",
+        "Hypothesis Shrink Pass Statistics",
+    }
+    for t in infos:
+        if t.title == "Hypothesis Shrink Pass Statistics":
+            assert all(
+                stats["test-runtime"] <= stats["runtime"]
+                for stats in t.content.values()
+            )
 
     testcases = [t for t in ls if t.type == "test_case"]
     assert len(testcases) > 50
@@ -809,3 +826,205 @@ def test_all_threads_callback():
 
     assert len(calls) == n_threads
     assert all(count == (settings().max_examples + 1) for count in calls.values())
+
+
+def _observations():
+    with capture_observations() as observations:
+
+        @given(st.integers())
+        def f(n):
+            event("n", n % 2)
+
+        f()
+    return observations
+
+
+def test_writes_observations_to_files(tmp_path):
+    observations = _observations()
+    writer = _ObservationWriter(tmp_path)
+    for observation in observations:
+        writer.write(observation)
+    writer.flush()
+
+    written = defaultdict(list)
+    for p in tmp_path.iterdir():
+        kind = p.stem.split("_")[1]
+        written[kind] = [json.loads(line) for line in p.read_text().splitlines()]
+    assert len(written["testcases"]) == sum(o.type == "test_case" for o in observations)
+    assert len(written["info"]) == sum(o.type != "test_case" for o in observations)
+    writer.close()
+
+
+def test_writer_can_write_after_closing(tmp_path):
+    (observation, *_) = _observations()
+    writer = _ObservationWriter(tmp_path)
+    writer.write(observation)
+    writer.close()
+    writer.write(observation)
+    writer.close()
+    (p,) = tmp_path.iterdir()
+    assert len(p.read_text().splitlines()) == 2
+
+
+def test_writer_survives_write_errors(tmp_path):
+    (observation, *_) = _observations()
+    failures = 1
+
+    class FailingWriter(_ObservationWriter):
+        def _write_pending(self):
+            nonlocal failures
+            if failures:
+                failures -= 1
+                raise OSError("disk full")
+            super()._write_pending()
+
+    writer = FailingWriter(tmp_path)
+    writer.write(observation)
+    with pytest.warns(HypothesisWarning, match="disk full"):
+        writer.flush()
+    assert writer.dropped == 1
+    writer.write(observation)
+    writer.close()
+    (p,) = tmp_path.iterdir()
+    assert len(p.read_text().splitlines()) == 1
+
+
+def test_writer_waits_for_closing_thread_before_restarting(tmp_path):
+    (observation, *_) = _observations()
+    writer = _ObservationWriter(tmp_path)
+    writer.write(observation)
+    thread = writer._thread
+    writer.close()
+    writer.write(observation)
+    assert not thread.is_alive()
+    writer.close()
+
+
+def test_writer_drops_observations_when_full(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        hypothesis.internal.observability, "OBSERVABILITY_QUEUE_SIZE", 1
+    )
+    monkeypatch.setattr(
+        hypothesis.internal.observability, "OBSERVABILITY_QUEUE_FULL", "drop"
+    )
+    started = threading.Event()
+
+    class SlowWriter(_ObservationWriter):
+        def _run(self, queue):
+            started.wait()
+            super()._run(queue)
+
+    (observation, *_) = _observations()
+    writer = SlowWriter(tmp_path)
+    for _ in range(3):
+        writer.write(observation)
+    assert writer.dropped == 2
+    started.set()
+    writer.close()
+    (p,) = tmp_path.iterdir()
+    assert len(p.read_text().splitlines()) == 1
+
+
+def _as_json(observation):
+    return json.loads(json.dumps(to_jsonable(observation, avoid_realization=False)))
+
+
+@pytest.mark.parametrize("choices", [True, False])
+def test_binary_observations_read_as_json(tmp_path, choices):
+    with capture_observations(choices=choices) as observations:
+
+        @given(st.lists(st.integers() | st.text()), st.booleans())
+        def f(xs, b):
+            event("b", b)
+
+        f()
+
+    path = tmp_path / "observations.bin"
+    path.write_bytes(
+        encode_observations(_to_binary_jsonable(o) for o in observations[:10])
+        + encode_observations(_to_binary_jsonable(o) for o in observations[10:])
+    )
+    assert list(read_observations(path)) == [_as_json(o) for o in observations]
+
+
+def test_binary_observations_ignore_partial_blocks(tmp_path):
+    observations = _observations()
+    block = encode_observations(_to_binary_jsonable(o) for o in observations)
+    path = tmp_path / "observations.bin"
+    for partial in [block[:2], block[:5], block[:-1]]:
+        path.write_bytes(block + partial)
+        assert len(list(read_observations(path))) == len(observations)
+
+
+def test_writer_writes_binary_observations(tmp_path, monkeypatch):
+    monkeypatch.setattr(hypothesis.internal.observability, "OBSERVABILITY_BINARY", True)
+    observations = [o for o in _observations() if o.type == "test_case"]
+    writer = _ObservationWriter(tmp_path)
+    for observation in observations:
+        writer.write(observation)
+        # write several blocks
+        writer.flush()
+    writer.close()
+    (p,) = tmp_path.iterdir()
+    assert p.suffix == ".bin"
+    assert list(read_observations(p)) == [_as_json(o) for o in observations]
+
+
+def test_sampled_observability_summarises_test_cases(monkeypatch):
+    monkeypatch.setattr(hypothesis.internal.observability, "OBSERVABILITY_SAMPLE", 5)
+    with capture_observations() as observations:
+
+        @settings(max_examples=50, database=None)
+        @given(st.integers())
+        def f(n):
+            event("parity", n % 2)
+
+        f()
+
+    test_cases = [o for o in observations if o.type == "test_case"]
+    (summary,) = [
+        o
+        for o in observations
+        if o.type == "info" and o.title == "Hypothesis Test Case Summary"
+    ]
+    assert len(test_cases) == 5
+    assert all(o.representation.startswith("f(") for o in test_cases)
+    assert summary.content["test_cases"] == sum(summary.content["statuses"].values())
+    assert summary.content["statuses"]["passed"] == 50
+    assert sum(summary.content["features"]["parity"].values()) == 50
+    assert sum(summary.content["timing"]["execute:test"].values()) == 50
+
+
+def test_sampled_observability_observes_failures_in_full(monkeypatch):
+    monkeypatch.setattr(hypothesis.internal.observability, "OBSERVABILITY_SAMPLE", 0)
+    with capture_observations() as observations:
+
+        @settings(database=None)
+        @given(st.integers())
+        def f(n):
+            assert n < 10
+
+        with pytest.raises(AssertionError):
+            f()
+
+    (test_case,) = [o for o in observations if o.type == "test_case"]
+    assert test_case.status == "failed"
+    assert test_case.representation == "f(\n    n=10,\n)"
+
+
+@pytest.mark.parametrize("value", ["", "many", "-1"])
+def test_invalid_observability_sample_names_the_variable(monkeypatch, value):
+    monkeypatch.setenv("HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY_SAMPLE", value)
+    with pytest.raises(
+        InvalidArgument, match="HYPOTHESIS_EXPERIMENTAL_OBSERVABILITY_SAMPLE"
+    ):
+        _sample_size_from_environ()
+
+
+def test_observation_summary_samples_uniformly():
+    summary = ObservationSummary(10, random=Random(0))
+    sampled = [summary.should_sample() for _ in range(10)]
+    assert all(sampled)
+    assert summary.sample == []
+    sampled = [summary.should_sample() for _ in range(1000)]
+    assert 0 < sum(sampled) < 200
@@ -0,0 +1,101 @@
+# This file is part of Hypothesis, which may be found at
+# https://github.com/HypothesisWorks/hypothesis/
+#
+# Copyright the Hypothesis Authors.
+# Individual contributors are listed in AUTHORS.rst and the git log.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+import tempfile
+
+import pytest
+
+from hypothesis import configuration, settings
+from hypothesis.internal import charmap as cm, persistent_cache
+from hypothesis.internal.persistent_cache import PersistentCache
+
+# these tests change the global storage directory
+pytestmark = pytest.mark.skipif(
+    settings.get_current_profile_name() == "threading", reason="not thread safe"
+)
+
+
+@pytest.fixture(autouse=True)
+def home_dir(tmp_path):
+    previous = configuration.storage_directory().path
+    configuration.set_hypothesis_home_dir(tmp_path)
+    yield tmp_path
+    configuration.set_hypothesis_home_dir(previous)
+
+
+def test_entries_are_shared_between_instances_after_save():
+    cache = PersistentCache("test")
+    assert cache.get("a") is None
+    cache["a"] = [1, 2]
+    cache.save()
+    assert PersistentCache("test").get("a") == [1, 2]
+
+
+def test_save_merges_entries_from_other_processes():
+    first = PersistentCache("test")
+    second = PersistentCache("test")
+    assert first.get("a") is None
+    assert second.get("b") is None
+    first["a"] = 1
+    second["b"] = 2
+    first.save()
+    second.save()
+    fresh = PersistentCache("test")
+    assert (fresh.get("a"), fresh.get("b")) == (1, 2)
+
+
+def test_keeps_most_recent_entries():
+    cache = PersistentCache("test", max_size=3)
+    for i in range(5):
+        cache[str(i)] = i
+    cache.save()
+    fresh = PersistentCache("test")
+    assert [fresh.get(str(i)) for i in range(5)] == [None, None, 2, 3, 4]
+
+
+def test_ignores_corrupt_file(home_dir):
+    cache = PersistentCache("test")
+    cache["a"] = 1
+    cache.save()
+    (path,) = (home_dir / "strategy_cache").glob("*/test.json")
+    path.write_text("{not json")
+    assert PersistentCache("test").get("a") is None
+
+
+def test_error_writing_file_is_suppressed(monkeypatch):
+    def broken_mkstemp(dir):
+        raise RuntimeError
+
+    monkeypatch.setattr(tempfile, "mkstemp", broken_mkstemp)
+    cache = PersistentCache("test")
+    cache["a"] = 1
+    cache.save()
+    assert PersistentCache("test").get("a") is None
+
+
+def test_can_disable_persistent_cache(monkeypatch):
+    monkeypatch.setattr(persistent_cache, "PERSISTENT_STRATEGY_CACHE", False)
+    cache = PersistentCache("test")
+    cache["a"] = 1
+    cache.save()
+    assert cache.get("a") is None
+
+
+def test_charmap_query_is_read_from_persistent_cache(monkeypatch):
+    cache = PersistentCache("charmap-query-test")
+    monkeypatch.setattr(cm, "persistent_query_cache", cache)
+    monkeypatch.setattr(cm, "limited_category_index_cache", {})
+    expected = cm.query(categories=["Nd"], max_codepoint=1000)
+    cache.save()
+
+    monkeypatch.setattr(cm, "persistent_query_cache", PersistentCache(cache.name))
+    monkeypatch.setattr(cm, "limited_category_index_cache", {})
+    monkeypatch.setattr(cm, "_query_for_key", None)  # would fail if called
+    assert cm.query(categories=["Nd"], max_codepoint=1000) == expected
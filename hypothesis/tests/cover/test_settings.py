@@ -458,6 +458,12 @@ def test_derandomise_with_explicit_database_is_invalid():
         {"deadline": True},
         {"deadline": False},
         {"backend": "nonexistent_backend"},
+        {"workers": 0},
+        {"workers": 2.5},
+        {"shrink_time_budget": 0},
+        {"shrink_time_budget": True},
+        {"shrink_time_budget": "60"},
+        {"shrink_time_budget": 1e300},
         {"suppress_health_check": ["nonexistent_healthcheck"]},
         {"phases": ["nonexistent_phase"]},
         {"phases": 0},
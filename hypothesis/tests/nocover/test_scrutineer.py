@@ -19,6 +19,7 @@ import pytest
 from hypothesis import Phase, given, note, settings, strategies as st
 from hypothesis.internal import scrutineer
 from hypothesis.internal.compat import PYPY
+from hypothesis.internal.conjecture import engine as engine_module
 from hypothesis.internal.scrutineer import (
     EXPLANATION_STUB,
     explanatory_lines,
@@ -109,6 +110,16 @@ def test_no_explanations_if_deadline_exceeded(code, testdir):
     assert "Explanation:" not in pytest_stdout
 
 
+@skipif_threading  # runpytest_inprocess is not thread safe
+@pytest.mark.parametrize("code", FRAGMENTS)
+def test_coverage_guidance_does_not_add_explanations(code, testdir, monkeypatch):
+    # tracing branches to guide generation must not leak into explain traces
+    monkeypatch.setattr(engine_module, "COVERAGE_GUIDED", True)
+    prelude = PRELUDE.replace("tuple(Phase)", "[Phase.generate, Phase.shrink]")
+    pytest_stdout, _ = get_reports(prelude + code, testdir=testdir)
+    assert "Explanation:" not in pytest_stdout
+
+
 NO_SHOW_CONTEXTLIB = """
 from contextlib import contextmanager
 from hypothesis import given, strategies as st, Phase, settings
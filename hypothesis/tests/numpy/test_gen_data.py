@@ -8,9 +8,11 @@
 # v. 2.0. If a copy of the MPL was not distributed with this file, You can
 # obtain one at https://mozilla.org/MPL/2.0/.
 
+import copy
 import sys
 from functools import reduce
 from itertools import zip_longest
+from random import Random
 
 import numpy as np
 import pytest
@@ -25,8 +27,10 @@ from hypothesis import (
     strategies as st,
     target,
 )
+from hypothesis.control import BuildContext
 from hypothesis.errors import InvalidArgument, UnsatisfiedAssumption
 from hypothesis.extra import numpy as nps
+from hypothesis.internal.conjecture.data import ConjectureData
 from hypothesis.strategies._internal.lazy import unwrap_strategies
 
 from tests.common.debug import (
@@ -36,6 +40,7 @@ from tests.common.debug import (
     minimal,
 )
 from tests.common.utils import fails_with, flaky
+from tests.conjecture.common import fresh_data
 
 ANY_SHAPE = nps.array_shapes(min_dims=0, max_dims=32, min_side=0, max_side=32)
 ANY_NONZERO_SHAPE = nps.array_shapes(min_dims=0, max_dims=32, min_side=1, max_side=32)
@@ -453,6 +458,55 @@ def test_unique_array_without_fill(arr):
     assume(len(set(arr)) == arr.size)
 
 
+@pytest.mark.parametrize("dtype", ["bool", "int8", "uint64", "float64"])
+def test_dense_primitive_arrays_draw_same_choices_as_elementwise(dtype):
+    batched = nps.arrays(dtype, 50, fill=st.nothing())
+    elementwise = nps.arrays(
+        dtype,
+        50,
+        elements=nps.from_dtype(np.dtype(dtype)).map(lambda x: [x][0]),
+        fill=st.nothing(),
+    )
+    assert unwrap_strategies(batched)._primitive_elements is not None
+    assert unwrap_strategies(elementwise)._primitive_elements is None
+    for seed in range(10):
+        data = fresh_data(random=Random(seed))
+        arr = data.draw(batched)
+        replay = ConjectureData.for_choices(data.choices)
+        with BuildContext(replay, wrapped_test=lambda: None):
+            np.testing.assert_array_equal(replay.draw(elementwise), arr)
+
+
+@pytest.mark.parametrize("dtype", ["bool", "int8", "float64"])
+def test_dense_primitive_arrays_have_same_spans_as_elementwise(dtype):
+    batched = unwrap_strategies(nps.arrays(dtype, 10, fill=st.nothing()))
+    elementwise = copy.copy(batched)
+    elementwise._primitive_elements = None
+    data = fresh_data(random=Random(0))
+    data.draw(batched)
+    data.freeze()
+    replay = ConjectureData.for_choices(data.choices)
+    replay.draw(elementwise)
+    replay.freeze()
+    assert [(s.label, s.start, s.end, s.depth) for s in data.spans] == [
+        (s.label, s.start, s.end, s.depth) for s in replay.spans
+    ]
+
+
+@pytest.mark.parametrize(
+    "elements",
+    [
+        st.floats().map(float),
+        nps.from_dtype(np.dtype("float32")),
+        nps.from_dtype(np.dtype("int8")).map(np.int16),
+        st.integers(),
+    ],
+)
+def test_only_elements_which_fit_use_primitive_draws(elements):
+    strategy = nps.arrays("int64", 10, elements=elements, fill=st.nothing())
+    assert unwrap_strategies(strategy)._primitive_elements is None
+
+
 @given(ndim=st.integers(0, 5), data=st.data())
 def test_mapped_positive_axes_are_unique(ndim, data):
     min_size = data.draw(st.integers(0, ndim), label="min_size")
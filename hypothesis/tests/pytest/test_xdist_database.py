@@ -0,0 +1,64 @@
+# This file is part of Hypothesis, which may be found at
+# https://github.com/HypothesisWorks/hypothesis/
+#
+# Copyright the Hypothesis Authors.
+# Individual contributors are listed in AUTHORS.rst and the git log.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public License,
+# v. 2.0. If a copy of the MPL was not distributed with this file, You can
+# obtain one at https://mozilla.org/MPL/2.0/.
+
+from types import SimpleNamespace
+
+import pytest
+
+import _hypothesis_globals
+import _hypothesis_pytestplugin as plugin
+from hypothesis.database import _RemoteDatabase, _db_for_path
+from hypothesis.utils.conventions import not_set
+
+
+def _node(controller, spec):
+    # execnet's XSpec returns None for any key which isn't in the spec
+    gateway = SimpleNamespace(spec=SimpleNamespace(popen=None, via=None))
+    for part in spec.split("//"):
+        key, _, value = part.partition("=")
+        setattr(gateway.spec, key, value or True)
+    return SimpleNamespace(config=controller, workerinput={}, gateway=gateway)
+
+
+def test_xdist_workers_share_the_controllers_database(monkeypatch):
+    # We don't depend on pytest-xdist, so we call its hooks by hand: the
+    # controller configures each worker node, and each worker then runs
+    # pytest_configure with the workerinput the controller set.
+    monkeypatch.setattr(_hypothesis_globals, "shared_database", None)
+    controller = SimpleNamespace()
+    nodes = [_node(controller, "popen") for _ in range(2)]
+    for node in nodes:
+        plugin.pytest_configure_node(node)
+    server = controller._hypothesis_database_server
+    try:
+        assert nodes[0].workerinput == nodes[1].workerinput
+
+        worker = SimpleNamespace(
+            workerinput=nodes[0].workerinput,
+            addinivalue_line=lambda *args: None,
+            getoption=lambda *args: None,
+        )
+        plugin.pytest_configure(worker)
+        db = _db_for_path(not_set)
+        assert isinstance(db, _RemoteDatabase)
+        assert db.address == server.address
+    finally:
+        plugin.pytest_unconfigure(controller)
+
+
+@pytest.mark.parametrize(
+    "spec", ["ssh=example.com", "socket=192.168.1.2:8888", "popen//via=ssh"]
+)
+def test_remote_xdist_workers_open_the_database_themselves(spec):
+    controller = SimpleNamespace()
+    node = _node(controller, spec)
+    plugin.pytest_configure_node(node)
+    assert node.workerinput == {}
+    assert not hasattr(controller, "_hypothesis_database_server")
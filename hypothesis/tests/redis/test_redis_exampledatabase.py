@@ -16,6 +16,7 @@ from fakeredis import FakeRedis
 from hypothesis import settings, strategies as st
 from hypothesis.database import InMemoryExampleDatabase
 from hypothesis.errors import InvalidArgument
+from hypothesis.extra import redis as redis_module
 from hypothesis.extra.redis import RedisExampleDatabase
 from hypothesis.stateful import Bundle, RuleBasedStateMachine, rule
 
@@ -29,6 +30,8 @@ from tests.cover.test_database_backend import _database_conforms_to_listener_api
         {"redis": FakeRedis(), "expire_after": 10},  # not a timedelta
         {"redis": FakeRedis(), "key_prefix": "not a bytestring"},
         {"redis": FakeRedis(), "listener_channel": 2},  # not a str
+        {"redis": FakeRedis(), "batch_size": 0.5},  # not an int
+        {"redis": FakeRedis(), "batch_size": 0},
     ],
 )
 def test_invalid_args_raise(kw):
@@ -80,6 +83,25 @@ class DatabaseComparison(RuleBasedStateMachine):
         for db in self.dbs:
             db.move(k1, k2, v)
 
+    @rule(items=st.lists(st.tuples(keys, values)))
+    def save_many(self, items):
+        for db in self.dbs:
+            db.save_many(items)
+
+    @rule(items=st.lists(st.tuples(keys, values)))
+    def delete_many(self, items):
+        for db in self.dbs:
+            db.delete_many(items)
+
+    @rule(ks=st.lists(keys))
+    def fetch_many_agrees(self, ks):
+        last = None
+        for db in self.dbs:
+            result = {k: set(vs) for k, vs in db.fetch_many(ks).items()}
+            if last is not None:
+                assert last == result, db
+            last = result
+
     @rule(k=keys)
     def values_agree(self, k):
         last = None
@@ -96,6 +118,8 @@ TestDBs = DatabaseComparison.TestCase
 
 
 def flush_messages(db):
+    # send any buffered writes, so that their change events get published.
+    db.flush()
     # fake redis doesn't have the background polling for pubsub that an actual
     # redis server does, so we have to flush when we want them.
     if db._pubsub is None:
@@ -177,6 +201,43 @@ def test_redis_move_to_same_key():
     assert list(db.fetch(b"a")) == [b"x"]
 
 
+def test_redis_buffers_writes_until_flush():
+    redis = FakeRedis()
+    db = RedisExampleDatabase(redis, batch_size=4)
+    other = RedisExampleDatabase(redis)
+    db.save(b"a", b"x")
+    db.move(b"a", b"b", b"x")
+    assert list(other.fetch(b"a")) == list(other.fetch(b"b")) == []
+    # the move counts as two writes, which reaches our batch size
+    db.save(b"a", b"y")
+    assert list(other.fetch(b"a")) == [b"y"]
+    assert list(other.fetch(b"b")) == [b"x"]
+
+    db.delete(b"b", b"x")
+    assert list(other.fetch(b"b")) == [b"x"]
+    db.flush()
+    assert list(other.fetch(b"b")) == []
+
+
+def test_redis_flushes_pending_writes_at_exit():
+    redis = FakeRedis()
+    db = RedisExampleDatabase(redis)
+    other = RedisExampleDatabase(redis)
+    db.save(b"a", b"x")
+    assert list(other.fetch(b"a")) == []
+    redis_module._flush_all()
+    assert list(other.fetch(b"a")) == [b"x"]
+    assert id(db) not in redis_module._unflushed
+
+
+def test_redis_fetch_sees_own_buffered_writes():
+    db = RedisExampleDatabase(FakeRedis())
+    db.save(b"a", b"x")
+    assert list(db.fetch(b"a")) == [b"x"]
+    db.delete(b"a", b"x")
+    assert db.fetch_many([b"a"]) == {b"a": []}
+
+
 def test_redis_equality():
     redis = FakeRedis()
     assert RedisExampleDatabase(redis) == RedisExampleDatabase(redis)